@@ -13,7 +13,7 @@ from datetime import datetime
 from src.data_fetch import fetch_yield_data, load_yield_data
 from src.preprocessing import preprocess_yield_data
 from src.pca_analysis import compute_pca_results
-from src.visualizations import plot_pca_loadings, plot_component_scores
+from src.model import data_fingerprint, load_model
 
 # Page config
 st.set_page_config(
@@ -22,6 +22,153 @@ st.set_page_config(
     layout="wide"
 )
 
+
+# Cached computations. Streamlit reruns this script on every widget
+# interaction, so data, PCA results and figures are cached keyed by the data
+# fingerprint and parameters; heavy objects are passed with a leading
+# underscore so Streamlit does not hash them.
+N_COMPONENTS = 3
+# Options the app fits with; a saved model is only reused if it matches all of them
+FIT_OPTIONS = {'handle_missing': 'forward_fill', 'standardize': 'demean', 'max_gap': None,
+               'solver': 'sklearn', 'reference': None}
+
+
+@st.cache_data(show_spinner=False)
+def cached_load_data(path: str, mtime: float) -> pd.DataFrame:
+    """Load yield data; `mtime` invalidates the cache when the file changes."""
+    return load_yield_data(path)
+
+
+@st.cache_data(show_spinner=False, ttl=3600)
+def cached_fetch_data(api_key: str, start_date: str, end_date: str) -> pd.DataFrame:
+    """Fetch yield data from FRED, reusing results for an hour."""
+    return fetch_yield_data(api_key, start_date, end_date)
+
+
+@st.cache_resource(show_spinner=False)
+def cached_model(path: str, mtime: float):
+    """Load a saved model artefact."""
+    return load_model(path)
+
+
+@st.cache_resource(show_spinner=False)
+def cached_pca_results(fingerprint: str, _df_raw: pd.DataFrame, n_components: int,
+                       model_file: str = None, model_mtime: float = None) -> dict:
+    """Preprocess and fit PCA, or reuse a saved model fitted on the same data and options."""
+    if model_file is not None:
+        model = cached_model(model_file, model_mtime)
+        if (model.fingerprint == fingerprint and model.loadings.shape[1] == n_components
+                and model.fit_options == FIT_OPTIONS):
+            return model.results(_df_raw)
+    df_processed, means, stds = preprocess_yield_data(
+        _df_raw, handle_missing=FIT_OPTIONS['handle_missing'],
+        standardize=FIT_OPTIONS['standardize'], max_gap=FIT_OPTIONS['max_gap']
+    )
+    return compute_pca_results(df_processed, n_components=n_components,
+                               solver=FIT_OPTIONS['solver'])
+
+
+@st.cache_resource(show_spinner=False)
+def variance_figure(fingerprint: str, n_components: int, _pca_results: dict):
+    """Bar chart of explained variance."""
+    fig, ax = plt.subplots(figsize=(8, 5))
+    components = [f'PC{i+1}' for i in range(len(_pca_results['explained_variance']))]
+    variance = _pca_results['explained_variance'] * 100
+    
+    x = np.arange(len(components))
+    bars = ax.bar(x, variance, alpha=0.8, color='steelblue')
+    ax.set_xlabel('Principal Component')
+    ax.set_ylabel('Explained Variance (%)')
+    ax.set_title('Explained Variance by Component')
+    ax.set_xticks(x)
+    ax.set_xticklabels(components)
+    ax.grid(axis='y', alpha=0.3)
+    
+    for bar, var in zip(bars, variance):
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height,
+               f'{var:.1f}%', ha='center', va='bottom')
+    return fig
+
+
+@st.cache_resource(show_spinner=False)
+def loadings_figure(fingerprint: str, n_components: int, selected_component: str, _pca_results: dict):
+    """Line plot of loadings highlighting the selected component."""
+    fig, ax = plt.subplots(figsize=(12, 6))
+    
+    maturity_map = {'1M': 1, '3M': 3, '6M': 6, '1Y': 12, '2Y': 24, '3Y': 36,
+                   '5Y': 60, '7Y': 84, '10Y': 120, '20Y': 240, '30Y': 360}
+    maturities_numeric = [maturity_map.get(m, i) for i, m in enumerate(_pca_results['loadings'].index)]
+    
+    colors = ['steelblue', 'crimson', 'forestgreen']
+    component_idx = int(selected_component[2]) - 1
+    
+    for i, col in enumerate(_pca_results['loadings'].columns):
+        if col == selected_component or i <= component_idx:
+            alpha = 1.0 if col == selected_component else 0.3
+            linewidth = 2.5 if col == selected_component else 1.5
+            ax.plot(maturities_numeric, _pca_results['loadings'][col].values,
+                   marker='o', linewidth=linewidth, markersize=8,
+                   label=col, color=colors[i % len(colors)], alpha=alpha)
+    
+    ax.axhline(y=0, color='black', linestyle='--', linewidth=0.8, alpha=0.5)
+    ax.set_xlabel('Maturity (months)', fontsize=12)
+    ax.set_ylabel('Loading', fontsize=12)
+    ax.set_title(f'PCA Loadings - {selected_component}', fontsize=14, fontweight='bold')
+    ax.legend(loc='best')
+    ax.grid(True, alpha=0.3)
+    ax.set_xticks(maturities_numeric)
+    ax.set_xticklabels(_pca_results['loadings'].index, rotation=45, ha='right')
+    return fig
+
+
+@st.cache_resource(show_spinner=False)
+def scores_figure(fingerprint: str, n_components: int, selected_component: str, _pca_results: dict):
+    """Time series of the selected component's scores."""
+    fig, ax = plt.subplots(figsize=(14, 6))
+    
+    colors = ['steelblue', 'crimson', 'forestgreen']
+    component_idx = int(selected_component[2]) - 1
+    scores = _pca_results['scores']
+    
+    ax.plot(scores.index, scores[selected_component].values,
+           linewidth=1.5, color=colors[component_idx % len(colors)], alpha=0.8)
+    ax.axhline(y=0, color='black', linestyle='--', linewidth=0.8, alpha=0.5)
+    ax.fill_between(scores.index, 0,
+                    scores[selected_component].values,
+                    alpha=0.2, color=colors[component_idx % len(colors)])
+    ax.set_xlabel('Date', fontsize=12)
+    ax.set_ylabel(f'{selected_component} Score', fontsize=12)
+    ax.set_title(f'{selected_component} Time Series', fontsize=14, fontweight='bold')
+    ax.grid(True, alpha=0.3)
+    ax.tick_params(axis='x', labelrotation=45)
+    return fig
+
+
+@st.cache_resource(show_spinner=False)
+def heatmap_figure(fingerprint: str, _df_raw: pd.DataFrame):
+    """Heatmap of the yield curve over time (monthly for long histories)."""
+    if len(_df_raw) > 500:
+        df_heatmap = _df_raw.resample('ME').last()
+    else:
+        df_heatmap = _df_raw
+    
+    fig, ax = plt.subplots(figsize=(14, 8))
+    sns.heatmap(df_heatmap.T, cmap='YlOrRd', cbar_kws={'label': 'Yield (%)'},
+               xticklabels=50, yticklabels=df_heatmap.columns, ax=ax)
+    ax.set_xlabel('Date', fontsize=12)
+    ax.set_ylabel('Maturity', fontsize=12)
+    ax.set_title('Yield Curve Over Time', fontsize=14, fontweight='bold')
+    return fig
+
+
+def store_data(df: pd.DataFrame, source: str) -> None:
+    """Keep loaded data in session state so it survives widget reruns."""
+    st.session_state['df_raw'] = df
+    st.session_state['fingerprint'] = data_fingerprint(df)
+    st.session_state['source'] = source
+
+
 # Title
 st.title("📈 U.S. Treasury Yield Curve PCA Analysis")
 st.markdown("""
@@ -38,20 +185,25 @@ data_source = st.sidebar.radio(
     ["Use Existing Data", "Fetch from FRED API"]
 )
 
-df_raw = None
-pca_results = None
+model_file = None
 
 if data_source == "Use Existing Data":
     data_file = st.sidebar.text_input(
         "Data File Path",
         value="data/yield_data.csv"
     )
+    model_file = st.sidebar.text_input(
+        "Model File Path",
+        value="data/pca_model.npz",
+        help="Saved model from the CLI; reused instead of refitting when it matches the data"
+    )
     
     if st.sidebar.button("Load Data"):
         try:
             if os.path.exists(data_file):
-                df_raw = load_yield_data(data_file)
-                st.sidebar.success(f"Loaded {len(df_raw)} observations")
+                df_loaded = cached_load_data(data_file, os.path.getmtime(data_file))
+                store_data(df_loaded, data_source)
+                st.sidebar.success(f"Loaded {len(df_loaded)} observations")
             else:
                 st.sidebar.error(f"File not found: {data_file}")
         except Exception as e:
@@ -74,17 +226,30 @@ else:
         else:
             try:
                 with st.spinner("Fetching data from FRED..."):
-                    df_raw = fetch_yield_data(api_key, start_date, end_date)
-                st.sidebar.success(f"Fetched {len(df_raw)} observations")
+                    df_fetched = cached_fetch_data(api_key, start_date, end_date)
+                store_data(df_fetched, data_source)
+                st.sidebar.success(f"Fetched {len(df_fetched)} observations")
             except Exception as e:
                 st.sidebar.error(f"Error fetching data: {e}")
 
 # Main content
+df_raw = st.session_state.get('df_raw')
+if df_raw is not None and st.session_state.get('source') != data_source:
+    df_raw = None
+
 if df_raw is not None:
-    # Preprocess and compute PCA
+    fingerprint = st.session_state['fingerprint']
+    
+    # Reuse the saved model when it was fitted on exactly this data
+    model_mtime = None
+    if model_file is not None and os.path.exists(model_file):
+        model_mtime = os.path.getmtime(model_file)
+    else:
+        model_file = None
+    
+    # Preprocess and compute PCA (cached per data fingerprint and parameters)
     with st.spinner("Computing PCA..."):
-        df_processed, means, stds = preprocess_yield_data(df_raw)
-        pca_results = compute_pca_results(df_processed, n_components=3)
+        pca_results = cached_pca_results(fingerprint, df_raw, N_COMPONENTS, model_file, model_mtime)
     
     # Tabs
     tab1, tab2, tab3, tab4 = st.tabs([
@@ -99,28 +264,13 @@ if df_raw is not None:
         
         col1, col2 = st.columns(2)
         
+        components = [f'PC{i+1}' for i in range(len(pca_results['explained_variance']))]
+        variance = pca_results['explained_variance'] * 100
+        cumulative = pca_results['cumulative_variance'] * 100
+        
         with col1:
             # Variance bar chart
-            fig, ax = plt.subplots(figsize=(8, 5))
-            components = [f'PC{i+1}' for i in range(len(pca_results['explained_variance']))]
-            variance = pca_results['explained_variance'] * 100
-            cumulative = pca_results['cumulative_variance'] * 100
-            
-            x = np.arange(len(components))
-            bars = ax.bar(x, variance, alpha=0.8, color='steelblue')
-            ax.set_xlabel('Principal Component')
-            ax.set_ylabel('Explained Variance (%)')
-            ax.set_title('Explained Variance by Component')
-            ax.set_xticks(x)
-            ax.set_xticklabels(components)
-            ax.grid(axis='y', alpha=0.3)
-            
-            for bar, var in zip(bars, variance):
-                height = bar.get_height()
-                ax.text(bar.get_x() + bar.get_width()/2., height,
-                       f'{var:.1f}%', ha='center', va='bottom')
-            
-            st.pyplot(fig)
+            st.pyplot(variance_figure(fingerprint, N_COMPONENTS, pca_results))
         
         with col2:
             # Summary table
@@ -160,33 +310,8 @@ if df_raw is not None:
         )
         
         # Plot loadings
-        fig, ax = plt.subplots(figsize=(12, 6))
-        
-        maturity_map = {'1M': 1, '3M': 3, '6M': 6, '1Y': 12, '2Y': 24, '3Y': 36,
-                       '5Y': 60, '7Y': 84, '10Y': 120, '20Y': 240, '30Y': 360}
-        maturities_numeric = [maturity_map.get(m, i) for i, m in enumerate(pca_results['loadings'].index)]
-        
-        colors = ['steelblue', 'crimson', 'forestgreen']
         component_idx = int(selected_component[2]) - 1
-        
-        for i, col in enumerate(pca_results['loadings'].columns):
-            if col == selected_component or i <= component_idx:
-                alpha = 1.0 if col == selected_component else 0.3
-                linewidth = 2.5 if col == selected_component else 1.5
-                ax.plot(maturities_numeric, pca_results['loadings'][col].values,
-                       marker='o', linewidth=linewidth, markersize=8,
-                       label=col, color=colors[i % len(colors)], alpha=alpha)
-        
-        ax.axhline(y=0, color='black', linestyle='--', linewidth=0.8, alpha=0.5)
-        ax.set_xlabel('Maturity (months)', fontsize=12)
-        ax.set_ylabel('Loading', fontsize=12)
-        ax.set_title(f'PCA Loadings - {selected_component}', fontsize=14, fontweight='bold')
-        ax.legend(loc='best')
-        ax.grid(True, alpha=0.3)
-        ax.set_xticks(maturities_numeric)
-        ax.set_xticklabels(pca_results['loadings'].index, rotation=45, ha='right')
-        
-        st.pyplot(fig)
+        st.pyplot(loadings_figure(fingerprint, N_COMPONENTS, selected_component, pca_results))
         
         # Interpretation
         interpretation = pca_results['interpretations'].get(selected_component, 'N/A')
@@ -210,24 +335,7 @@ if df_raw is not None:
         )
         
         # Plot time series
-        fig, ax = plt.subplots(figsize=(14, 6))
-        
-        colors = ['steelblue', 'crimson', 'forestgreen']
-        component_idx = int(selected_component[2]) - 1
-        
-        ax.plot(pca_results['scores'].index, pca_results['scores'][selected_component].values,
-               linewidth=1.5, color=colors[component_idx % len(colors)], alpha=0.8)
-        ax.axhline(y=0, color='black', linestyle='--', linewidth=0.8, alpha=0.5)
-        ax.fill_between(pca_results['scores'].index, 0,
-                        pca_results['scores'][selected_component].values,
-                        alpha=0.2, color=colors[component_idx % len(colors)])
-        ax.set_xlabel('Date', fontsize=12)
-        ax.set_ylabel(f'{selected_component} Score', fontsize=12)
-        ax.set_title(f'{selected_component} Time Series', fontsize=14, fontweight='bold')
-        ax.grid(True, alpha=0.3)
-        
-        plt.xticks(rotation=45)
-        st.pyplot(fig)
+        st.pyplot(scores_figure(fingerprint, N_COMPONENTS, selected_component, pca_results))
         
         # Statistics
         scores = pca_results['scores'][selected_component]
@@ -240,21 +348,10 @@ if df_raw is not None:
     with tab4:
         st.header("Yield Curve Heatmap")
         
-        # Resample if too many dates
         if len(df_raw) > 500:
-            df_heatmap = df_raw.resample('M').last()
             st.info("Data resampled to monthly frequency for visualization")
-        else:
-            df_heatmap = df_raw
-        
-        fig, ax = plt.subplots(figsize=(14, 8))
-        sns.heatmap(df_heatmap.T, cmap='YlOrRd', cbar_kws={'label': 'Yield (%)'},
-                   xticklabels=50, yticklabels=df_heatmap.columns, ax=ax)
-        ax.set_xlabel('Date', fontsize=12)
-        ax.set_ylabel('Maturity', fontsize=12)
-        ax.set_title('Yield Curve Over Time', fontsize=14, fontweight='bold')
         
-        st.pyplot(fig)
+        st.pyplot(heatmap_figure(fingerprint, df_raw))
 
 else:
     st.info("👈 Please configure data source in the sidebar to begin analysis.")
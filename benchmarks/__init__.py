@@ -0,0 +1 @@
+"""Performance benchmarks for yield curve PCA analysis."""
@@ -0,0 +1,102 @@
+"""
+Benchmark the sklearn and covariance-eigh PCA solvers across sample sizes.
+
+Usage:
+    python3 -m benchmarks.bench_pca_solvers --sizes 1000 10000 100000
+"""
+
+import argparse
+import time
+from typing import List
+import numpy as np
+import pandas as pd
+
+from src.pca_analysis import apply_pca
+
+MATURITIES = ['1M', '3M', '6M', '1Y', '2Y', '3Y', '5Y', '7Y', '10Y', '20Y', '30Y']
+
+
+def tenor_labels(n_maturities: int) -> List[str]:
+    """
+    Create `n_maturities` distinct tenor labels spread over 1M to 30Y.
+    
+    Labels use the '6M' / '10Y' form that `maturity_months` parses, so
+    panels wider than the FRED curve can still be interpreted.
+    """
+    if n_maturities > 360:
+        raise ValueError(f"At most 360 monthly tenors are available, got {n_maturities}")
+    months = np.rint(np.linspace(1, 360, n_maturities)).astype(int)
+    return [f'{m // 12}Y' if m % 12 == 0 else f'{m}M' for m in months]
+
+
+def synthetic_panel(n_dates: int, n_maturities: int = 11, seed: int = 0) -> pd.DataFrame:
+    """
+    Create a demeaned synthetic yield panel driven by level, slope and curvature.
+    
+    Parameters:
+    -----------
+    n_dates : int
+        Number of observations
+    n_maturities : int
+        Number of maturities (columns)
+    seed : int
+        Random seed
+    
+    Returns:
+    --------
+    pd.DataFrame
+        Synthetic panel (dates x maturities)
+    """
+    rng = np.random.default_rng(seed)
+    tenor = np.linspace(0, 1, n_maturities)
+    factors = np.cumsum(rng.normal(0, [0.05, 0.03, 0.02], size=(n_dates, 3)), axis=0)
+    shapes = np.vstack([np.ones(n_maturities), tenor - 0.5, (tenor - 0.5) ** 2 - 1 / 12])
+    values = factors @ shapes + rng.normal(0, 0.01, size=(n_dates, n_maturities))
+    columns = MATURITIES[:n_maturities] if n_maturities <= len(MATURITIES) else \
+        tenor_labels(n_maturities)
+    df = pd.DataFrame(values, index=pd.date_range('2000-01-03', periods=n_dates, freq='min'),
+                      columns=columns)
+    return df - df.mean()
+
+
+def time_call(func, repeat: int) -> float:
+    """Return the best wall time in seconds over `repeat` calls."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    """Run the solver benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description='Compare PCA solvers across sample sizes')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000, 1000000],
+                        help='Numbers of dates to benchmark')
+    parser.add_argument('--n-components', type=int, default=3,
+                        help='Number of PCA components (default: 3)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Repetitions per measurement; the best is reported (default: 5)')
+    args = parser.parse_args()
+    
+    rows = []
+    for n_dates in args.sizes:
+        df = synthetic_panel(n_dates)
+        timings = {
+            solver: time_call(lambda: apply_pca(df, n_components=args.n_components, solver=solver),
+                              args.repeat)
+            for solver in ('sklearn', 'eigh')
+        }
+        rows.append({
+            'n_dates': n_dates,
+            'sklearn_s': timings['sklearn'],
+            'eigh_s': timings['eigh'],
+            'speedup': timings['sklearn'] / timings['eigh'],
+        })
+    
+    print(pd.DataFrame(rows).to_string(index=False, float_format=lambda x: f'{x:.4f}'))
+
+
+if __name__ == '__main__':
+    main()
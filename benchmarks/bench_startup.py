@@ -0,0 +1,87 @@
+"""
+Benchmark CLI startup time and guard against import-time regressions.
+
+Usage:
+    python3 -m benchmarks.bench_startup --runs 10 --max-seconds 0.5
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def time_command(command: list, runs: int) -> list:
+    """
+    Time repeated runs of a command in fresh interpreters.
+    
+    Parameters:
+    -----------
+    command : list
+        Command and arguments
+    runs : int
+        Number of runs
+    
+    Returns:
+    --------
+    list
+        Wall times in seconds
+    """
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(command, cwd=ROOT, stdout=subprocess.DEVNULL, check=True)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def slowest_imports(module: str, top: int = 10) -> list:
+    """
+    Return the slowest cumulative imports reported by `python -X importtime`.
+    
+    Returns:
+    --------
+    list
+        (cumulative microseconds, module name) pairs, slowest first
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        rows.append((int(cumulative), name.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main():
+    """Run the startup benchmark."""
+    parser = argparse.ArgumentParser(description='Benchmark CLI startup time')
+    parser.add_argument('--runs', type=int, default=10,
+                        help='Number of timed runs (default: 10)')
+    parser.add_argument('--max-seconds', type=float, default=None,
+                        help='Exit with an error if the median `--help` time exceeds this')
+    args = parser.parse_args()
+    
+    baseline = statistics.median(time_command([sys.executable, '-c', 'pass'], args.runs))
+    help_time = statistics.median(time_command([sys.executable, '-m', 'src.cli', '--help'], args.runs))
+    
+    print(f"Interpreter startup:  {baseline * 1000:8.1f} ms")
+    print(f"src.cli --help:       {help_time * 1000:8.1f} ms")
+    print(f"CLI overhead:         {(help_time - baseline) * 1000:8.1f} ms")
+    print("\nSlowest imports for `import src.cli`:")
+    for cumulative, name in slowest_imports('src.cli'):
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+    
+    if args.max_seconds is not None and help_time > args.max_seconds:
+        print(f"\nFAIL: median startup {help_time:.3f}s exceeds {args.max_seconds:.3f}s")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
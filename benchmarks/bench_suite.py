@@ -0,0 +1,322 @@
+"""
+End-to-end benchmark suite for the yield curve PCA pipeline.
+
+Times fetching from a local stand-in FRED server, loading, preprocessing,
+PCA, component interpretation, every plot and a full CLI run on synthetic
+panels, records the peak traced memory of each stage, and appends the results
+to a JSON lines history file (benchmarks/history.jsonl by default, which is
+not tracked). With
+`--compare`, the run is checked against a baseline record and the script
+exits with an error when a stage regresses beyond the tolerance.
+
+Usage:
+    python3 -m benchmarks.bench_suite --dates 2000 20000 --label main
+    python3 -m benchmarks.bench_suite --compare --tolerance 0.25
+    python3 -m benchmarks.bench_suite --compare baseline.jsonl --baseline-label v1.0
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_pca_solvers import synthetic_panel
+from src import cli, visualizations
+from src.data_fetch import FRED_SERIES, fetch_yield_data, load_yield_data, save_yield_data
+from src.preprocessing import preprocess_yield_data
+from src.pca_analysis import apply_pca, compute_pca_results, interpret_components
+from src.testing import FakeFredHandler, fake_fred_server
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_HISTORY = os.path.join(ROOT, 'benchmarks', 'history.jsonl')
+
+
+def raw_panel(n_dates: int, n_maturities: int = 11, missing: float = 0.01, seed: int = 0) -> pd.DataFrame:
+    """
+    Create a synthetic raw yield panel with scattered missing values.
+    
+    Parameters:
+    -----------
+    n_dates : int
+        Number of observations
+    n_maturities : int
+        Number of maturities (columns)
+    missing : float
+        Fraction of values set to NaN
+    seed : int
+        Random seed
+    
+    Returns:
+    --------
+    pd.DataFrame
+        Raw panel (dates x maturities) with a 'Date' index
+    """
+    df = synthetic_panel(n_dates, n_maturities, seed=seed) + 3.0
+    rng = np.random.default_rng(seed + 1)
+    values = df.to_numpy(copy=True)
+    values[rng.random(values.shape) < missing] = np.nan
+    df = pd.DataFrame(values, index=df.index, columns=df.columns)
+    df.index.name = 'Date'
+    return df
+
+
+def measure(func: Callable, repeat: int) -> Dict[str, float]:
+    """
+    Time a call and record its peak traced memory.
+    
+    Timings are taken without tracing (best of `repeat` runs); one extra
+    run under `tracemalloc` measures the peak allocation.
+    
+    Returns:
+    --------
+    Dict[str, float]
+        'seconds' and 'peak_mb'
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'seconds': best, 'peak_mb': peak / 1024 ** 2}
+
+
+def run_cli(argv: List[str]) -> None:
+    """Run `src.cli.main` quietly with the given arguments."""
+    saved_argv = sys.argv
+    sys.argv = ['src.cli', '--quiet', *argv]
+    try:
+        cli.main()
+    finally:
+        sys.argv = saved_argv
+
+
+def benchmark_panel(n_dates: int, n_maturities: int, repeat: int, work_dir: str) -> List[Dict]:
+    """
+    Benchmark every pipeline stage on one synthetic panel size.
+    
+    Returns:
+    --------
+    List[Dict]
+        One result per stage
+    """
+    df_raw = raw_panel(n_dates, n_maturities)
+    paths = {ext: os.path.join(work_dir, f'yield_data.{ext}') for ext in ('csv', 'npy')}
+    for path in paths.values():
+        save_yield_data(df_raw, path)
+    df_processed, _, _ = preprocess_yield_data(df_raw)
+    pca_results = compute_pca_results(df_processed)
+    plot_path = os.path.join(work_dir, 'plot.png')
+    
+    stages = {
+        'load_yield_data[csv]': lambda: load_yield_data(paths['csv']),
+        'load_yield_data[npy]': lambda: load_yield_data(paths['npy']),
+        'preprocess_yield_data': lambda: preprocess_yield_data(df_raw),
+        'apply_pca[sklearn]': lambda: apply_pca(df_processed, solver='sklearn'),
+        'apply_pca[eigh]': lambda: apply_pca(df_processed, solver='eigh'),
+        'interpret_components': lambda: interpret_components(pca_results['loadings']),
+        'plot_explained_variance': lambda: visualizations.plot_explained_variance(
+            pca_results['explained_variance'], plot_path),
+        'plot_pca_loadings': lambda: visualizations.plot_pca_loadings(
+            pca_results['loadings'], plot_path),
+        'plot_component_scores': lambda: visualizations.plot_component_scores(
+            pca_results['scores'], plot_path),
+        'plot_yield_curve_heatmap': lambda: visualizations.plot_yield_curve_heatmap(
+            df_raw, plot_path),
+        'cli_main': lambda: run_cli([
+            '--data-file', paths['csv'], '--output-dir', os.path.join(work_dir, 'out'),
+            '--plots-dir', os.path.join(work_dir, 'plots'), '--no-cache', '--plot-workers', '1'
+        ]),
+    }
+    
+    results = []
+    for stage, func in stages.items():
+        measurement = measure(func, repeat)
+        results.append({'stage': stage, 'n_dates': n_dates, 'n_maturities': n_maturities,
+                        **measurement})
+        print(f"  {stage:<28} {measurement['seconds'] * 1000:10.1f} ms "
+              f"{measurement['peak_mb']:10.1f} MB")
+    return results
+
+
+def benchmark_fetch(n_dates: int, repeat: int, latency: float) -> List[Dict]:
+    """
+    Benchmark `fetch_yield_data` against the stand-in FRED server.
+    
+    The server answers every series request with `n_dates` daily
+    observations after `latency` seconds, so the timings show the cost of
+    request concurrency and XML parsing without network access. Its
+    allocations are traced together with the client's.
+    
+    Returns:
+    --------
+    List[Dict]
+        One result per worker count
+    """
+    dates = pd.date_range('1970-01-01', periods=n_dates, freq='D')
+    handler = type('BenchFredHandler', (FakeFredHandler,),
+                   {'delay': latency, 'dates': dates, 'requests': [], 'connections': set()})
+    
+    results = []
+    with fake_fred_server(handler) as base_url:
+        for workers in (1, 8):
+            stage = f'fetch_yield_data[workers={workers}]'
+            measurement = measure(lambda: fetch_yield_data('bench-key', max_workers=workers,
+                                                           base_url=base_url), repeat)
+            results.append({'stage': stage, 'n_dates': n_dates,
+                            'n_maturities': len(FRED_SERIES), **measurement})
+            print(f"  {stage:<28} {measurement['seconds'] * 1000:10.1f} ms "
+                  f"{measurement['peak_mb']:10.1f} MB")
+    return results
+
+
+def git_commit() -> Optional[str]:
+    """Return the current git commit, or None outside a repository."""
+    try:
+        result = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=ROOT, capture_output=True,
+                                text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def load_history(path: str) -> List[Dict]:
+    """Read all records of a JSON lines history file."""
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def compare(record: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """
+    Compare a run against a baseline record.
+    
+    Parameters:
+    -----------
+    record : Dict
+        Current run
+    baseline : Dict
+        Baseline run
+    tolerance : float
+        Allowed relative increase of time or peak memory
+    
+    Returns:
+    --------
+    List[str]
+        Descriptions of the stages that regressed
+    """
+    reference = {(r['stage'], r['n_dates'], r['n_maturities']): r for r in baseline['results']}
+    regressions = []
+    print(f"\nComparison with baseline {baseline.get('label') or baseline['timestamp']}:")
+    print(f"  {'stage':<28} {'dates':>8} {'time':>8} {'memory':>8}")
+    for result in record['results']:
+        key = (result['stage'], result['n_dates'], result['n_maturities'])
+        if key not in reference:
+            continue
+        # Floors keep sub-millisecond / sub-megabyte stages from flagging on noise
+        time_ratio = max(result['seconds'], 1e-3) / max(reference[key]['seconds'], 1e-3)
+        memory_ratio = max(result['peak_mb'], 1.0) / max(reference[key]['peak_mb'], 1.0)
+        flag = ''
+        if time_ratio > 1 + tolerance or memory_ratio > 1 + tolerance:
+            flag = '  REGRESSION'
+            regressions.append(f"{result['stage']} ({result['n_dates']} dates): "
+                               f"time x{time_ratio:.2f}, memory x{memory_ratio:.2f}")
+        print(f"  {result['stage']:<28} {result['n_dates']:>8} {time_ratio:>7.2f}x "
+              f"{memory_ratio:>7.2f}x{flag}")
+    return regressions
+
+
+def main():
+    """Run the benchmark suite."""
+    parser = argparse.ArgumentParser(description='Benchmark every stage of the PCA pipeline')
+    parser.add_argument('--dates', type=int, nargs='+', default=[2000, 20000],
+                        help='Panel lengths (numbers of dates) to benchmark')
+    parser.add_argument('--maturities', type=int, default=11,
+                        help='Number of maturities per panel, at most the 11 FRED '
+                             'tenors kept by preprocessing (default: 11)')
+    parser.add_argument('--fetch-latency', type=float, default=0.02,
+                        help='Response delay of the stand-in FRED server in seconds '
+                             '(default: 0.02)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Timed repetitions per stage; the best is kept (default: 3)')
+    parser.add_argument('--label', type=str, default=None,
+                        help='Label stored with this run (e.g. a branch or release name)')
+    parser.add_argument('--history', type=str, default=DEFAULT_HISTORY,
+                        help='JSON lines file the results are appended to')
+    parser.add_argument('--no-save', action='store_true',
+                        help='Do not append this run to the history file')
+    parser.add_argument('--compare', nargs='?', const='', default=None, metavar='BASELINE_FILE',
+                        help='Compare against the latest record of BASELINE_FILE '
+                             '(default: the history file) and fail on regressions')
+    parser.add_argument('--baseline-label', type=str, default=None,
+                        help='Compare against the latest baseline record with this label')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed relative slowdown or memory growth (default: 0.25)')
+    args = parser.parse_args()
+    # Preprocessing aligns panels to the FRED tenors, so wider panels would be cut
+    if not 1 <= args.maturities <= len(FRED_SERIES):
+        parser.error(f"--maturities must be between 1 and {len(FRED_SERIES)}")
+    
+    baseline = None
+    if args.compare is not None:
+        candidates = load_history(args.compare or args.history)
+        if args.baseline_label is not None:
+            candidates = [r for r in candidates if r.get('label') == args.baseline_label]
+        if not candidates:
+            print("Error: no baseline record found", file=sys.stderr)
+            sys.exit(1)
+        baseline = candidates[-1]
+    
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        for n_dates in args.dates:
+            print(f"\nPanel: {n_dates} dates x {args.maturities} maturities")
+            results.extend(benchmark_fetch(n_dates, args.repeat, args.fetch_latency))
+            results.extend(benchmark_panel(n_dates, args.maturities, args.repeat, work_dir))
+    
+    record = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'label': args.label,
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'machine': platform.machine(),
+        'cpus': os.cpu_count(),
+        'results': results,
+    }
+    if not args.no_save:
+        with open(args.history, 'a') as f:
+            f.write(json.dumps(record) + '\n')
+        print(f"\nResults appended to {args.history}")
+    
+    if baseline is not None:
+        regressions = compare(record, baseline, args.tolerance)
+        if regressions:
+            print(f"\nFAIL: {len(regressions)} stage(s) regressed beyond {args.tolerance:.0%}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,10 @@
 """Yield Curve PCA Analysis Package."""
 
+import logging
+
 __version__ = "1.0.0"
 
+# Library modules log progress under the 'src' logger and stay silent unless
+# the application configures logging (the CLI does, see `--quiet`)
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
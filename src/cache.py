@@ -0,0 +1,158 @@
+"""
+Content-addressed cache for CLI pipeline stages.
+
+Each cache entry is a directory named by a hash of the stage inputs (data
+fingerprint, preprocessing options, PCA parameters, ...) holding the files
+that stage produced. On a hit the files are copied to their destination
+instead of recomputing the stage.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from typing import List, Optional
+
+from . import __version__
+from .profiling import span
+
+
+def cache_key(*parts) -> str:
+    """
+    Hash stage inputs into a cache key.
+    
+    Parameters:
+    -----------
+    *parts
+        JSON-serialisable stage inputs (non-serialisable values are
+        converted with `str`)
+    
+    Returns:
+    --------
+    str
+        Hex SHA-256 digest
+    """
+    payload = json.dumps([__version__, *parts], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    Directory-backed store of stage outputs keyed by `cache_key`.
+    
+    Parameters:
+    -----------
+    cache_dir : str
+        Root directory of the cache
+    max_bytes : int, optional
+        Evict least recently used entries beyond this total size
+    max_age : float, optional
+        Evict entries not used for this many seconds
+    """
+    
+    def __init__(self, cache_dir: str, max_bytes: Optional[int] = None, max_age: Optional[float] = None):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        os.makedirs(cache_dir, exist_ok=True)
+    
+    def _entry(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key)
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up an entry and mark it as recently used.
+        
+        Returns:
+        --------
+        str or None
+            Entry directory, or None on a miss
+        """
+        entry = self._entry(key)
+        if not os.path.isdir(entry):
+            return None
+        os.utime(entry)
+        return entry
+    
+    def restore(self, key: str, output_dir: str) -> Optional[List[str]]:
+        """
+        Copy the files of a cached entry into `output_dir`.
+        
+        Returns:
+        --------
+        list or None
+            Restored file paths, or None on a miss
+        """
+        with span('cache_restore') as info:
+            entry = self.get(key)
+            info['hit'] = entry is not None
+            if entry is None:
+                return None
+            os.makedirs(output_dir, exist_ok=True)
+            restored = []
+            for name in sorted(os.listdir(entry)):
+                target = os.path.join(output_dir, name)
+                shutil.copy2(os.path.join(entry, name), target)
+                restored.append(target)
+            return restored
+    
+    def store(self, key: str, paths: List[str]) -> str:
+        """
+        Copy stage output files into a new cache entry.
+        
+        The entry is assembled in a temporary directory and renamed into
+        place, so readers never see a partially written entry.
+        
+        Returns:
+        --------
+        str
+            Entry directory
+        """
+        entry = self._entry(key)
+        with span('cache_store', files=len(paths)):
+            staging = tempfile.mkdtemp(dir=self.cache_dir, prefix='.tmp-')
+            try:
+                for path in paths:
+                    shutil.copy2(path, os.path.join(staging, os.path.basename(path)))
+                if os.path.isdir(entry):
+                    shutil.rmtree(entry)
+                os.replace(staging, entry)
+            except BaseException:
+                shutil.rmtree(staging, ignore_errors=True)
+                raise
+            self.evict()
+        return entry
+    
+    def evict(self) -> List[str]:
+        """
+        Remove entries older than `max_age`, then least recently used
+        entries until the cache fits in `max_bytes`.
+        
+        Returns:
+        --------
+        list
+            Keys of evicted entries
+        """
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if name.startswith('.') or not os.path.isdir(path):
+                continue
+            size = sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+            entries.append((os.path.getmtime(path), size, name))
+        entries.sort()
+        
+        now = time.time()
+        total = sum(size for _, size, _ in entries)
+        evicted = []
+        for mtime, size, name in entries:
+            expired = self.max_age is not None and now - mtime > self.max_age
+            oversized = self.max_bytes is not None and total > self.max_bytes
+            if not (expired or oversized):
+                continue
+            shutil.rmtree(os.path.join(self.cache_dir, name), ignore_errors=True)
+            total -= size
+            evicted.append(name)
+        return evicted
@@ -1,22 +1,61 @@
 """
 Command-line interface for yield curve PCA analysis.
+
+Pipeline modules (and with them pandas, scikit-learn and matplotlib) are
+imported inside the stages that use them, so `--help`, cache hits and
+data-only runs do not pay for heavy imports they never need.
+
+Progress is logged to stderr through the `src` package logger (`--quiet`
+keeps warnings only, `--verbose` adds per-series and per-plot detail); the
+human summary goes to stdout and `--summary-json` writes a machine-readable
+one.
 """
 
 import argparse
+import json
+import logging
 import os
 import sys
+import time
 from datetime import datetime
-import pandas as pd
 
-from .data_fetch import fetch_yield_data, save_yield_data, load_yield_data
-from .preprocessing import preprocess_yield_data
-from .pca_analysis import compute_pca_results
-from .visualizations import generate_all_plots
+# Named explicitly: under `python -m src.cli` __name__ is '__main__'
+logger = logging.getLogger(f'{__package__}.cli')
+
+
+class _LogFormatter(logging.Formatter):
+    """Plain messages for progress, prefixed with the level for warnings and errors."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        if record.levelno >= logging.WARNING:
+            message = f"{record.levelname.capitalize()}: {message}"
+        return message
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """
+    Send the package's log records to stderr.
+    
+    Parameters:
+    -----------
+    level : int
+        Lowest level shown (e.g. logging.WARNING for --quiet)
+    """
+    package_logger = logging.getLogger(__package__)
+    for handler in list(package_logger.handlers):
+        if not isinstance(handler, logging.NullHandler):
+            package_logger.removeHandler(handler)
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(_LogFormatter('%(message)s'))
+    package_logger.addHandler(handler)
+    package_logger.setLevel(level)
+    package_logger.propagate = False
 
 
-def save_results(pca_results: dict, output_dir: str = 'data') -> None:
+def save_results(pca_results: dict, output_dir: str = 'data', file_format: str = 'csv') -> list:
     """
-    Save PCA results to CSV files.
+    Save PCA results to disk.
     
     Parameters:
     -----------
@@ -24,18 +63,29 @@ def save_results(pca_results: dict, output_dir: str = 'data') -> None:
         Dictionary containing PCA results
     output_dir : str
         Directory to save results
+    file_format : str
+        Output format: 'csv', 'parquet' or 'arrow'
+    
+    Returns:
+    --------
+    list
+        Paths of the saved files
     """
+    import pandas as pd
+    from .storage import write_frame
+    
     os.makedirs(output_dir, exist_ok=True)
+    paths = [
+        os.path.join(output_dir, f'{name}.{file_format}')
+        for name in ('pca_loadings', 'pca_scores', 'pca_variance_summary')
+    ]
     
     # Save loadings
-    pca_results['loadings'].to_csv(
-        os.path.join(output_dir, 'pca_loadings.csv')
-    )
+    write_frame(pca_results['loadings'], paths[0])
     
-    # Save scores
-    pca_results['scores'].to_csv(
-        os.path.join(output_dir, 'pca_scores.csv')
-    )
+    # Save scores (already streamed to disk in mini-batch mode)
+    if pca_results['scores'] is not None:
+        write_frame(pca_results['scores'], paths[1])
     
     # Save explained variance summary
     variance_df = pd.DataFrame({
@@ -45,12 +95,98 @@ def save_results(pca_results: dict, output_dir: str = 'data') -> None:
         'Interpretation': [pca_results['interpretations'].get(f'PC{i+1}', 'N/A')
                           for i in range(len(pca_results['explained_variance']))]
     })
-    variance_df.to_csv(
-        os.path.join(output_dir, 'pca_variance_summary.csv'),
-        index=False
-    )
+    write_frame(variance_df, paths[2], index=False)
+    
+    logger.info("Results saved to %s/", output_dir)
+    return paths
+
+
+def print_summary(pca_results: dict, n_obs: int, period: tuple = None) -> None:
+    """
+    Print the PCA analysis summary.
+    
+    Parameters:
+    -----------
+    pca_results : dict
+        Dictionary containing PCA results
+    n_obs : int
+        Number of observations the model was fitted on
+    period : tuple, optional
+        First and last date of the data
+    """
+    print("\n" + "="*60)
+    print("PCA ANALYSIS SUMMARY")
+    print("="*60)
+    if period is not None:
+        print(f"\nData Period: {period[0]} to {period[1]}")
+    print(f"Number of Observations: {n_obs}")
+    print(f"Number of Maturities: {len(pca_results['loadings'])}")
+    print(f"\nExplained Variance:")
+    for i, (var, cum_var, interp) in enumerate(zip(
+        pca_results['explained_variance'],
+        pca_results['cumulative_variance'],
+        [pca_results['interpretations'].get(f'PC{i+1}', 'N/A')
+         for i in range(len(pca_results['explained_variance']))]
+    )):
+        print(f"  PC{i+1}: {var:.2%} (Cumulative: {cum_var:.2%}) - {interp}")
+    print("\n" + "="*60)
+
+
+def run_summary(pca_results: dict, n_obs: int, period: tuple = None) -> dict:
+    """
+    Build the machine-readable counterpart of `print_summary`.
+    
+    Parameters:
+    -----------
+    pca_results : dict
+        Dictionary containing PCA results
+    n_obs : int
+        Number of observations the model was fitted on
+    period : tuple, optional
+        First and last date of the data
     
-    print(f"\nResults saved to {output_dir}/")
+    Returns:
+    --------
+    dict
+        JSON-serialisable summary
+    """
+    return {
+        'n_obs': int(n_obs),
+        'period': None if period is None else [str(period[0]), str(period[1])],
+        'n_maturities': len(pca_results['loadings']),
+        'components': [
+            {
+                'component': f'PC{i+1}',
+                'explained_variance': float(var),
+                'cumulative_variance': float(cum_var),
+                'interpretation': pca_results['interpretations'].get(f'PC{i+1}', 'N/A'),
+            }
+            for i, (var, cum_var) in enumerate(zip(pca_results['explained_variance'],
+                                                   pca_results['cumulative_variance']))
+        ],
+    }
+
+
+def write_run_summary(summary: dict, path: str) -> None:
+    """
+    Write a run summary as JSON.
+    
+    Parameters:
+    -----------
+    summary : dict
+        Summary returned by `run_pipeline`
+    path : str
+        Output path, or '-' for stdout
+    """
+    text = json.dumps(summary, indent=2, default=str)
+    if path == '-':
+        print(text)
+        return
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(text + '\n')
 
 
 def main():
@@ -88,6 +224,48 @@ def main():
         default=3,
         help='Number of PCA components (default: 3)'
     )
+    parser.add_argument(
+        '--handle-missing',
+        type=str,
+        default='forward_fill',
+        choices=['forward_fill', 'interpolate', 'drop'],
+        help='Missing-data method (default: forward_fill)'
+    )
+    parser.add_argument(
+        '--max-gap',
+        type=int,
+        default=None,
+        help='Only fill runs of at most this many missing values per maturity; rows left '
+             'incomplete are dropped (default: fill every gap)'
+    )
+    parser.add_argument(
+        '--standardize',
+        type=str,
+        default='demean',
+        choices=['demean', 'zscore'],
+        help='Standardization method (default: demean)'
+    )
+    parser.add_argument(
+        '--solver',
+        type=str,
+        default='sklearn',
+        choices=['sklearn', 'eigh'],
+        help='PCA solver: sklearn SVD or covariance eigendecomposition (default: sklearn)'
+    )
+    parser.add_argument(
+        '--dtype',
+        type=str,
+        default=None,
+        choices=['float64', 'float32'],
+        help='Compute dtype for the panel; float32 halves memory, and with --solver eigh the '
+             'covariance is still accumulated in float64 (default: the stored dtype)'
+    )
+    parser.add_argument(
+        '--reference-loadings',
+        type=str,
+        default=None,
+        help='Loadings file from a previous run; components are reordered and sign-aligned to it'
+    )
     parser.add_argument(
         '--output-dir',
         type=str,
@@ -100,8 +278,112 @@ def main():
         default='plots',
         help='Output directory for plots (default: plots)'
     )
+    parser.add_argument(
+        '--plot-workers',
+        type=int,
+        default=None,
+        help='Processes used to render plots (default: one per CPU)'
+    )
+    parser.add_argument(
+        '--max-workers',
+        type=int,
+        default=8,
+        help='Maximum concurrent FRED requests (default: 8)'
+    )
+    parser.add_argument(
+        '--format',
+        type=str,
+        default='csv',
+        choices=['csv', 'parquet', 'arrow'],
+        help='File format for saved data and results (default: csv)'
+    )
+    parser.add_argument(
+        '--store-dir',
+        type=str,
+        default=None,
+        help='Local yield store for incremental fetches (default: <output-dir>/yield_store)'
+    )
+    parser.add_argument(
+        '--full-refresh',
+        action='store_true',
+        help='Re-download the full history instead of updating the local yield store'
+    )
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        default=None,
+        help='Stream --data-file in chunks of this many rows and fit PCA in mini-batches '
+             '(bounded memory; plots are skipped)'
+    )
+    parser.add_argument(
+        '--grid',
+        type=str,
+        default=None,
+        help='JSON grid spec; run every preprocessing/PCA combination and write grid_results'
+    )
+    parser.add_argument(
+        '--grid-workers',
+        type=int,
+        default=None,
+        help='Processes used for --grid runs (default: one per CPU)'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        type=str,
+        default=None,
+        help='Result cache directory (default: <output-dir>/.cache)'
+    )
+    parser.add_argument(
+        '--cache-max-mb',
+        type=float,
+        default=500,
+        help='Evict least recently used cache entries beyond this size in MB (default: 500)'
+    )
+    parser.add_argument(
+        '--cache-max-age',
+        type=float,
+        default=30,
+        help='Evict cache entries unused for this many days (default: 30)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Recompute every stage and do not read or write the result cache'
+    )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Print a timing and peak-memory breakdown of every pipeline stage'
+    )
+    parser.add_argument(
+        '--profile-output',
+        type=str,
+        default=None,
+        help='Write the profile spans to this file as JSON lines (implies --profile)'
+    )
+    parser.add_argument(
+        '--summary-json',
+        type=str,
+        default=None,
+        metavar='PATH',
+        help="Write a machine-readable run summary to PATH ('-' for stdout, which "
+             "replaces the printed summary)"
+    )
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument(
+        '-q', '--quiet',
+        action='store_true',
+        help='Only log warnings and errors, and skip the printed summary'
+    )
+    verbosity.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help='Also log per-series and per-plot detail'
+    )
     
     args = parser.parse_args()
+    configure_logging(logging.WARNING if args.quiet else
+                      logging.DEBUG if args.verbose else logging.INFO)
     
     # Get API key
     api_key = args.api_key or os.getenv('FRED_API_KEY')
@@ -110,50 +392,229 @@ def main():
     if args.end is None:
         args.end = datetime.now().strftime('%Y-%m-%d')
     
+    started = time.perf_counter()
+    profile = args.profile or args.profile_output
+    if not profile:
+        summary = run_pipeline(args, api_key)
+        _finish(args, summary, started)
+        return
+    
+    from .profiling import Profiler
+    profiler = Profiler()
     try:
+        with profiler:
+            summary = run_pipeline(args, api_key)
+    finally:
+        # Keep stdout parseable when it carries the JSON summary
+        stream = sys.stderr if args.summary_json == '-' else sys.stdout
+        print("\nPROFILE", file=stream)
+        print(profiler.summary(), file=stream)
+        if args.profile_output:
+            profiler.write_jsonl(args.profile_output)
+            logger.info("Profile spans written to %s", args.profile_output)
+    _finish(args, summary, started)
+
+
+def _finish(args: argparse.Namespace, summary: dict, started: float) -> None:
+    """Complete the run summary and write it if `--summary-json` was given."""
+    summary['elapsed_s'] = round(time.perf_counter() - started, 3)
+    summary['options'] = {k: v for k, v in vars(args).items() if k != 'api_key'}
+    if args.summary_json:
+        write_run_summary(summary, args.summary_json)
+
+
+def run_pipeline(args: argparse.Namespace, api_key: str) -> dict:
+    """
+    Run the analysis selected by the parsed command-line arguments.
+    
+    Parameters:
+    -----------
+    args : argparse.Namespace
+        Arguments parsed by `main`
+    api_key : str
+        FRED API key (may be None when a data file is given)
+    
+    Returns:
+    --------
+    dict
+        Run summary (see `run_summary`) with the mode, output paths and the
+        cache stages that were restored
+    """
+    # The printed summary would corrupt a JSON summary sent to stdout
+    show_summary = not args.quiet and args.summary_json != '-'
+    try:
+        from .data_fetch import load_yield_data, save_yield_data
+        from .model import data_fingerprint
+        from .cache import ResultCache, cache_key
+        from .profiling import span
+        
+        reference_loadings = None
+        if args.reference_loadings:
+            from .storage import read_frame
+            reference_loadings = read_frame(args.reference_loadings, parse_dates=False)
+        
+        # Out-of-core mode: stream the data file through preprocessing and a mini-batch PCA
+        if args.chunk_size:
+            if not args.data_file:
+                logger.error("--chunk-size requires --data-file")
+                sys.exit(1)
+            if args.max_gap is not None:
+                logger.error("--max-gap is not supported with --chunk-size")
+                sys.exit(1)
+            from .preprocessing import preprocess_yield_data_chunked
+            from .pca_analysis import compute_pca_results
+            chunks, _, _ = preprocess_yield_data_chunked(
+                args.data_file, chunk_size=args.chunk_size,
+                handle_missing=args.handle_missing, standardize=args.standardize,
+                dtype=args.dtype
+            )
+            pca_results = compute_pca_results(
+                chunks, n_components=args.n_components, reference_loadings=reference_loadings,
+                scores_path=os.path.join(args.output_dir, f'pca_scores.{args.format}')
+            )
+            paths = save_results(pca_results, output_dir=args.output_dir, file_format=args.format)
+            logger.info("Plots skipped in chunked mode (they need the full panel in memory)")
+            n_obs = pca_results['pca_model'].n_samples_
+            if show_summary:
+                print_summary(pca_results, n_obs=n_obs)
+            return {'mode': 'chunked', **run_summary(pca_results, n_obs),
+                    'outputs': {'results': paths}, 'cache_hits': []}
+        
         # Fetch or load data
         if args.data_file:
-            print(f"Loading data from {args.data_file}...")
-            df_raw = load_yield_data(args.data_file)
+            logger.info("Loading data from %s...", args.data_file)
+            with span('load_yield_data', path=args.data_file):
+                df_raw = load_yield_data(args.data_file, dtype=args.dtype)
         else:
             if not api_key:
-                print("Error: FRED API key required. Set FRED_API_KEY environment variable or use --api-key")
+                logger.error("FRED API key required. Set FRED_API_KEY environment variable or use --api-key")
                 sys.exit(1)
             
-            df_raw = fetch_yield_data(api_key, args.start, args.end)
-            save_yield_data(df_raw, os.path.join(args.output_dir, 'yield_data.csv'))
+            from .data_fetch import fetch_yield_data, fetch_yield_data_incremental
+            if args.full_refresh:
+                df_raw = fetch_yield_data(api_key, args.start, args.end, max_workers=args.max_workers)
+            else:
+                store_dir = args.store_dir or os.path.join(args.output_dir, 'yield_store')
+                df_raw = fetch_yield_data_incremental(
+                    api_key, store_dir, args.start, args.end, max_workers=args.max_workers
+                )
+            with span('save_yield_data', format=args.format):
+                save_yield_data(df_raw, os.path.join(args.output_dir, f'yield_data.{args.format}'))
         
-        # Preprocess
-        df_processed, means, stds = preprocess_yield_data(df_raw)
+        # Batch mode: sweep a grid of configurations and write one table
+        if args.grid:
+            from .grid import expand_grid, load_grid_spec, run_grid
+            from .storage import write_frame
+            # Options the spec leaves out are taken from the command line
+            configs = expand_grid(load_grid_spec(args.grid), defaults={
+                'n_components': args.n_components, 'handle_missing': args.handle_missing,
+                'max_gap': args.max_gap, 'standardize': args.standardize,
+                'solver': args.solver, 'dtype': args.dtype,
+            })
+            grid_results = run_grid(df_raw, configs, max_workers=args.grid_workers)
+            grid_path = os.path.join(args.output_dir, f'grid_results.{args.format}')
+            write_frame(grid_results, grid_path, index=False)
+            if show_summary:
+                print(grid_results.to_string(index=False))
+            logger.info("Grid results saved to %s", grid_path)
+            return {'mode': 'grid', 'n_configs': len(configs),
+                    'grid_results': json.loads(grid_results.to_json(orient='records')),
+                    'outputs': {'grid_results': grid_path}}
         
-        # Apply PCA
-        pca_results = compute_pca_results(df_processed, n_components=args.n_components)
+        # Stage cache keys: each stage depends on the data and every option upstream of it
+        cache = None
+        if not args.no_cache:
+            cache = ResultCache(
+                args.cache_dir or os.path.join(args.output_dir, '.cache'),
+                max_bytes=int(args.cache_max_mb * 1024 * 1024),
+                max_age=args.cache_max_age * 86400
+            )
+        with span('data_fingerprint'):
+            pca_key = cache_key(
+                'pca', data_fingerprint(df_raw), args.handle_missing, args.max_gap, args.standardize,
+                args.n_components, args.solver, args.dtype,
+                data_fingerprint(reference_loadings) if reference_loadings is not None else None
+            )
+        model_path = os.path.join(args.output_dir, 'pca_model.npz')
+        cache_hits = []
+        
+        if cache is not None and cache.restore(pca_key, args.output_dir):
+            from .model import load_model
+            cache_hits.append('pca')
+            logger.info("Using cached PCA model")
+            with span('project_cached_model'):
+                pca_results = load_model(model_path).results(df_raw)
+        else:
+            from .preprocessing import preprocess_yield_data
+            from .pca_analysis import compute_pca_results
+            from .model import YieldCurveModel
+            
+            # Preprocess
+            with span('preprocess_yield_data'):
+                df_processed, means, stds = preprocess_yield_data(
+                    df_raw, handle_missing=args.handle_missing, standardize=args.standardize,
+                    dtype=args.dtype, max_gap=args.max_gap
+                )
+            
+            # Apply PCA
+            with span('compute_pca_results'):
+                pca_results = compute_pca_results(
+                    df_processed, n_components=args.n_components, solver=args.solver,
+                    reference_loadings=reference_loadings
+                )
+            
+            # Save model artefact for out-of-sample projection
+            model = YieldCurveModel.from_results(
+                pca_results, means, stds, df_raw,
+                handle_missing=args.handle_missing, standardize=args.standardize,
+                max_gap=args.max_gap, solver=args.solver, reference_loadings=reference_loadings
+            )
+            with span('save_model'):
+                model.save(model_path)
+            if cache is not None:
+                cache.store(pca_key, [model_path])
         
         # Save results
-        save_results(pca_results, output_dir=args.output_dir)
+        results_key = cache_key('results', pca_key, args.format)
+        result_paths = [
+            os.path.join(args.output_dir, f'{name}.{args.format}')
+            for name in ('pca_loadings', 'pca_scores', 'pca_variance_summary')
+        ]
+        if cache is not None and cache.restore(results_key, args.output_dir):
+            cache_hits.append('results')
+            logger.info("Restored cached results to %s/", args.output_dir)
+        else:
+            with span('save_results', format=args.format):
+                result_paths = save_results(pca_results, output_dir=args.output_dir,
+                                            file_format=args.format)
+            if cache is not None:
+                cache.store(results_key, result_paths)
         
         # Generate plots
-        generate_all_plots(pca_results, df_raw, output_dir=args.plots_dir)
+        plots_key = cache_key('plots', pca_key)
+        if cache is not None and cache.restore(plots_key, args.plots_dir):
+            from .visualizations import PLOT_FILES
+            cache_hits.append('plots')
+            plot_paths = [os.path.join(args.plots_dir, name) for name in PLOT_FILES]
+            logger.info("Restored cached plots to %s/", args.plots_dir)
+        else:
+            from .visualizations import generate_all_plots
+            plot_paths = generate_all_plots(
+                pca_results, df_raw, output_dir=args.plots_dir, max_workers=args.plot_workers
+            )
+            if cache is not None:
+                cache.store(plots_key, plot_paths)
         
         # Print summary
-        print("\n" + "="*60)
-        print("PCA ANALYSIS SUMMARY")
-        print("="*60)
-        print(f"\nData Period: {df_raw.index.min()} to {df_raw.index.max()}")
-        print(f"Number of Observations: {len(df_raw)}")
-        print(f"Number of Maturities: {len(df_raw.columns)}")
-        print(f"\nExplained Variance:")
-        for i, (var, cum_var, interp) in enumerate(zip(
-            pca_results['explained_variance'],
-            pca_results['cumulative_variance'],
-            [pca_results['interpretations'].get(f'PC{i+1}', 'N/A')
-             for i in range(len(pca_results['explained_variance']))]
-        )):
-            print(f"  PC{i+1}: {var:.2%} (Cumulative: {cum_var:.2%}) - {interp}")
-        print("\n" + "="*60)
-        
+        period = (df_raw.index.min(), df_raw.index.max())
+        if show_summary:
+            print_summary(pca_results, n_obs=len(df_raw), period=period)
+        return {'mode': 'full', **run_summary(pca_results, len(df_raw), period),
+                'outputs': {'model': model_path, 'results': result_paths, 'plots': plot_paths},
+                'cache_hits': cache_hits}
+    
     except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
+        logger.error("%s", e)
         sys.exit(1)
 
 
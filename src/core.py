@@ -0,0 +1,205 @@
+"""
+Pure-ndarray kernels beneath the pandas-facing pipeline functions.
+
+`standardize_yields`, `apply_pca`, `rolling_pca` and `bootstrap_pca` take and
+return DataFrames; the arithmetic they share lives here and works on plain
+arrays. Every kernel that produces an array accepts an `out=` buffer (which
+may be the input itself for in-place work), so loops that call them many
+times can reuse their buffers instead of building a new frame per call.
+Inputs are not validated; the pandas wrappers do that once.
+
+Results keep float32 inputs in float32 (see `FLOAT_DTYPES`), except
+covariances, which are always accumulated in float64.
+"""
+
+import numpy as np
+from typing import Optional, Tuple
+
+# Floating-point types the pipeline can compute in; float32 halves memory and
+# bandwidth for large panels
+FLOAT_DTYPES = (np.dtype(np.float64), np.dtype(np.float32))
+
+# Rows upcast at a time when accumulating the Gram matrix of a float32 panel
+_GRAM_BLOCK_ROWS = 65_536
+
+
+def resolve_dtype(dtype) -> Optional[np.dtype]:
+    """
+    Validate a compute dtype option.
+    
+    Parameters:
+    -----------
+    dtype : str, type or np.dtype, optional
+        'float64' or 'float32'; None keeps the dtype of the data
+    
+    Returns:
+    --------
+    np.dtype or None
+        The validated dtype
+    """
+    if dtype is None:
+        return None
+    dtype = np.dtype(dtype)
+    if dtype not in FLOAT_DTYPES:
+        raise ValueError(f"Unsupported dtype: {dtype} (use float64 or float32)")
+    return dtype
+
+
+def result_dtype(X: np.ndarray) -> np.dtype:
+    """Dtype of arrays derived from X: float32 for float32 input, float64 otherwise."""
+    return X.dtype if X.dtype == np.float32 else np.dtype(np.float64)
+
+
+def flip_signs(components: np.ndarray) -> np.ndarray:
+    """
+    Make the largest-magnitude loading of every component positive.
+    
+    Parameters:
+    -----------
+    components : np.ndarray
+        Loadings with maturities on the second-to-last axis and components
+        on the last axis, optionally stacked along leading axes
+    
+    Returns:
+    --------
+    np.ndarray
+        Sign-normalised loadings (same shape)
+    """
+    idx = np.argmax(np.abs(components), axis=-2)[..., np.newaxis, :]
+    signs = np.sign(np.take_along_axis(components, idx, axis=-2))
+    signs[signs == 0] = 1
+    return components * signs
+
+
+def center(
+    X: np.ndarray,
+    mean: np.ndarray,
+    scale: Optional[np.ndarray] = None,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Subtract a per-column mean and optionally divide by a per-column scale.
+    
+    Parameters:
+    -----------
+    X : np.ndarray
+        Data (rows x columns)
+    mean : np.ndarray
+        Value subtracted from each column
+    scale : np.ndarray, optional
+        Divisor of each column (e.g. standard deviations)
+    out : np.ndarray, optional
+        Buffer of X's shape for the result; pass X itself to standardize in
+        place
+    
+    Returns:
+    --------
+    np.ndarray
+        `out`, or a new array of `result_dtype(X)` when no buffer is given
+    """
+    if out is None:
+        out = np.empty(X.shape, dtype=result_dtype(X))
+    np.subtract(X, mean, out=out)
+    if scale is not None:
+        np.divide(out, scale, out=out)
+    return out
+
+
+def covariance(
+    X: np.ndarray,
+    mean: np.ndarray,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Sample covariance (ddof=1) of the columns of X without centring a copy.
+    
+    The Gram matrix is formed in one matrix product and corrected for the
+    mean algebraically. It is always accumulated in float64; other inputs
+    (e.g. float32 panels) are upcast a block of rows at a time rather than
+    as a whole.
+    
+    Parameters:
+    -----------
+    X : np.ndarray
+        Data (rows x columns), e.g. a memory-mapped panel
+    mean : np.ndarray
+        Column means of X
+    out : np.ndarray, optional
+        (columns x columns) float64 buffer for the result
+    
+    Returns:
+    --------
+    np.ndarray
+        Covariance matrix (float64)
+    """
+    n_samples = X.shape[0]
+    if X.dtype == np.float64:
+        out = np.matmul(X.T, X, out=out)
+    else:
+        if out is None:
+            out = np.zeros((X.shape[1], X.shape[1]))
+        else:
+            out[...] = 0
+        for start in range(0, n_samples, _GRAM_BLOCK_ROWS):
+            block = X[start:start + _GRAM_BLOCK_ROWS].astype(np.float64)
+            out += block.T @ block
+    out -= n_samples * np.outer(mean, mean)
+    out /= n_samples - 1
+    return out
+
+
+def eigh_components(covariance: np.ndarray, n_components: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Leading principal axes of one covariance matrix or a stack of them.
+    
+    Parameters:
+    -----------
+    covariance : np.ndarray
+        Covariance matrix (maturities x maturities), optionally stacked
+        along leading axes (e.g. one per rolling window)
+    n_components : int
+        Number of components to keep
+    
+    Returns:
+    --------
+    Tuple[np.ndarray, np.ndarray]
+        Loadings (... x maturities x n_components), signs fixed by
+        `flip_signs`, and all eigenvalues in descending order, clipped at
+        zero (... x maturities)
+    """
+    eigenvalues, eigenvectors = np.linalg.eigh(covariance)
+    eigenvalues = np.clip(eigenvalues[..., ::-1], 0, None)
+    components = flip_signs(eigenvectors[..., ::-1][..., :n_components])
+    return components, eigenvalues
+
+
+def project(
+    X: np.ndarray,
+    loadings: np.ndarray,
+    mean: Optional[np.ndarray] = None,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Component scores `(X - mean) @ loadings` without centring a copy of X.
+    
+    Parameters:
+    -----------
+    X : np.ndarray
+        Observations (rows x maturities)
+    loadings : np.ndarray
+        Loadings (maturities x components)
+    mean : np.ndarray, optional
+        Mean removed before projecting (default: none)
+    out : np.ndarray, optional
+        (rows x components) buffer for the scores
+    
+    Returns:
+    --------
+    np.ndarray
+        Scores (rows x components), float32 for float32 input
+    """
+    # Cast the small loadings matrix rather than upcasting a float32 panel
+    out = np.matmul(X, loadings.astype(result_dtype(X), copy=False), out=out)
+    if mean is not None:
+        out -= mean @ loadings
+    return out
@@ -2,17 +2,31 @@
 Fetch U.S. Treasury yield curve data from FRED API.
 
 This module handles downloading daily/monthly Treasury yield data for various
-maturities and saving it to CSV format.
+maturities and saving it to CSV, Parquet or Arrow IPC format.
 """
 
 import os
+import json
+import logging
+import tempfile
+import time
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
-from fredapi import Fred
+from .core import resolve_dtype
+from .profiling import span
+from .storage import iter_frame, read_frame, write_frame
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Tuple, Union
 import warnings
 
 warnings.filterwarnings('ignore')
 
+if TYPE_CHECKING:
+    from fredapi import Fred
+
+logger = logging.getLogger(__name__)
 
 # FRED series IDs for U.S. Treasury yields
 FRED_SERIES = {
@@ -30,10 +44,248 @@ FRED_SERIES = {
 }
 
 
-def fetch_yield_data(api_key: str, start_date: str = None, end_date: str = None) -> pd.DataFrame:
+# Seconds to wait for a FRED connection or response before giving up on a series
+FRED_TIMEOUT = 30.0
+
+
+class FredSession:
+    """
+    Minimal FRED observations client over one pooled `requests.Session`.
+    
+    fredapi opens a new connection for every request. This client calls the
+    `series/observations` endpoint itself through a session whose pool
+    keeps up to `pool_size` connections alive, so fetch threads reuse their
+    connections instead of repeating the TCP and TLS handshakes per series.
+    `get_series` returns the same Series as `fredapi.Fred.get_series`.
+    
+    Parameters:
+    -----------
+    api_key : str
+        FRED API key
+    base_url : str, optional
+        Override for the FRED API root URL
+    pool_size : int
+        Maximum number of pooled connections (e.g. the worker count)
+    timeout : float
+        Connect and read timeout of each request in seconds
+    proxies : Dict[str, str], optional
+        Proxies by URL scheme; HTTP_PROXY / HTTPS_PROXY are honoured otherwise
+    """
+    
+    root_url = 'https://api.stlouisfed.org/fred'
+    
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[str] = None,
+        pool_size: int = 8,
+        timeout: float = FRED_TIMEOUT,
+        proxies: Optional[Dict[str, str]] = None
+    ):
+        import requests
+        self.api_key = api_key
+        if base_url is not None:
+            self.root_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1,
+                                                pool_maxsize=max(1, pool_size))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        if proxies:
+            self.session.proxies.update(proxies)
+    
+    def get_series(
+        self,
+        series_id: str,
+        observation_start: Optional[str] = None,
+        observation_end: Optional[str] = None
+    ) -> pd.Series:
+        """
+        Fetch the observations of one series.
+        
+        Parameters:
+        -----------
+        series_id : str
+            FRED series ID
+        observation_start : str, optional
+            First date in 'YYYY-MM-DD' format
+        observation_end : str, optional
+            Last date in 'YYYY-MM-DD' format
+        
+        Returns:
+        --------
+        pd.Series
+            Observations indexed by date; missing values ('.') are NaN
+        """
+        import xml.etree.ElementTree as ET
+        params = {'series_id': series_id, 'api_key': self.api_key}
+        if observation_start is not None:
+            params['observation_start'] = pd.Timestamp(observation_start).strftime('%Y-%m-%d')
+        if observation_end is not None:
+            params['observation_end'] = pd.Timestamp(observation_end).strftime('%Y-%m-%d')
+        
+        response = self.session.get(f'{self.root_url}/series/observations', params=params,
+                                    timeout=self.timeout)
+        # FRED reports bad requests (e.g. unknown series) as XML with a message
+        if 400 <= response.status_code < 500:
+            try:
+                message = ET.fromstring(response.content).get('message')
+            except ET.ParseError:
+                message = None
+            if message:
+                raise ValueError(message)
+        response.raise_for_status()
+        
+        root = ET.fromstring(response.content)
+        dates = [obs.get('date') for obs in root]
+        values = [np.nan if obs.get('value') == '.' else float(obs.get('value')) for obs in root]
+        return pd.Series(values, index=pd.to_datetime(dates, format='%Y-%m-%d'), dtype=np.float64)
+    
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.session.close()
+
+
+@contextmanager
+def _fred_client(
+    api_key: str,
+    base_url: Optional[str] = None,
+    pool_size: int = 8
+) -> Iterator[Union['Fred', FredSession]]:
+    """
+    Create a FRED client to share between fetch threads.
+    
+    A pooled `FredSession` when `requests` is installed, otherwise a
+    fredapi client (one connection per request).
+    
+    Parameters:
+    -----------
+    api_key : str
+        FRED API key
+    base_url : str, optional
+        Override for the FRED API root URL
+    pool_size : int
+        Maximum number of pooled connections (e.g. the worker count)
+    
+    Returns:
+    --------
+    Iterator[Fred or FredSession]
+        Context manager yielding the client; pooled connections are closed
+        on exit
+    """
+    try:
+        import requests  # noqa: F401
+    except ImportError:
+        from fredapi import Fred
+        fred = Fred(api_key=api_key)
+        if base_url is not None:
+            fred.root_url = base_url.rstrip('/')
+        yield fred
+        return
+    
+    fred = FredSession(api_key, base_url, pool_size=pool_size)
+    try:
+        yield fred
+    finally:
+        fred.close()
+
+
+def _fetch_series(
+    fred: Union['Fred', 'FredSession'],
+    maturity: str,
+    series_id: str,
+    start_date: Optional[str],
+    end_date: Optional[str]
+) -> Tuple[str, pd.Series, float]:
+    """
+    Fetch a single FRED series and time the round trip.
+    
+    Returns:
+    --------
+    Tuple[str, pd.Series, float]
+        Maturity label, observations, and latency in seconds
+    """
+    started = time.perf_counter()
+    with span('fetch_series', series_id=series_id) as info:
+        data = fred.get_series(series_id, observation_start=start_date, observation_end=end_date)
+        info['rows'] = len(data)
+    return maturity, data, time.perf_counter() - started
+
+
+def fetch_series_concurrently(
+    fred: Union['Fred', 'FredSession'],
+    series: Dict[str, str],
+    start_date: Union[str, Dict[str, str], None] = None,
+    end_date: Optional[str] = None,
+    max_workers: int = 8
+) -> Tuple[Dict[str, pd.Series], Dict[str, float]]:
+    """
+    Fetch several FRED series in parallel through one shared client.
+    
+    Create the client with `_fred_client` (a `FredSession` when `requests`
+    is installed) so the threads share a pool of keep-alive connections.
+    
+    Parameters:
+    -----------
+    fred : Fred or FredSession
+        FRED client shared by all worker threads
+    series : Dict[str, str]
+        Mapping of maturity labels to FRED series IDs
+    start_date : str or Dict[str, str], optional
+        Start date in 'YYYY-MM-DD' format, or a per-maturity mapping of start dates
+    end_date : str, optional
+        End date in 'YYYY-MM-DD' format
+    max_workers : int
+        Maximum number of requests in flight at once
+    
+    Returns:
+    --------
+    Tuple[Dict[str, pd.Series], Dict[str, float]]
+        Series keyed by maturity (in the order of `series`) and per-series
+        latency in seconds. Series that failed to download are omitted.
+    """
+    fetched = {}
+    latencies = {}
+    if not series:
+        return fetched, latencies
+    
+    starts = start_date if isinstance(start_date, dict) else {m: start_date for m in series}
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(series)))) as pool:
+        futures = {
+            pool.submit(_fetch_series, fred, maturity, series_id, starts.get(maturity), end_date): maturity
+            for maturity, series_id in series.items()
+        }
+        for future in as_completed(futures):
+            maturity = futures[future]
+            try:
+                _, data, latency = future.result()
+            except Exception as e:
+                logger.warning("Failed to fetch %s (%s): %s", maturity, series[maturity], e)
+                continue
+            fetched[maturity] = data
+            latencies[maturity] = latency
+            logger.debug("Fetched %s yield (%s) in %.2fs", maturity, series[maturity], latency)
+    
+    # Restore the requested maturity order regardless of completion order
+    ordered = {m: fetched[m] for m in series if m in fetched}
+    return ordered, {m: latencies[m] for m in ordered}
+
+
+def fetch_yield_data(
+    api_key: str,
+    start_date: str = None,
+    end_date: str = None,
+    max_workers: int = 8,
+    base_url: Optional[str] = None
+) -> pd.DataFrame:
     """
     Fetch U.S. Treasury yield data from FRED API.
     
+    All maturities are requested concurrently; per-series latencies (in
+    seconds) are attached to the result as ``df.attrs['fetch_latency']``.
+    
     Parameters:
     -----------
     api_key : str
@@ -42,6 +294,10 @@ def fetch_yield_data(api_key: str, start_date: str = None, end_date: str = None)
         Start date in 'YYYY-MM-DD' format
     end_date : str, optional
         End date in 'YYYY-MM-DD' format
+    max_workers : int
+        Maximum number of concurrent FRED requests
+    base_url : str, optional
+        Override for the FRED API root URL (e.g. a local stand-in server)
     
     Returns:
     --------
@@ -53,18 +309,14 @@ def fetch_yield_data(api_key: str, start_date: str = None, end_date: str = None)
             "FRED API key required. Get one from https://fred.stlouisfed.org/docs/api/api_key.html"
         )
     
-    fred = Fred(api_key=api_key)
-    yield_data = {}
-    
-    print("Fetching yield curve data from FRED...")
-    for maturity, series_id in FRED_SERIES.items():
-        try:
-            print(f"  Fetching {maturity} yield ({series_id})...")
-            data = fred.get_series(series_id, observation_start=start_date, observation_end=end_date)
-            yield_data[maturity] = data
-        except Exception as e:
-            print(f"  Warning: Failed to fetch {maturity} ({series_id}): {e}")
-            continue
+    logger.info("Fetching yield curve data from FRED...")
+    started = time.perf_counter()
+    with span('fetch_yield_data', max_workers=max_workers), \
+            _fred_client(api_key, base_url, pool_size=max_workers) as fred:
+        yield_data, latencies = fetch_series_concurrently(
+            fred, FRED_SERIES, start_date, end_date, max_workers=max_workers
+        )
+    elapsed = time.perf_counter() - started
     
     if not yield_data:
         raise ValueError("No yield data could be fetched from FRED")
@@ -75,43 +327,320 @@ def fetch_yield_data(api_key: str, start_date: str = None, end_date: str = None)
     
     # Remove rows where all values are NaN
     df = df.dropna(how='all')
+    df.attrs['fetch_latency'] = latencies
+    
+    logger.info("Fetched %d observations across %d maturities in %.2fs",
+                len(df), len(df.columns), elapsed)
+    logger.info("Date range: %s to %s", df.index.min(), df.index.max())
+    
+    return df
+
+
+def _write_csv_atomic(df: pd.DataFrame, path: str) -> None:
+    """
+    Write a DataFrame to CSV via a temporary file and an atomic rename.
+    """
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', newline='') as f:
+            df.to_csv(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class YieldStore:
+    """
+    Persistent local store of FRED observations, one file per series ID.
+    
+    The store directory holds ``<SERIES_ID>.csv`` for each series plus a
+    ``manifest.json`` recording, for every series, the start date it was
+    fetched from and its last observation date, so that refreshes only need
+    to request the missing tail.
+    """
+    
+    MANIFEST = 'manifest.json'
+    
+    def __init__(self, store_dir: str):
+        self.store_dir = store_dir
+        os.makedirs(store_dir, exist_ok=True)
+        self.manifest = self._read_manifest()
+    
+    def _read_manifest(self) -> Dict[str, Dict[str, str]]:
+        path = os.path.join(self.store_dir, self.MANIFEST)
+        if not os.path.exists(path):
+            return {}
+        with open(path) as f:
+            return json.load(f)
+    
+    def _series_path(self, series_id: str) -> str:
+        return os.path.join(self.store_dir, f'{series_id}.csv')
+    
+    def covers(self, series_id: str, start_date: Optional[str]) -> bool:
+        """Return True if the stored history of a series reaches back to `start_date`."""
+        entry = self.manifest.get(series_id)
+        if entry is None:
+            return False
+        if entry['start'] is None:
+            return True
+        return start_date is not None and pd.Timestamp(start_date) >= pd.Timestamp(entry['start'])
     
-    print(f"\nFetched {len(df)} observations across {len(df.columns)} maturities")
-    print(f"Date range: {df.index.min()} to {df.index.max()}")
+    def last_observation(self, series_id: str) -> Optional[pd.Timestamp]:
+        """Return the latest stored date for a series, or None."""
+        entry = self.manifest.get(series_id)
+        return pd.Timestamp(entry['last']) if entry else None
+    
+    def read(self, series_id: str) -> pd.Series:
+        """Read all stored observations for a series."""
+        path = self._series_path(series_id)
+        if series_id not in self.manifest or not os.path.exists(path):
+            return pd.Series(dtype=float, name=series_id)
+        return pd.read_csv(path, index_col=0, parse_dates=True).iloc[:, 0]
+    
+    def append(
+        self,
+        series_id: str,
+        data: pd.Series,
+        replace: bool = False,
+        start_date: Optional[str] = None
+    ) -> None:
+        """
+        Append new observations to a series and update the manifest.
+        
+        Both the series file and the manifest are replaced atomically, so an
+        interrupted refresh never leaves a partially written store behind.
+        
+        Parameters:
+        -----------
+        series_id : str
+            FRED series ID
+        data : pd.Series
+            New observations indexed by date
+        replace : bool
+            Discard previously stored observations instead of appending
+        start_date : str, optional
+            Start date the data was requested from (recorded when `replace`
+            is True; None means the full available history)
+        """
+        if data.empty:
+            return
+        data = data.copy()
+        data.index = pd.to_datetime(data.index)
+        existing = None if replace else self.read(series_id)
+        if existing is not None and not existing.empty:
+            combined = pd.concat([existing, data])
+            combined = combined[~combined.index.duplicated(keep='last')].sort_index()
+        else:
+            combined = data.sort_index()
+        combined.index.name = 'Date'
+        combined.name = series_id
+        
+        _write_csv_atomic(combined.to_frame(), self._series_path(series_id))
+        
+        previous = self.manifest.get(series_id)
+        self.manifest[series_id] = {
+            'start': start_date if replace or previous is None else previous['start'],
+            'last': combined.index.max().strftime('%Y-%m-%d'),
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=self.store_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(self.manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, os.path.join(self.store_dir, self.MANIFEST))
+    
+    def load_panel(
+        self,
+        series: Dict[str, str],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Assemble stored series into a Date-indexed yield panel.
+        
+        Parameters:
+        -----------
+        series : Dict[str, str]
+            Mapping of maturity labels to FRED series IDs
+        start_date : str, optional
+            Start date in 'YYYY-MM-DD' format
+        end_date : str, optional
+            End date in 'YYYY-MM-DD' format
+        
+        Returns:
+        --------
+        pd.DataFrame
+            DataFrame with dates as index and maturities as columns
+        """
+        data = {m: self.read(sid) for m, sid in series.items() if sid in self.manifest}
+        df = pd.DataFrame(data)
+        df.index.name = 'Date'
+        df = df.loc[start_date:end_date]
+        return df.dropna(how='all')
+
+
+def fetch_yield_data_incremental(
+    api_key: str,
+    store_dir: str,
+    start_date: str = None,
+    end_date: str = None,
+    max_workers: int = 8,
+    base_url: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Refresh a local yield store from FRED and return the requested panel.
+    
+    Only observations after each series' last stored date are requested.
+    Series whose stored history does not reach back to `start_date` are
+    refetched in full.
+    
+    Parameters:
+    -----------
+    api_key : str
+        FRED API key
+    store_dir : str
+        Directory of the persistent yield store
+    start_date : str, optional
+        Start date in 'YYYY-MM-DD' format
+    end_date : str, optional
+        End date in 'YYYY-MM-DD' format
+    max_workers : int
+        Maximum number of concurrent FRED requests
+    base_url : str, optional
+        Override for the FRED API root URL
     
+    Returns:
+    --------
+    pd.DataFrame
+        DataFrame with dates as index and maturities as columns
+    """
+    if api_key is None:
+        raise ValueError(
+            "FRED API key required. Get one from https://fred.stlouisfed.org/docs/api/api_key.html"
+        )
+    
+    store = YieldStore(store_dir)
+    end = pd.Timestamp(end_date) if end_date else None
+    
+    pending = {}
+    starts = {}
+    full_refresh = set()
+    for maturity, series_id in FRED_SERIES.items():
+        last = store.last_observation(series_id)
+        if not store.covers(series_id, start_date):
+            full_refresh.add(maturity)
+            starts[maturity] = start_date
+        elif end is not None and last >= end:
+            continue
+        else:
+            starts[maturity] = (last + pd.Timedelta(days=1)).strftime('%Y-%m-%d')
+        pending[maturity] = series_id
+    
+    if pending:
+        logger.info("Refreshing %d series in yield store %s...", len(pending), store_dir)
+        with span('fetch_yield_data', max_workers=max_workers, series=len(pending)), \
+                _fred_client(api_key, base_url, pool_size=max_workers) as fred:
+            fetched, _ = fetch_series_concurrently(
+                fred, pending, starts, end_date, max_workers=max_workers
+            )
+        with span('store_append'):
+            for maturity, data in fetched.items():
+                store.append(FRED_SERIES[maturity], data,
+                             replace=maturity in full_refresh, start_date=starts[maturity])
+                logger.debug("%s: %d new observations", maturity, len(data))
+    else:
+        logger.info("Yield store %s is up to date", store_dir)
+    
+    with span('store_load_panel'):
+        df = store.load_panel(FRED_SERIES, start_date, end_date)
+    if df.empty:
+        raise ValueError("No yield data could be fetched from FRED")
     return df
 
 
-def save_yield_data(df: pd.DataFrame, output_path: str) -> None:
+def save_yield_data(df: pd.DataFrame, output_path: str, **options) -> None:
     """
-    Save yield data to CSV file.
+    Save yield data to disk.
+    
+    The storage backend is chosen from the file extension ('.csv',
+    '.parquet', '.arrow'/'.feather' or '.npy'); see `src.storage`.
     
     Parameters:
     -----------
     df : pd.DataFrame
         Yield data DataFrame
     output_path : str
-        Path to save CSV file
+        Path to save file
+    **options
+        Backend-specific options, e.g. ``dtype=np.float32`` for '.npy'
     """
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    df.to_csv(output_path)
-    print(f"Saved yield data to {output_path}")
+    write_frame(df, output_path, **options)
+    logger.info("Saved yield data to %s", output_path)
 
 
-def load_yield_data(input_path: str) -> pd.DataFrame:
+def load_yield_data(
+    input_path: str,
+    dtype: Optional[Union[str, np.dtype]] = None,
+    **options
+) -> pd.DataFrame:
     """
-    Load yield data from CSV file.
+    Load yield data from disk.
+    
+    '.npy' files are memory-mapped, so the returned DataFrame is backed by
+    the file without an in-memory copy (unless it is stored in another
+    dtype than `dtype`).
     
     Parameters:
     -----------
     input_path : str
-        Path to CSV file
+        Path to a CSV, Parquet, Arrow IPC or '.npy' file
+    dtype : str or np.dtype, optional
+        Compute dtype ('float64' or 'float32'); default keeps the stored dtype
+    **options
+        Backend-specific options, e.g. ``mmap_mode='c'`` for '.npy'
     
     Returns:
     --------
     pd.DataFrame
         Yield data DataFrame with Date as index
     """
-    df = pd.read_csv(input_path, index_col=0, parse_dates=True)
+    dtype = resolve_dtype(dtype)
+    df = read_frame(input_path, **options)
+    # Only cast when needed: astype copies a memory-mapped panel even to its own dtype
+    if dtype is not None and (df.dtypes != dtype).any():
+        df = df.astype(dtype)
+    df.index.name = 'Date'
     return df
 
+
+def iter_yield_data(
+    input_path: str,
+    chunk_size: int = 100_000,
+    dtype: Optional[Union[str, np.dtype]] = None,
+    **options
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream stored yield data in date-ordered chunks.
+    
+    Parameters:
+    -----------
+    input_path : str
+        Path to a CSV, Parquet, Arrow IPC or '.npy' file
+    chunk_size : int
+        Maximum number of rows per chunk
+    dtype : str or np.dtype, optional
+        Compute dtype ('float64' or 'float32'); default keeps the stored dtype
+    **options
+        Backend-specific options, as for `load_yield_data`
+    
+    Returns:
+    --------
+    Iterator[pd.DataFrame]
+        Yield data chunks with Date as index
+    """
+    dtype = resolve_dtype(dtype)
+    for chunk in iter_frame(input_path, chunk_size, **options):
+        if dtype is not None and (chunk.dtypes != dtype).any():
+            chunk = chunk.astype(dtype)
+        chunk.index.name = 'Date'
+        yield chunk
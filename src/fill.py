@@ -0,0 +1,152 @@
+"""
+Fused missing-data fill kernels for yield panels.
+
+`fill_gaps` fills every gap of a C-contiguous (dates x maturities) array in
+place, in one pass, replacing the chained `ffill().bfill()` and
+`interpolate().ffill().bfill()` calls that each copy the panel. The kernel
+is compiled with numba when it is installed; otherwise a vectorised NumPy
+implementation with the same results is used. numba is looked up on first
+use, so importing the package stays cheap.
+"""
+
+import numpy as np
+from typing import Optional
+
+FILL_METHODS = ('forward_fill', 'interpolate')
+
+# Compiled kernel, or False when numba is unavailable; resolved by _compiled_kernel
+_compiled = None
+
+
+def _fill_rows(values: np.ndarray, interpolate: bool, max_gap: int, counts: np.ndarray) -> None:
+    """
+    Row-major fill loop (compiled by numba when available).
+    
+    A gap is closed when the next observation of its maturity is reached:
+    interior gaps take the previous value or a linear interpolation,
+    leading gaps the first observation and trailing gaps the last one.
+    Gaps longer than `max_gap` (if non-negative) are left as NaN.
+    """
+    n_rows, n_cols = values.shape
+    last = np.full(n_cols, -1, dtype=np.int64)
+    for i in range(n_rows):
+        for j in range(n_cols):
+            value = values[i, j]
+            if value != value:
+                continue
+            prev = last[j]
+            if prev < i - 1 and (max_gap < 0 or i - prev - 1 <= max_gap):
+                if prev < 0:
+                    for k in range(i):
+                        values[k, j] = value
+                elif interpolate:
+                    start = values[prev, j]
+                    step = (value - start) / (i - prev)
+                    for k in range(prev + 1, i):
+                        values[k, j] = step * (k - prev) + start
+                else:
+                    start = values[prev, j]
+                    for k in range(prev + 1, i):
+                        values[k, j] = start
+                counts[j] += i - prev - 1
+            last[j] = i
+    for j in range(n_cols):
+        prev = last[j]
+        if 0 <= prev < n_rows - 1 and (max_gap < 0 or n_rows - prev - 1 <= max_gap):
+            start = values[prev, j]
+            for k in range(prev + 1, n_rows):
+                values[k, j] = start
+            counts[j] += n_rows - prev - 1
+
+
+def _fill_numpy(values: np.ndarray, interpolate: bool, max_gap: int, counts: np.ndarray) -> None:
+    """
+    NumPy equivalent of `_fill_rows`.
+    
+    Works on the runs of missing values of each column, so after one
+    `isnan` pass the cost scales with the number of gaps, not the panel.
+    """
+    n_rows = len(values)
+    missing = np.isnan(values)
+    for j in np.flatnonzero(missing.any(axis=0)):
+        # Runs of missing values as [starts, ends) row ranges
+        edges = np.diff(missing[:, j].view(np.int8), prepend=np.int8(0), append=np.int8(0))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        if starts[0] == 0 and ends[0] == n_rows:
+            continue
+        if max_gap >= 0:
+            short = ends - starts <= max_gap
+            starts, ends = starts[short], ends[short]
+        lengths = ends - starts
+        if len(lengths) == 0:
+            continue
+        
+        column = values[:, j]
+        before = column[np.maximum(starts - 1, 0)]
+        after = column[np.minimum(ends, n_rows - 1)]
+        fill = np.where(starts == 0, after, before)
+        offsets = np.cumsum(lengths) - lengths
+        rows = np.arange(lengths.sum()) - np.repeat(offsets - starts, lengths)
+        filled = np.repeat(fill, lengths)
+        if interpolate:
+            interior = np.repeat((starts > 0) & (ends < n_rows), lengths)
+            prev = np.repeat(starts - 1, lengths)
+            step = np.repeat((after - before) / (ends - starts + 1), lengths)
+            filled = np.where(interior, step * (rows - prev) + np.repeat(before, lengths), filled)
+        column[rows] = filled
+        counts[j] += lengths.sum()
+
+
+def _compiled_kernel():
+    """Return the numba-compiled `_fill_rows`, or None without numba."""
+    global _compiled
+    if _compiled is None:
+        try:
+            import numba
+        except ImportError:
+            _compiled = False
+        else:
+            _compiled = numba.njit(cache=True, nogil=True)(_fill_rows)
+    return _compiled or None
+
+
+def fill_gaps(
+    values: np.ndarray,
+    method: str = 'forward_fill',
+    max_gap: Optional[int] = None
+) -> np.ndarray:
+    """
+    Fill the gaps of a yield panel in place.
+    
+    Equivalent to `ffill().bfill()` ('forward_fill') or
+    `interpolate(method='linear', limit_direction='both').ffill().bfill()`
+    ('interpolate') on every column. Maturities that are never observed stay
+    missing.
+    
+    Parameters:
+    -----------
+    values : np.ndarray
+        Writable, C-contiguous float array (dates x maturities)
+    method : str
+        'forward_fill' or 'interpolate'
+    max_gap : int, optional
+        Only fill runs of at most this many consecutive missing values;
+        longer runs are left missing (default: fill every gap)
+    
+    Returns:
+    --------
+    np.ndarray
+        Number of values filled in each column
+    """
+    if method not in FILL_METHODS:
+        raise ValueError(f"Unknown method: {method}")
+    if values.ndim != 2 or not values.flags.c_contiguous or not values.flags.writeable:
+        raise ValueError("fill_gaps requires a writable, C-contiguous 2-D array")
+    if max_gap is not None and max_gap < 0:
+        raise ValueError(f"max_gap must be non-negative, got {max_gap}")
+    
+    counts = np.zeros(values.shape[1], dtype=np.int64)
+    kernel = _compiled_kernel() or _fill_numpy
+    kernel(values, method == 'interpolate', -1 if max_gap is None else max_gap, counts)
+    return counts
@@ -0,0 +1,208 @@
+"""
+Batch runner for grids of preprocessing and PCA configurations.
+
+A grid spec is a JSON file mapping option names to lists of values; every
+combination is run in a process pool. The raw panel is written once to a
+memory-mapped '.npy' file that each worker opens read-only, so the data is
+shared between processes instead of being pickled into every task.
+
+Example spec:
+    {
+        "n_components": [2, 3],
+        "handle_missing": ["forward_fill", "interpolate"],
+        "standardize": ["demean", "zscore"],
+        "solver": ["eigh"],
+        "max_gap": [null, 5],
+        "dtype": ["float32"],
+        "date_range": [["2010-01-01", "2019-12-31"], ["2020-01-01", null]]
+    }
+"""
+
+import itertools
+import json
+import logging
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .data_fetch import load_yield_data
+from .preprocessing import preprocess_yield_data
+from .pca_analysis import compute_pca_results
+from .storage import write_frame
+
+logger = logging.getLogger(__name__)
+
+# Leading columns of the results table, then per-component metrics and elapsed_s
+_CONFIG_COLUMNS = ('n_components', 'handle_missing', 'max_gap', 'standardize', 'solver', 'dtype',
+                   'start', 'end', 'n_obs')
+_METRICS = ('variance', 'cumulative', 'interpretation')
+
+# Same defaults as the CLI, so an option left out of a spec matches a plain run
+GRID_DEFAULTS = {
+    'n_components': 3,
+    'handle_missing': 'forward_fill',
+    'max_gap': None,
+    'standardize': 'demean',
+    'solver': 'sklearn',
+    'dtype': None,
+    'date_range': [None, None],
+}
+
+# Raw panel shared by the worker processes, set by _init_worker
+_shared_data = None
+
+
+def load_grid_spec(path: str) -> Dict:
+    """
+    Read a grid spec from a JSON file.
+    
+    Parameters:
+    -----------
+    path : str
+        Path to the JSON spec
+    
+    Returns:
+    --------
+    Dict
+        Mapping of option names to lists of values
+    """
+    with open(path) as f:
+        spec = json.load(f)
+    unknown = set(spec) - set(GRID_DEFAULTS)
+    if unknown:
+        raise ValueError(f"Unknown grid options: {sorted(unknown)}")
+    return spec
+
+
+def expand_grid(spec: Dict, defaults: Optional[Dict] = None) -> List[Dict]:
+    """
+    Expand a grid spec into the list of all configurations.
+    
+    Options missing from the spec take their value from `defaults` or
+    `GRID_DEFAULTS`; scalar values are treated as single-element lists.
+    
+    Parameters:
+    -----------
+    spec : Dict
+        Mapping of option names to lists of values
+    defaults : Dict, optional
+        Values overriding `GRID_DEFAULTS` for options missing from the spec
+        (e.g. the options of the CLI run)
+    
+    Returns:
+    --------
+    List[Dict]
+        One dictionary per configuration
+    """
+    defaults = {**GRID_DEFAULTS, **(defaults or {})}
+    options = {}
+    for name, default in defaults.items():
+        values = spec.get(name, [default])
+        if name == 'date_range':
+            # A single [start, end] pair is one value, not two
+            if len(values) == 2 and not isinstance(values[0], (list, tuple)):
+                values = [values]
+        elif not isinstance(values, list):
+            values = [values]
+        options[name] = values
+    
+    names = list(options)
+    return [dict(zip(names, combo)) for combo in itertools.product(*options.values())]
+
+
+def _init_worker(data_path: str) -> None:
+    """Open the shared memory-mapped panel once per worker process."""
+    global _shared_data
+    # Per-configuration progress would interleave across workers; forked
+    # workers inherit the parent's logging setup, so keep only warnings
+    logging.getLogger(__package__).setLevel(logging.WARNING)
+    _shared_data = load_yield_data(data_path)
+
+
+def _run_config(config: Dict) -> Dict:
+    """
+    Preprocess and fit PCA for one configuration on the shared panel.
+    
+    Returns:
+    --------
+    Dict
+        Flat result row: configuration, sample size, explained variance,
+        interpretations and elapsed time
+    """
+    started = time.perf_counter()
+    start, end = config['date_range']
+    df = _shared_data.loc[start:end]
+    
+    df_processed, _, _ = preprocess_yield_data(
+        df, handle_missing=config['handle_missing'], standardize=config['standardize'],
+        dtype=config['dtype'], max_gap=config['max_gap']
+    )
+    results = compute_pca_results(
+        df_processed, n_components=config['n_components'], solver=config['solver']
+    )
+    
+    row = {
+        'n_components': config['n_components'],
+        'handle_missing': config['handle_missing'],
+        'max_gap': config['max_gap'],
+        'standardize': config['standardize'],
+        'solver': config['solver'],
+        'dtype': config['dtype'],
+        'start': start,
+        'end': end,
+        'n_obs': len(df_processed),
+    }
+    for i, (var, cum_var) in enumerate(zip(results['explained_variance'],
+                                           results['cumulative_variance'])):
+        row[f'PC{i+1}_variance'] = var
+        row[f'PC{i+1}_cumulative'] = cum_var
+        row[f'PC{i+1}_interpretation'] = results['interpretations'].get(f'PC{i+1}', 'N/A')
+    row['elapsed_s'] = time.perf_counter() - started
+    return row
+
+
+def run_grid(
+    df_raw: pd.DataFrame,
+    configs: List[Dict],
+    max_workers: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Run every configuration in a process pool and collect one results table.
+    
+    Parameters:
+    -----------
+    df_raw : pd.DataFrame
+        Raw yield data (dates x maturities)
+    configs : List[Dict]
+        Configurations from `expand_grid`
+    max_workers : int, optional
+        Number of worker processes (default: one per CPU)
+    
+    Returns:
+    --------
+    pd.DataFrame
+        One row per configuration, in the order of `configs`
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(configs)))
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_path = os.path.join(tmp_dir, 'yield_data.npy')
+        write_frame(df_raw.astype(np.float64), data_path)
+        
+        logger.info("Running %d configurations on %d workers...", len(configs), max_workers)
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(data_path,)) as pool:
+            rows = list(pool.map(_run_config, configs))
+    
+    # Rows of configs with more components have more metric columns; keep the
+    # config columns first and elapsed_s last whatever order they appear in
+    n_max = max((row['n_components'] for row in rows), default=0)
+    metrics = [f'PC{i+1}_{metric}' for i in range(n_max) for metric in _METRICS]
+    return pd.DataFrame(rows).reindex(columns=[*_CONFIG_COLUMNS, *metrics, 'elapsed_s'])
@@ -0,0 +1,302 @@
+"""
+Persisted PCA model artefact for fast out-of-sample projection.
+
+A fitted model is stored as a single compact '.npz' file holding the
+loadings, preprocessing statistics and metadata, so consumers can score
+new curves without refitting.
+"""
+
+import hashlib
+import json
+import os
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional
+
+from .core import project
+from .preprocessing import align_maturities, handle_missing_data
+
+
+def data_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Compute a content hash of a yield DataFrame.
+    
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Yield data (dates x maturities)
+    
+    Returns:
+    --------
+    str
+        Hex SHA-256 digest of the index, columns and values
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps([str(c) for c in df.columns]).encode())
+    digest.update(np.ascontiguousarray(df.index.values).tobytes()
+                  if isinstance(df.index, pd.DatetimeIndex)
+                  else json.dumps([str(i) for i in df.index]).encode())
+    digest.update(np.ascontiguousarray(df.to_numpy(dtype=np.float64)).tobytes())
+    return digest.hexdigest()
+
+
+class YieldCurveModel:
+    """
+    Fitted yield curve PCA model that projects new curves in one matrix multiply.
+    
+    Parameters:
+    -----------
+    maturities : list
+        Maturity labels in model order
+    loadings : np.ndarray
+        Component loadings (maturities x components)
+    means : np.ndarray
+        Per-maturity means removed during standardization
+    stds : np.ndarray
+        Per-maturity scales applied during standardization
+    pca_mean : np.ndarray
+        Mean of the standardized data removed by the PCA fit
+    explained_variance : np.ndarray
+        Explained variance ratio of each component
+    handle_missing : str
+        Missing-data method used in preprocessing
+    standardize : str
+        Standardization method used in preprocessing
+    fingerprint : str
+        `data_fingerprint` of the raw training data
+    interpretations : dict, optional
+        Mapping of component names to interpretations
+    max_gap : int, optional
+        Longest run of missing values filled in preprocessing
+    solver : str, optional
+        PCA solver used for the fit (None when unknown)
+    reference : str, optional
+        `data_fingerprint` of the reference loadings the components were
+        aligned to, if any
+    """
+    
+    def __init__(
+        self,
+        maturities: List[str],
+        loadings: np.ndarray,
+        means: np.ndarray,
+        stds: np.ndarray,
+        pca_mean: np.ndarray,
+        explained_variance: np.ndarray,
+        handle_missing: str,
+        standardize: str,
+        fingerprint: str,
+        interpretations: Optional[Dict[str, str]] = None,
+        max_gap: Optional[int] = None,
+        solver: Optional[str] = None,
+        reference: Optional[str] = None
+    ):
+        self.maturities = list(maturities)
+        self.loadings = np.asarray(loadings, dtype=np.float64)
+        self.means = np.asarray(means, dtype=np.float64)
+        self.stds = np.asarray(stds, dtype=np.float64)
+        self.pca_mean = np.asarray(pca_mean, dtype=np.float64)
+        self.explained_variance = np.asarray(explained_variance, dtype=np.float64)
+        self.handle_missing = handle_missing
+        self.standardize = standardize
+        self.fingerprint = fingerprint
+        self.interpretations = dict(interpretations or {})
+        self.max_gap = max_gap
+        self.solver = solver
+        self.reference = reference
+        
+        # Fold standardization and PCA centring into one affine map:
+        # scores = ((x - means) / stds - pca_mean) @ loadings = x @ weights - offset
+        self.weights = self.loadings / self.stds[:, np.newaxis]
+        self.offset = (self.means / self.stds + self.pca_mean) @ self.loadings
+    
+    @property
+    def components(self) -> List[str]:
+        """Component names (PC1, PC2, ...)."""
+        return [f'PC{i+1}' for i in range(self.loadings.shape[1])]
+    
+    @property
+    def fit_options(self) -> Dict:
+        """Options the model was fitted with; a refit is needed when any differ."""
+        return {
+            'handle_missing': self.handle_missing,
+            'standardize': self.standardize,
+            'max_gap': self.max_gap,
+            'solver': self.solver,
+            'reference': self.reference,
+        }
+    
+    @classmethod
+    def from_results(
+        cls,
+        pca_results: Dict,
+        means: np.ndarray,
+        stds: np.ndarray,
+        df_raw: pd.DataFrame,
+        handle_missing: str = 'forward_fill',
+        standardize: str = 'demean',
+        max_gap: Optional[int] = None,
+        solver: str = 'sklearn',
+        reference_loadings: Optional[pd.DataFrame] = None
+    ) -> 'YieldCurveModel':
+        """
+        Build a model from `compute_pca_results` output and preprocessing statistics.
+        
+        Parameters:
+        -----------
+        pca_results : Dict
+            Dictionary returned by `compute_pca_results`
+        means : np.ndarray
+            Means returned by `preprocess_yield_data`
+        stds : np.ndarray
+            Stds returned by `preprocess_yield_data`
+        df_raw : pd.DataFrame
+            Raw yield data the model was fitted on (for the fingerprint)
+        handle_missing : str
+            Missing-data method used in preprocessing
+        standardize : str
+            Standardization method used in preprocessing
+        max_gap : int, optional
+            Longest run of missing values filled in preprocessing
+        solver : str
+            PCA solver passed to `compute_pca_results`
+        reference_loadings : pd.DataFrame, optional
+            Reference loadings passed to `compute_pca_results`
+        
+        Returns:
+        --------
+        YieldCurveModel
+            Model artefact
+        """
+        loadings = pca_results['loadings']
+        # Centring applied by the PCA fit itself (close to zero for demeaned data)
+        pca_model = pca_results.get('pca_model')
+        pca_mean = getattr(pca_model, 'mean_', np.zeros(len(loadings)))
+        return cls(
+            maturities=list(loadings.index),
+            loadings=loadings.values,
+            means=means,
+            stds=stds,
+            pca_mean=pca_mean,
+            explained_variance=pca_results['explained_variance'],
+            handle_missing=handle_missing,
+            standardize=standardize,
+            fingerprint=data_fingerprint(df_raw),
+            interpretations=pca_results.get('interpretations'),
+            max_gap=max_gap,
+            solver=solver,
+            reference=data_fingerprint(reference_loadings) if reference_loadings is not None else None
+        )
+    
+    def project(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Score new yield curves with the fitted model.
+        
+        Parameters:
+        -----------
+        df : pd.DataFrame
+            Raw yield data (dates x maturities) containing the model maturities
+        
+        Returns:
+        --------
+        pd.DataFrame
+            Component scores (dates x components)
+        """
+        missing = [m for m in self.maturities if m not in df.columns]
+        if missing:
+            raise ValueError(f"Data is missing model maturities: {missing}")
+        df = df[self.maturities] if list(df.columns) != self.maturities else df
+        df = handle_missing_data(df, method=self.handle_missing, max_gap=self.max_gap)
+        scores = project(df.to_numpy(), self.weights)
+        scores -= self.offset
+        return pd.DataFrame(scores, index=df.index, columns=self.components, copy=False)
+    
+    def results(self, df: pd.DataFrame) -> Dict:
+        """
+        Build a results dictionary in the `compute_pca_results` layout.
+        
+        Parameters:
+        -----------
+        df : pd.DataFrame
+            Raw yield data to score
+        
+        Returns:
+        --------
+        Dict
+            Dictionary containing the model, loadings, scores, explained
+            variance, and interpretations
+        """
+        return {
+            'pca_model': self,
+            'loadings': pd.DataFrame(self.loadings, index=self.maturities, columns=self.components),
+            'scores': self.project(align_maturities(df)),
+            'explained_variance': self.explained_variance,
+            'cumulative_variance': np.cumsum(self.explained_variance),
+            'interpretations': dict(self.interpretations)
+        }
+    
+    def save(self, path: str) -> None:
+        """
+        Save the model to a compact '.npz' file.
+        
+        Parameters:
+        -----------
+        path : str
+            Output path
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        metadata = {
+            'maturities': self.maturities,
+            'handle_missing': self.handle_missing,
+            'standardize': self.standardize,
+            'fingerprint': self.fingerprint,
+            'interpretations': self.interpretations,
+            'max_gap': self.max_gap,
+            'solver': self.solver,
+            'reference': self.reference,
+        }
+        with open(path, 'wb') as f:
+            np.savez(
+                f,
+                loadings=self.loadings,
+                means=self.means,
+                stds=self.stds,
+                pca_mean=self.pca_mean,
+                explained_variance=self.explained_variance,
+                metadata=np.asarray(json.dumps(metadata))
+            )
+
+
+def load_model(path: str) -> YieldCurveModel:
+    """
+    Load a model saved with `YieldCurveModel.save`.
+    
+    Parameters:
+    -----------
+    path : str
+        Path to the '.npz' model file
+    
+    Returns:
+    --------
+    YieldCurveModel
+        Loaded model
+    """
+    with np.load(path) as data:
+        metadata = json.loads(str(data['metadata']))
+        return YieldCurveModel(
+            maturities=metadata['maturities'],
+            loadings=data['loadings'],
+            means=data['means'],
+            stds=data['stds'],
+            pca_mean=data['pca_mean'],
+            explained_variance=data['explained_variance'],
+            handle_missing=metadata['handle_missing'],
+            standardize=metadata['standardize'],
+            fingerprint=metadata['fingerprint'],
+            interpretations=metadata['interpretations'],
+            max_gap=metadata.get('max_gap'),
+            solver=metadata.get('solver'),
+            reference=metadata.get('reference')
+        )
@@ -5,20 +5,39 @@ This module applies PCA to identify the main factors driving yield curve changes
 level, slope, and curvature.
 """
 
+import logging
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
-from sklearn.decomposition import PCA
-from typing import Tuple, Dict
+from typing import TYPE_CHECKING, Tuple, Dict, Iterable, Iterator, List, Optional, Union
+
+from .core import center, covariance, eigh_components, project
+from .data_fetch import FRED_SERIES
+from .profiling import span
+
+if TYPE_CHECKING:
+    from sklearn.decomposition import PCA
+
+logger = logging.getLogger(__name__)
+
+SOLVERS = ('sklearn', 'eigh')
 
 
 def apply_pca(
     df: pd.DataFrame,
     n_components: int = 3,
-    random_state: int = 42
-) -> Tuple[PCA, pd.DataFrame, pd.DataFrame]:
+    random_state: int = 42,
+    solver: str = 'sklearn'
+) -> Tuple['PCA', pd.DataFrame, pd.DataFrame]:
     """
     Apply PCA to yield curve data.
     
+    float32 data gives float32 scores. The 'eigh' solver accumulates the
+    covariance in float64 for any input dtype; sklearn's SVD runs in the
+    dtype of the data, so weak components are less accurate in float32.
+    
     Parameters:
     -----------
     df : pd.DataFrame
@@ -27,42 +46,527 @@ def apply_pca(
         Number of principal components to compute
     random_state : int
         Random state for reproducibility
+    solver : str
+        PCA solver:
+        - 'sklearn': `sklearn.decomposition.PCA` (SVD of the data matrix)
+        - 'eigh': Eigendecomposition of the maturities x maturities
+          covariance (`CovariancePCA`), much cheaper for long histories
     
     Returns:
     --------
     Tuple[PCA, pd.DataFrame, pd.DataFrame]
         PCA model, component loadings (as DataFrame), and component scores (as DataFrame)
     """
-    print(f"\nApplying PCA with {n_components} components...")
+    logger.info("Applying PCA with %d components...", n_components)
     
     # Fit PCA
-    pca = PCA(n_components=n_components, random_state=random_state)
-    scores = pca.fit_transform(df.values)
+    if solver == 'sklearn':
+        # Deferred: importing scikit-learn dominates the package import time
+        from sklearn.decomposition import PCA
+        pca = PCA(n_components=n_components, random_state=random_state)
+    elif solver == 'eigh':
+        pca = CovariancePCA(n_components=n_components)
+    else:
+        raise ValueError(f"Unknown solver: {solver}")
+    with span('pca_fit', solver=solver, n_components=n_components, rows=len(df)):
+        scores = pca.fit_transform(df.values)
     
     # Create loadings DataFrame (components as rows, maturities as columns)
     loadings = pd.DataFrame(
         pca.components_.T,
         index=df.columns,
-        columns=[f'PC{i+1}' for i in range(n_components)]
+        columns=[f'PC{i+1}' for i in range(n_components)],
+        copy=False
     )
     
     # Create scores DataFrame (dates as index, components as columns)
     scores_df = pd.DataFrame(
         scores,
         index=df.index,
-        columns=[f'PC{i+1}' for i in range(n_components)]
+        columns=[f'PC{i+1}' for i in range(n_components)],
+        copy=False
     )
     
-    # Print explained variance
+    # Log explained variance
     explained_variance = pca.explained_variance_ratio_
-    print(f"\nExplained Variance:")
-    for i, var in enumerate(explained_variance):
-        print(f"  PC{i+1}: {var:.2%}")
-    print(f"  Total: {explained_variance.sum():.2%}")
+    logger.info("Explained variance: %s (total %.2f%%)",
+                ', '.join(f'PC{i+1} {var:.2%}' for i, var in enumerate(explained_variance)),
+                explained_variance.sum() * 100)
     
     return pca, loadings, scores_df
 
 
+def align_components(
+    loadings: np.ndarray,
+    reference: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Match the order and sign of components to a reference set.
+    
+    Components are paired greedily by the absolute cosine similarity
+    (uncentred correlation) of their loading vectors, most similar pair
+    first, then each matched component is flipped to correlate positively
+    with its reference. All leading (stack) axes are processed at once, so
+    a whole rolling-window cube is aligned in a few array operations.
+    
+    Parameters:
+    -----------
+    loadings : np.ndarray
+        Loadings (maturities x components), or a stack of them
+        (e.g. windows x maturities x components)
+    reference : np.ndarray
+        Reference loadings (maturities x components), broadcastable to
+        `loadings`
+    
+    Returns:
+    --------
+    Tuple[np.ndarray, np.ndarray, np.ndarray]
+        Aligned loadings, the component order (index into the original
+        components for each reference component) and the applied signs,
+        each with the stack axes of `loadings`
+    """
+    loadings = np.asarray(loadings, dtype=np.float64)
+    reference = np.asarray(reference, dtype=np.float64)
+    if reference.shape[-2:] != loadings.shape[-2:]:
+        raise ValueError(
+            f"Reference shape {reference.shape[-2:]} does not match loadings shape {loadings.shape[-2:]}"
+        )
+    n_components = loadings.shape[-1]
+    
+    # similarity[..., i, j]: reference component i vs new component j
+    similarity = np.einsum('...mi,...mj->...ij', reference, loadings)
+    similarity = np.broadcast_to(similarity, loadings.shape[:-2] + (n_components, n_components))
+    remaining = np.abs(similarity).copy()
+    order = np.zeros(remaining.shape[:-1], dtype=np.intp)
+    
+    for _ in range(n_components):
+        flat = remaining.reshape(remaining.shape[:-2] + (-1,)).argmax(axis=-1)
+        ref_idx, new_idx = np.divmod(flat, n_components)
+        np.put_along_axis(order, ref_idx[..., np.newaxis], new_idx[..., np.newaxis], axis=-1)
+        np.put_along_axis(remaining, ref_idx[..., np.newaxis, np.newaxis],
+                          -np.inf, axis=-2)
+        np.put_along_axis(remaining, new_idx[..., np.newaxis, np.newaxis],
+                          -np.inf, axis=-1)
+    
+    matched = np.take_along_axis(similarity, order[..., np.newaxis, :], axis=-1)
+    signs = np.sign(np.diagonal(matched, axis1=-2, axis2=-1))
+    signs[signs == 0] = 1
+    aligned = np.take_along_axis(loadings, order[..., np.newaxis, :], axis=-1) * signs[..., np.newaxis, :]
+    return aligned, order, signs
+
+
+class CovariancePCA:
+    """
+    PCA fitted by eigendecomposition of the sample covariance matrix.
+    
+    With a handful of maturities and thousands of dates, forming the
+    maturities x maturities Gram matrix in one matrix product and calling
+    `np.linalg.eigh` is far cheaper than an SVD of the full data matrix.
+    The data is never centred in a copy: the covariance and scores are
+    corrected for the mean algebraically. Exposes the attributes of
+    sklearn's `PCA` that the rest of the package uses, with the sign of
+    each component fixed by `flip_signs`. The arithmetic is done by the
+    `core` kernels.
+    
+    Parameters:
+    -----------
+    n_components : int
+        Number of principal components to keep
+    """
+    
+    def __init__(self, n_components: int = 3):
+        self.n_components = n_components
+    
+    def fit(self, X: np.ndarray) -> 'CovariancePCA':
+        """
+        Fit the model to X (dates x maturities).
+        
+        Returns:
+        --------
+        CovariancePCA
+            The fitted estimator
+        """
+        X = np.asarray(X)
+        n_samples, n_features = X.shape
+        if not 1 <= self.n_components <= n_features:
+            raise ValueError(f"n_components must be between 1 and {n_features}, got {self.n_components}")
+        
+        self.mean_ = X.mean(axis=0, dtype=np.float64)
+        components, eigenvalues = eigh_components(covariance(X, self.mean_), self.n_components)
+        
+        self.n_samples_ = n_samples
+        self.n_features_in_ = n_features
+        self.components_ = components.T
+        self.explained_variance_ = eigenvalues[:self.n_components]
+        self.explained_variance_ratio_ = self.explained_variance_ / eigenvalues.sum()
+        self.singular_values_ = np.sqrt(self.explained_variance_ * (n_samples - 1))
+        return self
+    
+    def transform(self, X: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Project X onto the fitted components, into `out` when given."""
+        return project(np.asarray(X), self.components_.T, self.mean_, out=out)
+    
+    def fit_transform(self, X: np.ndarray) -> np.ndarray:
+        """Fit the model and return the scores of X."""
+        return self.fit(X).transform(X)
+
+
+def rolling_pca(
+    df: pd.DataFrame,
+    window: int,
+    step: int = 1,
+    n_components: int = 3,
+    reference: Optional[np.ndarray] = None
+) -> Dict:
+    """
+    Apply PCA over trailing windows with one batched eigendecomposition.
+    
+    Window covariance matrices are assembled from cumulative sums of the
+    observations and their outer products, then all windows are
+    eigendecomposed in a single stacked `np.linalg.eigh` call. Each window
+    is centred on its own mean, matching a separate `apply_pca` fit per
+    window up to the sign of each component.
+    
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Preprocessed yield data (dates x maturities), without missing values
+    window : int
+        Number of observations in each window
+    step : int
+        Number of observations between consecutive window ends
+    n_components : int
+        Number of principal components to keep
+    reference : np.ndarray or pd.DataFrame, optional
+        Reference loadings (maturities x components); when given, every
+        window is reordered and sign-aligned to it with `align_components`
+    
+    Returns:
+    --------
+    Dict
+        Dictionary containing the loadings cube (windows x maturities x
+        components), explained variance ratios and interpretation labels
+        (windows x components), window end dates, maturities and component
+        names
+    """
+    values = df.to_numpy(dtype=np.float64)
+    n_obs, n_maturities = values.shape
+    
+    if window < 2 or window > n_obs:
+        raise ValueError(f"window must be between 2 and {n_obs}, got {window}")
+    if step < 1:
+        raise ValueError(f"step must be positive, got {step}")
+    if n_components > n_maturities:
+        raise ValueError(f"n_components must be at most {n_maturities}, got {n_components}")
+    if np.isnan(values).any():
+        raise ValueError("rolling_pca requires data without missing values")
+    
+    # Centre on the full-sample mean to limit cancellation in the running sums
+    centred = center(values, values.mean(axis=0))
+    
+    # Cumulative sums of x_t and x_t x_t^T, with a leading zero row
+    first = np.zeros((n_obs + 1, n_maturities))
+    np.cumsum(centred, axis=0, out=first[1:])
+    second = np.zeros((n_obs + 1, n_maturities, n_maturities))
+    np.einsum('ti,tj->tij', centred, centred, out=second[1:])
+    np.cumsum(second[1:], axis=0, out=second[1:])
+    
+    ends = np.arange(window, n_obs + 1, step)
+    starts = ends - window
+    sums = first[ends] - first[starts]
+    cross = second[ends] - second[starts]
+    covariances = (cross - np.einsum('wi,wj->wij', sums, sums) / window) / (window - 1)
+    
+    loadings, eigenvalues = eigh_components(covariances, n_components)
+    
+    total_variance = eigenvalues.sum(axis=1, keepdims=True)
+    explained_variance = eigenvalues[:, :n_components] / np.where(total_variance > 0, total_variance, 1)
+    
+    if reference is not None:
+        if isinstance(reference, pd.DataFrame):
+            reference = reference.reindex(df.columns).iloc[:, :n_components].values
+        loadings, order, _ = align_components(loadings, reference)
+        explained_variance = np.take_along_axis(explained_variance, order, axis=-1)
+    
+    return {
+        'loadings': loadings,
+        'explained_variance': explained_variance,
+        'interpretations': classify_components(loadings, maturity_months(df.columns)),
+        'window_end': df.index[ends - 1],
+        'maturities': list(df.columns),
+        'components': [f'PC{i+1}' for i in range(n_components)]
+    }
+
+
+def _bootstrap_block_sums(values: np.ndarray, length: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Sums of x_t and flattened x_t x_t^T over every run of `length` consecutive rows."""
+    n_obs, n_maturities = values.shape
+    first = np.zeros((n_obs + 1, n_maturities))
+    np.cumsum(values, axis=0, out=first[1:])
+    second = np.zeros((n_obs + 1, n_maturities * n_maturities))
+    np.einsum('ti,tj->tij', values, values, out=second[1:].reshape(n_obs, n_maturities, n_maturities))
+    np.cumsum(second[1:], axis=0, out=second[1:])
+    return first[length:] - first[:-length], second[length:] - second[:-length]
+
+
+# Block sums shared by bootstrap worker processes, set by _init_bootstrap_worker
+_bootstrap_stats = None
+
+
+def _init_bootstrap_worker(stats: Dict) -> None:
+    global _bootstrap_stats
+    _bootstrap_stats = stats
+
+
+def _bootstrap_replicates(
+    task: Tuple[np.random.SeedSequence, int],
+    stats: Optional[Dict] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Eigendecompose a batch of moving-block bootstrap replicates.
+    
+    Each replicate's covariance is assembled from precomputed block sums:
+    the number of times every block start is drawn forms a (replicates x
+    starts) count matrix, so all sums come from one matrix product and all
+    replicates are decomposed in one stacked `np.linalg.eigh` call.
+    """
+    seed, n_replicates = task
+    stats = stats if stats is not None else _bootstrap_stats
+    rng = np.random.default_rng(seed)
+    block_first, block_second = stats['blocks']
+    n_obs, n_maturities = stats['n_obs'], block_first.shape[1]
+    n_starts = len(block_first)
+    
+    starts = rng.integers(0, n_starts, size=(n_replicates, stats['n_blocks']))
+    starts += np.arange(n_replicates)[:, np.newaxis] * n_starts
+    counts = np.bincount(starts.ravel(), minlength=n_replicates * n_starts)
+    counts = counts.reshape(n_replicates, n_starts).astype(np.float64)
+    sums = counts @ block_first
+    cross = counts @ block_second
+    
+    # A shorter final block tops every replicate up to the sample length
+    if stats['tail'] is not None:
+        tail_first, tail_second = stats['tail']
+        tail_starts = rng.integers(0, len(tail_first), size=n_replicates)
+        sums += tail_first[tail_starts]
+        cross += tail_second[tail_starts]
+    
+    cross = cross.reshape(n_replicates, n_maturities, n_maturities)
+    covariances = (cross - np.einsum('bi,bj->bij', sums, sums) / n_obs) / (n_obs - 1)
+    
+    n_components = stats['n_components']
+    loadings, eigenvalues = eigh_components(covariances, n_components)
+    explained_variance = eigenvalues[:, :n_components] / eigenvalues.sum(axis=1, keepdims=True)
+    return loadings, explained_variance
+
+
+def bootstrap_pca(
+    df: pd.DataFrame,
+    n_boot: int = 1000,
+    block_size: Optional[int] = None,
+    n_components: int = 3,
+    confidence: float = 0.95,
+    random_state: int = 42,
+    max_workers: Optional[int] = None,
+    batch_size: int = 100
+) -> Dict:
+    """
+    Moving-block bootstrap confidence intervals for loadings and explained variance.
+    
+    Each replicate resamples the panel as consecutive blocks of rows, which
+    keeps the serial correlation of daily yields within blocks. Replicates
+    are eigendecomposed in batches (see `_bootstrap_replicates`), aligned in
+    order and sign to the full-sample loadings with `align_components`, and
+    summarised by percentile bands. Batches are spread over a process pool;
+    every batch draws from its own child of one `np.random.SeedSequence`,
+    so results depend on `random_state` and `batch_size` but not on
+    `max_workers`.
+    
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Preprocessed yield data (dates x maturities), without missing values
+    n_boot : int
+        Number of bootstrap replicates
+    block_size : int, optional
+        Rows per resampled block (default: cube root of the sample length)
+    n_components : int
+        Number of principal components
+    confidence : float
+        Coverage of the percentile bands
+    random_state : int
+        Seed for reproducible resampling
+    max_workers : int, optional
+        Worker processes (default: one per CPU; 1 runs in-process)
+    batch_size : int
+        Replicates per task
+    
+    Returns:
+    --------
+    Dict
+        Dictionary containing the full-sample loadings and explained
+        variance, their lower and upper bands ('loadings_lower',
+        'loadings_upper', 'explained_variance_lower',
+        'explained_variance_upper'), the aligned replicates
+        ('replicate_loadings': replicates x maturities x components,
+        'replicate_explained_variance': replicates x components) and the
+        block size used
+    """
+    values = df.to_numpy(dtype=np.float64)
+    n_obs, n_maturities = values.shape
+    if np.isnan(values).any():
+        raise ValueError("bootstrap_pca requires data without missing values")
+    if n_components > n_maturities:
+        raise ValueError(f"n_components must be at most {n_maturities}, got {n_components}")
+    if not 0 < confidence < 1:
+        raise ValueError(f"confidence must be between 0 and 1, got {confidence}")
+    if block_size is None:
+        block_size = max(1, int(round(n_obs ** (1 / 3))))
+    if not 1 <= block_size <= n_obs // 2:
+        raise ValueError(f"block_size must be between 1 and {n_obs // 2}, got {block_size}")
+    
+    # Full-sample fit, the reference for aligning replicates
+    pca = CovariancePCA(n_components=n_components).fit(values)
+    reference = pca.components_.T
+    
+    # Centre on the full-sample mean to limit cancellation in the block sums
+    centred = center(values, pca.mean_)
+    n_blocks, tail = divmod(n_obs, block_size)
+    stats = {
+        'blocks': _bootstrap_block_sums(centred, block_size),
+        'tail': _bootstrap_block_sums(centred, tail) if tail else None,
+        'n_blocks': n_blocks,
+        'n_obs': n_obs,
+        'n_components': n_components,
+    }
+    
+    n_tasks = -(-n_boot // batch_size)
+    seeds = np.random.SeedSequence(random_state).spawn(n_tasks)
+    tasks = [(seed, min(batch_size, n_boot - i * batch_size)) for i, seed in enumerate(seeds)]
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, n_tasks))
+    
+    with span('bootstrap_replicates', n_boot=n_boot, workers=max_workers):
+        if max_workers == 1:
+            batches = [_bootstrap_replicates(task, stats) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_bootstrap_worker,
+                                     initargs=(stats,)) as pool:
+                batches = list(pool.map(_bootstrap_replicates, tasks))
+    
+    replicate_loadings = np.concatenate([batch[0] for batch in batches])
+    replicate_variance = np.concatenate([batch[1] for batch in batches])
+    replicate_loadings, order, _ = align_components(replicate_loadings, reference)
+    replicate_variance = np.take_along_axis(replicate_variance, order, axis=-1)
+    
+    tail_pct = 50 * (1 - confidence)
+    loadings_bands = np.percentile(replicate_loadings, [tail_pct, 100 - tail_pct], axis=0)
+    variance_bands = np.percentile(replicate_variance, [tail_pct, 100 - tail_pct], axis=0)
+    
+    components = [f'PC{i+1}' for i in range(n_components)]
+    return {
+        'loadings': pd.DataFrame(reference, index=df.columns, columns=components),
+        'loadings_lower': pd.DataFrame(loadings_bands[0], index=df.columns, columns=components),
+        'loadings_upper': pd.DataFrame(loadings_bands[1], index=df.columns, columns=components),
+        'explained_variance': pca.explained_variance_ratio_,
+        'explained_variance_lower': variance_bands[0],
+        'explained_variance_upper': variance_bands[1],
+        'replicate_loadings': replicate_loadings,
+        'replicate_explained_variance': replicate_variance,
+        'block_size': block_size
+    }
+
+
+_MATURITY_PATTERN = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([DWMY])\s*$', re.IGNORECASE)
+_MONTHS_PER_UNIT = {'D': 12 / 365.25, 'W': 12 / 52.1775, 'M': 1.0, 'Y': 12.0}
+
+# Tenor of each FRED series id, for panels labelled with raw ids such as 'DGS10'
+_FRED_TENORS = {series_id: tenor for tenor, series_id in FRED_SERIES.items()}
+
+# Standard Treasury tenors in months, assumed by column order for unparseable labels
+_DEFAULT_MONTHS = np.array([1, 3, 6, 12, 24, 36, 60, 84, 120, 240, 360], dtype=np.float64)
+
+
+def maturity_months(labels: Iterable[str]) -> np.ndarray:
+    """
+    Convert maturity labels such as '1M', '10Y' or '2W' to months.
+    
+    FRED series ids (e.g. 'DGS10') are mapped to their tenors. If any label
+    cannot be parsed, the columns are assumed to follow the standard
+    Treasury tenors (1M, 3M, ..., 30Y) in order, or to be evenly spaced
+    when there are more of them.
+    
+    Parameters:
+    -----------
+    labels : Iterable[str]
+        Maturity labels
+    
+    Returns:
+    --------
+    np.ndarray
+        Maturities in months
+    """
+    labels = [str(label) for label in labels]
+    months = []
+    for label in labels:
+        match = _MATURITY_PATTERN.match(_FRED_TENORS.get(label.strip().upper(), label))
+        if match is None:
+            if len(labels) <= len(_DEFAULT_MONTHS):
+                return _DEFAULT_MONTHS[:len(labels)].copy()
+            return np.arange(1, len(labels) + 1, dtype=np.float64)
+        months.append(float(match.group(1)) * _MONTHS_PER_UNIT[match.group(2).upper()])
+    return np.array(months)
+
+
+def classify_components(loadings: np.ndarray, maturities: np.ndarray) -> np.ndarray:
+    """
+    Label components as level, slope or curvature factors for stacked loadings.
+    
+    All windows and components are classified together with array
+    operations. A component whose loadings share one sign is a level factor
+    if they are flat (std < 0.1), a slope factor if they correlate with
+    maturity (|r| > 0.7), and a level factor with variation otherwise;
+    loadings that change sign are curvature.
+    
+    Parameters:
+    -----------
+    loadings : np.ndarray
+        Loadings (maturities x components), or a stack of them such as the
+        (windows x maturities x components) cube from `rolling_pca`
+    maturities : np.ndarray
+        Maturity of each row of the loadings, in months (see `maturity_months`)
+    
+    Returns:
+    --------
+    np.ndarray
+        Labels with the loadings' shape minus the maturity axis
+    """
+    loadings = np.asarray(loadings, dtype=np.float64)
+    maturities = np.asarray(maturities, dtype=np.float64)
+    signs = np.sign(loadings)
+    
+    same_sign = np.all(signs == signs[..., :1, :], axis=-2)
+    flat = loadings.std(axis=-2) < 0.1
+    
+    # Pearson correlation of every component with maturity
+    maturities_centred = maturities - maturities.mean()
+    loadings_centred = loadings - loadings.mean(axis=-2, keepdims=True)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        correlation = np.einsum('m,...mk->...k', maturities_centred, loadings_centred) / (
+            np.linalg.norm(maturities_centred) * np.linalg.norm(loadings_centred, axis=-2)
+        )
+    monotonic = np.abs(correlation) > 0.7
+    
+    sign_changes = np.count_nonzero(np.diff(signs, axis=-2), axis=-2)
+    
+    return np.select(
+        [same_sign & flat, same_sign & monotonic, same_sign, sign_changes >= 1],
+        ['Level', 'Slope', 'Level (with variation)', 'Curvature'],
+        default='Mixed'
+    )
+
+
 def interpret_components(loadings: pd.DataFrame) -> Dict[str, str]:
     """
     Interpret PCA components as level, slope, or curvature factors.
@@ -70,71 +574,287 @@ def interpret_components(loadings: pd.DataFrame) -> Dict[str, str]:
     Parameters:
     -----------
     loadings : pd.DataFrame
-        PCA loadings (maturities x components)
+        PCA loadings (maturities x components), indexed by maturity label
     
     Returns:
     --------
     Dict[str, str]
         Mapping of component names to interpretations
     """
-    interpretations = {}
-    
-    for col in loadings.columns:
-        pc_loadings = loadings[col].values
-        
-        # Level: all loadings have same sign and similar magnitude
-        if np.all(np.sign(pc_loadings) == np.sign(pc_loadings[0])):
-            if np.std(pc_loadings) < 0.1:
-                interpretations[col] = "Level"
-            else:
-                # Check if monotonic (slope)
-                maturities_numeric = np.array([1, 3, 6, 12, 24, 36, 60, 84, 120, 240, 360])[:len(pc_loadings)]
-                correlation = np.corrcoef(maturities_numeric, pc_loadings)[0, 1]
-                if abs(correlation) > 0.7:
-                    interpretations[col] = "Slope"
-                else:
-                    interpretations[col] = "Level (with variation)"
-        else:
-            # Curvature: loadings change sign
-            sign_changes = np.sum(np.diff(np.sign(pc_loadings)) != 0)
-            if sign_changes >= 1:
-                interpretations[col] = "Curvature"
-            else:
-                interpretations[col] = "Mixed"
-    
-    return interpretations
+    labels = classify_components(loadings.values, maturity_months(loadings.index))
+    return dict(zip(loadings.columns, labels.tolist()))
+
+
+def _align_to_reference(
+    loadings: pd.DataFrame,
+    reference_loadings: pd.DataFrame
+) -> Tuple[pd.DataFrame, np.ndarray, np.ndarray]:
+    """Reorder and sign-flip loadings to match `reference_loadings` (see `align_components`)."""
+    reference = reference_loadings.reindex(loadings.index).iloc[:, :loadings.shape[1]]
+    if reference.isna().to_numpy().any() or reference.shape != loadings.shape:
+        raise ValueError("Reference loadings must cover the same maturities and components")
+    aligned, order, signs = align_components(loadings.values, reference.values)
+    return pd.DataFrame(aligned, index=loadings.index, columns=loadings.columns), order, signs
 
 
 def compute_pca_results(
-    df: pd.DataFrame,
-    n_components: int = 3
+    df: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+    n_components: int = 3,
+    solver: str = 'sklearn',
+    reference_loadings: Optional[pd.DataFrame] = None,
+    scores_path: Optional[str] = None
 ) -> Dict:
     """
     Complete PCA analysis pipeline.
     
     Parameters:
     -----------
-    df : pd.DataFrame
-        Preprocessed yield data
+    df : pd.DataFrame or Iterable[pd.DataFrame]
+        Preprocessed yield data. An iterable of date-ordered chunks (e.g. the
+        stream returned by `preprocess_yield_data_chunked`) selects the
+        mini-batch mode: the PCA is fitted incrementally with `OnlinePCA`
+        and scores are computed chunk by chunk in a second pass, so the
+        iterable must support being iterated twice.
     n_components : int
         Number of components
+    solver : str
+        PCA solver passed to `apply_pca` ('sklearn' or 'eigh'); ignored in
+        mini-batch mode
+    reference_loadings : pd.DataFrame, optional
+        Loadings from a previous fit (maturities x components). When given,
+        components are reordered and sign-flipped to match it (see
+        `align_components`) so results stay comparable across refits. The
+        returned 'pca_model' is left as fitted.
+    scores_path : str, optional
+        Write the scores to this file (any `storage` format) instead of
+        returning them; 'scores' is then None. In mini-batch mode the scores
+        are streamed to disk chunk by chunk.
     
     Returns:
     --------
     Dict
-        Dictionary containing PCA model, loadings, scores, explained variance, and interpretations
+        Dictionary containing PCA model, loadings, scores, explained variance, and interpretations.
+        In mini-batch mode 'scores' is a generator of score chunks.
     """
-    pca, loadings, scores = apply_pca(df, n_components=n_components)
-    interpretations = interpret_components(loadings)
+    if not isinstance(df, pd.DataFrame):
+        return _compute_pca_results_minibatch(df, n_components, reference_loadings, scores_path)
+    
+    pca, loadings, scores = apply_pca(df, n_components=n_components, solver=solver)
+    explained_variance = pca.explained_variance_ratio_
+    
+    if reference_loadings is not None:
+        loadings, order, signs = _align_to_reference(loadings, reference_loadings)
+        values = scores.to_numpy()
+        scores = pd.DataFrame(values[:, order] * signs.astype(values.dtype), index=scores.index,
+                              columns=scores.columns)
+        explained_variance = explained_variance[order]
+    
+    if scores_path is not None:
+        from .storage import write_frame
+        with span('write_scores'):
+            write_frame(scores, scores_path)
+        scores = None
+    
+    with span('interpret_components'):
+        interpretations = interpret_components(loadings)
     
     results = {
         'pca_model': pca,
         'loadings': loadings,
         'scores': scores,
-        'explained_variance': pca.explained_variance_ratio_,
-        'cumulative_variance': np.cumsum(pca.explained_variance_ratio_),
+        'explained_variance': explained_variance,
+        'cumulative_variance': np.cumsum(explained_variance),
         'interpretations': interpretations
     }
     
     return results
 
+
+def _compute_pca_results_minibatch(
+    chunks: Iterable[pd.DataFrame],
+    n_components: int,
+    reference_loadings: Optional[pd.DataFrame],
+    scores_path: Optional[str]
+) -> Dict:
+    """Mini-batch mode of `compute_pca_results`: one pass to fit, one lazy pass to score."""
+    if iter(chunks) is chunks:
+        raise ValueError(
+            "Mini-batch PCA needs a re-iterable source of chunks (e.g. a list or the stream "
+            "returned by preprocess_yield_data_chunked), not a one-shot iterator"
+        )
+    
+    pca = OnlinePCA(n_components=n_components)
+    with span('pca_partial_fit', n_components=n_components) as info:
+        for chunk in chunks:
+            pca.partial_fit(chunk)
+        info['rows'] = pca.n_samples_
+    if pca.n_samples_ < 2:
+        raise ValueError("Mini-batch PCA needs at least two observations")
+    
+    loadings = pca.loadings
+    explained_variance = pca.explained_variance_ratio_
+    order, signs = np.arange(n_components), np.ones(n_components)
+    if reference_loadings is not None:
+        loadings, order, signs = _align_to_reference(loadings, reference_loadings)
+        explained_variance = explained_variance[order]
+    
+    def iter_scores() -> Iterator[pd.DataFrame]:
+        for chunk in chunks:
+            yield pd.DataFrame(pca.transform(chunk)[:, order] * signs, index=chunk.index,
+                               columns=loadings.columns)
+    
+    scores = iter_scores()
+    if scores_path is not None:
+        from .storage import write_frame_chunks
+        with span('write_scores', chunked=True):
+            write_frame_chunks(scores, scores_path)
+        scores = None
+    
+    return {
+        'pca_model': pca,
+        'loadings': loadings,
+        'scores': scores,
+        'explained_variance': explained_variance,
+        'cumulative_variance': np.cumsum(explained_variance),
+        'interpretations': interpret_components(loadings)
+    }
+
+
+class OnlinePCA:
+    """
+    Incrementally updated PCA for streaming yield curve observations.
+    
+    Keeps a running mean and co-moment matrix (Welford / Chan et al.
+    updates), so each new curve costs O(maturities^2) regardless of the
+    length of the history. Loadings come from an eigendecomposition of the
+    small maturities x maturities covariance and are recomputed lazily
+    after updates. Results match a batch PCA refit on the same history up
+    to the sign of each component; signs follow `flip_signs`.
+    
+    Parameters:
+    -----------
+    n_components : int
+        Number of principal components to keep
+    columns : list, optional
+        Maturity labels; inferred from the first DataFrame or Series seen
+    """
+    
+    def __init__(self, n_components: int = 3, columns: Optional[List[str]] = None):
+        self.n_components = n_components
+        self.columns = list(columns) if columns is not None else None
+        self.n_samples_ = 0
+        self.mean_ = None
+        self._comoment = None
+        self._eigen = None
+    
+    def _as_array(self, X) -> np.ndarray:
+        if isinstance(X, (pd.DataFrame, pd.Series)):
+            labels = X.columns if isinstance(X, pd.DataFrame) else X.index
+            if self.columns is None:
+                self.columns = list(labels)
+            X = X[self.columns] if isinstance(X, pd.DataFrame) else X.reindex(self.columns)
+        return np.atleast_2d(np.asarray(X, dtype=np.float64))
+    
+    def partial_fit(self, X) -> 'OnlinePCA':
+        """
+        Fold a batch of observations into the running statistics.
+        
+        Parameters:
+        -----------
+        X : array-like or pd.DataFrame
+            Observations (dates x maturities); a single curve is also accepted
+        
+        Returns:
+        --------
+        OnlinePCA
+            The updated estimator
+        """
+        X = self._as_array(X)
+        if np.isnan(X).any():
+            raise ValueError("OnlinePCA requires observations without missing values")
+        n_batch = X.shape[0]
+        if n_batch == 0:
+            return self
+        
+        batch_mean = X.mean(axis=0)
+        centred = X - batch_mean
+        batch_comoment = centred.T @ centred
+        
+        if self.n_samples_ == 0:
+            self.mean_ = batch_mean
+            self._comoment = batch_comoment
+        else:
+            n_total = self.n_samples_ + n_batch
+            delta = batch_mean - self.mean_
+            self.mean_ = self.mean_ + delta * (n_batch / n_total)
+            self._comoment += batch_comoment + np.outer(delta, delta) * (self.n_samples_ * n_batch / n_total)
+        
+        self.n_samples_ += n_batch
+        self._eigen = None
+        return self
+    
+    def update(self, x) -> np.ndarray:
+        """
+        Add one curve observation and return its component scores.
+        
+        Parameters:
+        -----------
+        x : array-like or pd.Series
+            Yields for each maturity
+        
+        Returns:
+        --------
+        np.ndarray
+            Scores of `x` under the updated model
+        """
+        self.partial_fit(x)
+        return self.transform(x)[0]
+    
+    @property
+    def covariance_(self) -> np.ndarray:
+        """Sample covariance of all observations seen so far."""
+        if self.n_samples_ < 2:
+            raise ValueError("At least two observations are required")
+        return self._comoment / (self.n_samples_ - 1)
+    
+    def _decompose(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._eigen is None:
+            components, eigenvalues = eigh_components(self.covariance_, self.n_components)
+            self._eigen = (eigenvalues, components.T)
+        return self._eigen
+    
+    @property
+    def components_(self) -> np.ndarray:
+        """Principal axes (components x maturities), as in sklearn's `PCA`."""
+        return self._decompose()[1]
+    
+    @property
+    def explained_variance_ratio_(self) -> np.ndarray:
+        """Fraction of total variance explained by each kept component."""
+        eigenvalues = self._decompose()[0]
+        return eigenvalues[:self.n_components] / eigenvalues.sum()
+    
+    @property
+    def loadings(self) -> pd.DataFrame:
+        """Loadings as a DataFrame in the layout returned by `apply_pca`."""
+        return pd.DataFrame(
+            self.components_.T,
+            index=self.columns,
+            columns=[f'PC{i+1}' for i in range(self.n_components)]
+        )
+    
+    def transform(self, X) -> np.ndarray:
+        """
+        Project observations onto the current components.
+        
+        Parameters:
+        -----------
+        X : array-like or pd.DataFrame
+            Observations (dates x maturities)
+        
+        Returns:
+        --------
+        np.ndarray
+            Component scores (dates x components)
+        """
+        return project(self._as_array(X), self.components_.T, self.mean_)
@@ -1,12 +1,28 @@
 """
 Preprocess and clean yield curve data for PCA analysis.
 
-This module handles data alignment, missing value imputation, and standardization.
+This module handles data alignment, missing value imputation, and standardization,
+either on an in-memory DataFrame or chunk by chunk for panels larger than memory.
 """
 
+import logging
 import pandas as pd
 import numpy as np
-from typing import Tuple
+from typing import Callable, Iterator, Optional, Tuple, Union
+
+from .core import FLOAT_DTYPES, center, resolve_dtype
+from .data_fetch import iter_yield_data
+from .fill import fill_gaps
+from .profiling import span
+
+logger = logging.getLogger(__name__)
+
+# Rows folded into the running statistics at a time, bounding the float64
+# temporaries of `StreamingStandardizer` whatever the batch size
+_FIT_BLOCK_ROWS = 65_536
+
+# Default cap on the rows the chunked pipeline holds back while a gap is open
+_MAX_PENDING_ROWS = 1_000_000
 
 
 def align_maturities(df: pd.DataFrame) -> pd.DataFrame:
@@ -27,45 +43,378 @@ def align_maturities(df: pd.DataFrame) -> pd.DataFrame:
     
     # Reorder columns to match expected order
     available_maturities = [m for m in expected_maturities if m in df.columns]
+    
+    # Avoid a copy (e.g. of a memory-mapped panel) when already aligned
+    if list(df.columns) == available_maturities:
+        return df
     df = df[available_maturities]
     
     return df
 
 
-def handle_missing_data(df: pd.DataFrame, method: str = 'forward_fill') -> pd.DataFrame:
+def handle_missing_data(
+    df: pd.DataFrame,
+    method: str = 'forward_fill',
+    max_gap: Optional[int] = None,
+    return_counts: bool = False
+) -> Union[pd.DataFrame, Tuple[pd.DataFrame, pd.Series]]:
     """
     Handle missing values in yield data.
     
+    Fills run through the fused kernels of `fill_gaps` on a single copy of
+    the panel.
+    
     Parameters:
     -----------
     df : pd.DataFrame
         Yield data with potential missing values
     method : str
         Method for handling missing data:
-        - 'forward_fill': Forward fill missing values
+        - 'forward_fill': Forward fill missing values (leading gaps are
+          back-filled)
         - 'interpolate': Linear interpolation
         - 'drop': Drop rows with any missing values
+    max_gap : int, optional
+        Only fill runs of at most this many consecutive missing values;
+        rows left incomplete by longer gaps are dropped (default: fill every
+        gap)
+    return_counts : bool
+        Also return the number of values filled per maturity
     
     Returns:
     --------
-    pd.DataFrame
-        Cleaned yield data
-    """
-    if method == 'forward_fill':
-        df = df.ffill().bfill()
-    elif method == 'interpolate':
-        df = df.interpolate(method='linear', limit_direction='both')
-        # If still missing at edges, forward/backward fill
-        df = df.ffill().bfill()
-    elif method == 'drop':
-        df = df.dropna()
-    else:
+    pd.DataFrame or Tuple[pd.DataFrame, pd.Series]
+        Cleaned yield data, and the fill counts if `return_counts`
+    """
+    df, _, counts = _fill_missing(df, method, max_gap)
+    return (df, counts) if return_counts else df
+
+
+def _fill_missing(
+    df: pd.DataFrame,
+    method: str,
+    max_gap: Optional[int]
+) -> Tuple[pd.DataFrame, Optional[np.ndarray], pd.Series]:
+    """
+    `handle_missing_data` that also returns the buffer behind its result.
+    
+    Returns:
+    --------
+    Tuple[pd.DataFrame, np.ndarray or None, pd.Series]
+        Cleaned data; the writable C-contiguous array backing it, or None
+        when the input was returned unchanged; and the fill counts
+    """
+    if method not in ('forward_fill', 'interpolate', 'drop'):
         raise ValueError(f"Unknown method: {method}")
     
-    return df
+    counts = pd.Series(0, index=df.columns, dtype=np.int64)
+    
+    # Nothing to fill: return the input rather than copying it
+    missing = df.isna().to_numpy()
+    if not missing.any():
+        return df, None, counts
+    
+    dtype = np.float32 if (df.dtypes == np.float32).all() else np.float64
+    if method == 'drop':
+        keep = ~missing.any(axis=1)
+        values = np.array(df.to_numpy()[keep], dtype=dtype, order='C')
+        return pd.DataFrame(values, index=df.index[keep], columns=df.columns, copy=False), \
+            values, counts
+    
+    values = np.array(df.to_numpy(), dtype=dtype, order='C')
+    counts[:] = fill_gaps(values, method, max_gap=max_gap)
+    index = df.index
+    if max_gap is not None:
+        keep = ~np.isnan(values).any(axis=1)
+        if not keep.all():
+            values, index = values[keep], index[keep]
+    return pd.DataFrame(values, index=index, columns=df.columns, copy=False), values, counts
+
+
+class ChunkedMissingHandler:
+    """
+    Missing-data handling for date-ordered chunks of a larger panel.
+    
+    Fill state is carried across chunk boundaries so the concatenated output
+    equals `handle_missing_data` on the full panel: the last filled row is
+    kept as an anchor for forward fills and interpolation, and rows whose
+    gaps cannot be resolved yet (leading gaps before a maturity's first
+    observation, or an interpolation gap still open at the end of a chunk)
+    are held back until a later chunk or `flush`. Held-back chunks are kept
+    as they arrive and concatenated once, when their gap closes, so every
+    row is copied a bounded number of times.
+    
+    Exact results need every row of an open gap, so a gap spanning years of
+    data (e.g. a maturity that was not published for a while) holds all of
+    them; `max_pending` caps that memory.
+    
+    Parameters:
+    -----------
+    method : str
+        Method for handling missing data ('forward_fill', 'interpolate' or 'drop')
+    max_pending : int, optional
+        Maximum number of rows held back; exceeding it raises ValueError
+        naming the maturities whose gap is still open (default: no limit)
+    """
+    
+    def __init__(self, method: str = 'forward_fill', max_pending: Optional[int] = None):
+        if method not in ('forward_fill', 'interpolate', 'drop'):
+            raise ValueError(f"Unknown method: {method}")
+        self.method = method
+        self.max_pending = max_pending
+        self._anchor = None
+        self._pending = []
+        self._n_pending = 0
+        # Maturities observed so far, until the first row can be filled
+        self._seen = None
+    
+    def _hold(self, part: pd.DataFrame) -> None:
+        """Hold back rows until their gaps close."""
+        self._pending.append(part)
+        self._n_pending += len(part)
+        if self.max_pending is not None and self._n_pending > self.max_pending:
+            open_gaps = [str(c) for c, missing in part.iloc[-1].isna().items() if missing]
+            raise ValueError(
+                f"{self._n_pending} rows held back waiting for missing {', '.join(open_gaps)} "
+                f"values to be observed, more than max_pending={self.max_pending}; raise "
+                f"max_pending or use method='drop'"
+            )
+    
+    def _take(self, chunk: Optional[pd.DataFrame]) -> pd.DataFrame:
+        """Concatenate the anchor, the held-back rows and `chunk`, releasing the held rows."""
+        parts = [part for part in (self._anchor, *self._pending, chunk) if part is not None]
+        self._pending = []
+        self._n_pending = 0
+        return pd.concat(parts) if len(parts) > 1 else parts[0]
+    
+    def process(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fill a chunk and return the rows that are final.
+        
+        Parameters:
+        -----------
+        chunk : pd.DataFrame
+            Next date-ordered block of yield data
+        
+        Returns:
+        --------
+        pd.DataFrame
+            Cleaned rows (possibly including held-back rows of earlier
+            chunks, possibly empty)
+        """
+        if self.method == 'drop':
+            return handle_missing_data(chunk, method='drop')
+        
+        n_anchor = 0 if self._anchor is None else 1
+        if self.method == 'forward_fill':
+            if self._anchor is not None:
+                filled = self._take(chunk).ffill()
+            else:
+                # Leading gaps are back-filled from each maturity's first observation
+                observed = chunk.notna().any().to_numpy()
+                self._seen = observed if self._seen is None else self._seen | observed
+                if not self._seen.all():
+                    self._hold(chunk)
+                    return chunk.iloc[:0]
+                filled = self._take(chunk).ffill().bfill()
+        else:
+            # Interpolation gaps are only closed up to the last fully observed row
+            complete = np.flatnonzero(chunk.notna().all(axis=1).to_numpy())
+            if not len(complete):
+                self._hold(chunk)
+                return chunk.iloc[:0]
+            ready = complete[-1] + 1
+            filled = self._take(chunk.iloc[:ready]).interpolate(method='linear',
+                                                                limit_direction='both')
+            if ready < len(chunk):
+                self._hold(chunk.iloc[ready:])
+        
+        self._anchor = filled.iloc[-1:]
+        return filled.iloc[n_anchor:]
+    
+    def flush(self) -> pd.DataFrame:
+        """
+        Return the held-back rows once the last chunk has been processed.
+        
+        Returns:
+        --------
+        pd.DataFrame
+            Remaining cleaned rows (possibly empty)
+        """
+        if not self._pending:
+            return pd.DataFrame()
+        n_anchor = 0 if self._anchor is None else 1
+        block = self._take(None)
+        if self.method == 'interpolate':
+            block = block.interpolate(method='linear', limit_direction='both')
+        filled = block.ffill().bfill()
+        self._anchor = filled.iloc[-1:]
+        return filled.iloc[n_anchor:]
+
+
+class StreamingStandardizer:
+    """
+    Single-pass standardizer for yield data arriving in chunks.
+    
+    Per-maturity means and sums of squared deviations are merged batch by
+    batch (Welford / Chan et al. updates), so statistics can be refined as
+    new rows arrive and panels larger than memory can be fitted chunk by
+    chunk. Missing values are skipped, matching `DataFrame.mean` and
+    `DataFrame.std` (ddof=1).
+    
+    Parameters:
+    -----------
+    method : str
+        Standardization method:
+        - 'demean': Subtract mean (center only)
+        - 'zscore': Z-score normalization (center and scale)
+    """
+    
+    def __init__(self, method: str = 'demean'):
+        if method not in ('demean', 'zscore'):
+            raise ValueError(f"Unknown method: {method}")
+        self.method = method
+        self.n_samples_seen_ = None
+        self.mean_ = None
+        self._m2 = None
+    
+    def partial_fit(self, X: Union[pd.DataFrame, np.ndarray]) -> 'StreamingStandardizer':
+        """
+        Fold a batch of rows into the running statistics.
+        
+        Large batches are folded in blocks of `_FIT_BLOCK_ROWS` rows, so the
+        temporaries stay small even when a whole (memory-mapped) panel is
+        passed at once.
+        
+        Parameters:
+        -----------
+        X : pd.DataFrame or np.ndarray
+            Yield data (dates x maturities)
+        
+        Returns:
+        --------
+        StreamingStandardizer
+            The updated standardizer
+        """
+        X = np.atleast_2d(X.to_numpy() if isinstance(X, pd.DataFrame) else np.asarray(X))
+        if self.mean_ is None:
+            self.n_samples_seen_ = np.zeros(X.shape[1], dtype=np.int64)
+            self.mean_ = np.zeros(X.shape[1])
+            self._m2 = np.zeros(X.shape[1])
+        for start in range(0, len(X), _FIT_BLOCK_ROWS):
+            self._fold(X[start:start + _FIT_BLOCK_ROWS])
+        return self
+    
+    def _fold(self, X: np.ndarray) -> None:
+        """Merge the statistics of one block of rows."""
+        observed = ~np.isnan(X)
+        n_batch = observed.sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            # Statistics are accumulated in float64 whatever the data dtype,
+            # from a single centred float64 copy of the block
+            if n_batch.min() == len(X):
+                batch_mean = X.mean(axis=0, dtype=np.float64)
+                centred = np.subtract(X, batch_mean, dtype=np.float64)
+            else:
+                batch_mean = np.nansum(X, axis=0, dtype=np.float64) / n_batch
+                centred = np.subtract(X, batch_mean, dtype=np.float64)
+                centred[~observed] = 0.0
+            batch_m2 = np.einsum('ij,ij->j', centred, centred)
+            
+            # Chan et al. merge; columns with no observations in this batch are left as is
+            n_total = self.n_samples_seen_ + n_batch
+            delta = batch_mean - self.mean_
+            seen = n_batch > 0
+            self.mean_ += np.where(seen, delta * n_batch / n_total, 0.0)
+            self._m2 += np.where(seen, batch_m2 + delta ** 2 * self.n_samples_seen_ * n_batch / n_total, 0.0)
+        self.n_samples_seen_ = n_total
+    
+    def fit(self, X: Union[pd.DataFrame, np.ndarray], chunk_size: Optional[int] = None) -> 'StreamingStandardizer':
+        """
+        Reset and fit the statistics, optionally `chunk_size` rows at a time.
+        
+        Parameters:
+        -----------
+        X : pd.DataFrame or np.ndarray
+            Yield data (dates x maturities); may be memory-mapped
+        chunk_size : int, optional
+            Rows folded in per update (default: all rows in one
+            `partial_fit`, which still works in bounded blocks)
+        
+        Returns:
+        --------
+        StreamingStandardizer
+            The fitted standardizer
+        """
+        self.n_samples_seen_ = self.mean_ = self._m2 = None
+        values = X.to_numpy() if isinstance(X, pd.DataFrame) else np.asarray(X)
+        step = chunk_size or max(len(values), 1)
+        for start in range(0, max(len(values), 1), step):
+            self.partial_fit(values[start:start + step])
+        return self
+    
+    @property
+    def var_(self) -> np.ndarray:
+        """Sample variance (ddof=1) of each maturity."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self._m2 / (self.n_samples_seen_ - 1)
+    
+    @property
+    def scale_(self) -> np.ndarray:
+        """Per-maturity divisor: ones for 'demean', standard deviations for 'zscore'."""
+        if self.method == 'demean':
+            return np.ones_like(self.mean_)
+        return np.sqrt(self.var_)
+    
+    def transform(
+        self,
+        X: Union[pd.DataFrame, np.ndarray],
+        copy: bool = True
+    ) -> Union[pd.DataFrame, np.ndarray]:
+        """
+        Standardize data with the fitted statistics.
+        
+        Parameters:
+        -----------
+        X : pd.DataFrame or np.ndarray
+            Yield data (dates x maturities)
+        copy : bool
+            If False, a writable float64 or float32 ndarray is standardized
+            in place. DataFrames (read-only under copy-on-write) and
+            read-only arrays always get a single new output array.
+        
+        Returns:
+        --------
+        pd.DataFrame or np.ndarray
+            Standardized data, of the same type as `X`; float32 input stays
+            float32
+        """
+        if self.mean_ is None:
+            raise ValueError("StreamingStandardizer must be fitted before transform")
+        values = X.to_numpy() if isinstance(X, pd.DataFrame) else np.asarray(X)
+        
+        in_place = not copy and values.flags.writeable and values.dtype in FLOAT_DTYPES
+        values = center(values, self.mean_, self.scale_ if self.method == 'zscore' else None,
+                        out=values if in_place else None)
+        
+        if isinstance(X, pd.DataFrame):
+            return pd.DataFrame(values, index=X.index, columns=X.columns, copy=False)
+        return values
+    
+    def fit_transform(
+        self,
+        X: Union[pd.DataFrame, np.ndarray],
+        copy: bool = True
+    ) -> Union[pd.DataFrame, np.ndarray]:
+        """Fit the statistics on `X` and standardize it."""
+        return self.fit(X).transform(X, copy=copy)
 
 
-def standardize_yields(df: pd.DataFrame, method: str = 'demean') -> Tuple[pd.DataFrame, np.ndarray, np.ndarray]:
+def standardize_yields(
+    df: pd.DataFrame,
+    method: str = 'demean',
+    out: Optional[np.ndarray] = None
+) -> Tuple[pd.DataFrame, np.ndarray, np.ndarray]:
     """
     Standardize yield data for PCA.
     
@@ -77,30 +426,39 @@ def standardize_yields(df: pd.DataFrame, method: str = 'demean') -> Tuple[pd.Dat
         Standardization method:
         - 'demean': Subtract mean (center only)
         - 'zscore': Z-score normalization (center and scale)
+    out : np.ndarray, optional
+        Writable float64 or float32 buffer of df's shape for the result.
+        Pass the array backing `df` (e.g. the buffer filled by
+        `handle_missing_data`) to standardize in place without a second
+        copy of the panel.
     
     Returns:
     --------
     Tuple[pd.DataFrame, np.ndarray, np.ndarray]
         Standardized data, means, and stds (if applicable)
     """
-    if method == 'demean':
-        means = df.mean().values
-        df_standardized = df - means
-        stds = np.ones_like(means)
-    elif method == 'zscore':
-        means = df.mean().values
-        stds = df.std().values
-        df_standardized = (df - means) / stds
+    # One blockwise pass for the statistics; the input (possibly memory-mapped)
+    # is only read, and the result goes to `out` or a single new array
+    standardizer = StreamingStandardizer(method).fit(df)
+    if out is None:
+        df_standardized = standardizer.transform(df)
     else:
-        raise ValueError(f"Unknown method: {method}")
+        if out.shape != df.shape or not out.flags.writeable or out.dtype not in FLOAT_DTYPES:
+            raise ValueError("out must be a writable float64 or float32 array of df's shape")
+        if not np.may_share_memory(out, df.to_numpy()):
+            np.copyto(out, df.to_numpy())
+        values = standardizer.transform(out, copy=False)
+        df_standardized = pd.DataFrame(values, index=df.index, columns=df.columns, copy=False)
     
-    return df_standardized, means, stds
+    return df_standardized, standardizer.mean_, standardizer.scale_
 
 
 def preprocess_yield_data(
     df: pd.DataFrame,
     handle_missing: str = 'forward_fill',
-    standardize: str = 'demean'
+    standardize: str = 'demean',
+    dtype: Optional[Union[str, np.dtype]] = None,
+    max_gap: Optional[int] = None
 ) -> Tuple[pd.DataFrame, np.ndarray, np.ndarray]:
     """
     Complete preprocessing pipeline for yield curve data.
@@ -113,27 +471,133 @@ def preprocess_yield_data(
         Method for handling missing data
     standardize : str
         Standardization method
+    dtype : str or np.dtype, optional
+        Compute dtype ('float64' or 'float32'); default keeps the dtype of
+        `df`. Means and stds are always float64.
+    max_gap : int, optional
+        Longest run of missing values to fill (see `handle_missing_data`)
     
     Returns:
     --------
     Tuple[pd.DataFrame, np.ndarray, np.ndarray]
         Preprocessed data, means, and stds
     """
-    print("Preprocessing yield curve data...")
+    logger.info("Preprocessing yield curve data...")
+    dtype = resolve_dtype(dtype)
     
     # Align maturities
-    df = align_maturities(df)
-    print(f"  Aligned {len(df.columns)} maturities")
+    with span('align_maturities'):
+        df = align_maturities(df)
+        if dtype is not None and (df.dtypes != dtype).any():
+            df = df.astype(dtype)
+    logger.info("  Aligned %d maturities", len(df.columns))
     
     # Handle missing data
     initial_rows = len(df)
-    df = handle_missing_data(df, method=handle_missing)
+    with span('handle_missing_data', method=handle_missing) as attrs:
+        df, buffer, fill_counts = _fill_missing(df, handle_missing, max_gap)
+        attrs['filled'] = int(fill_counts.sum())
     final_rows = len(df)
-    print(f"  Handled missing data: {initial_rows} -> {final_rows} rows")
+    logger.info("  Handled missing data: %d -> %d rows, %d values filled",
+                initial_rows, final_rows, fill_counts.sum())
+    if fill_counts.any():
+        logger.debug("  Filled values per maturity: %s",
+                     ', '.join(f'{m}: {n}' for m, n in fill_counts.items() if n))
     
     # Standardize
-    df_standardized, means, stds = standardize_yields(df, method=standardize)
-    print(f"  Standardized using method: {standardize}")
+    with span('standardize_yields', method=standardize):
+        # Standardize the copy made by the fill in place rather than copying again
+        df_standardized, means, stds = standardize_yields(df, method=standardize, out=buffer)
+    logger.info("  Standardized using method: %s", standardize)
     
     return df_standardized, means, stds
 
+
+class ChunkStream:
+    """
+    Re-iterable stream of DataFrame chunks.
+    
+    Every iteration calls `factory` again (e.g. re-reading a file), so
+    consumers that need several passes, such as mini-batch PCA fitting
+    followed by scoring, can iterate more than once.
+    
+    Parameters:
+    -----------
+    factory : Callable
+        Function returning a fresh iterator of chunks
+    """
+    
+    def __init__(self, factory: Callable[[], Iterator[pd.DataFrame]]):
+        self._factory = factory
+    
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        return iter(self._factory())
+
+
+def preprocess_yield_data_chunked(
+    input_path: str,
+    chunk_size: int = 100_000,
+    handle_missing: str = 'forward_fill',
+    standardize: str = 'demean',
+    dtype: Optional[Union[str, np.dtype]] = None,
+    max_pending: Optional[int] = _MAX_PENDING_ROWS
+) -> Tuple[ChunkStream, np.ndarray, np.ndarray]:
+    """
+    Chunked preprocessing pipeline for stored panels larger than memory.
+    
+    The file is streamed in date-ordered chunks through `align_maturities`
+    and `ChunkedMissingHandler`: once to fit a `StreamingStandardizer`, and
+    again lazily on every iteration of the returned stream to yield
+    standardized chunks, e.g. for `compute_pca_results` or
+    `OnlinePCA.partial_fit`. Only a few chunks are in memory at once, plus
+    the rows of any gap still open (at most `max_pending`).
+    
+    Parameters:
+    -----------
+    input_path : str
+        Path to stored yield data (CSV, Parquet, Arrow IPC or '.npy')
+    chunk_size : int
+        Rows read per chunk
+    handle_missing : str
+        Method for handling missing data
+    standardize : str
+        Standardization method
+    dtype : str or np.dtype, optional
+        Compute dtype of the chunks ('float64' or 'float32'); default keeps
+        the stored dtype
+    max_pending : int, optional
+        Maximum number of rows held back while a gap is open (see
+        `ChunkedMissingHandler`); None removes the limit
+    
+    Returns:
+    --------
+    Tuple[ChunkStream, np.ndarray, np.ndarray]
+        Re-iterable stream of preprocessed chunks, means, and stds
+    """
+    dtype = resolve_dtype(dtype)
+    
+    def clean_chunks() -> Iterator[pd.DataFrame]:
+        handler = ChunkedMissingHandler(handle_missing, max_pending=max_pending)
+        for chunk in iter_yield_data(input_path, chunk_size, dtype=dtype):
+            cleaned = handler.process(align_maturities(chunk))
+            if len(cleaned):
+                yield cleaned
+        tail = handler.flush()
+        if len(tail):
+            yield tail
+    
+    logger.info("Preprocessing yield curve data in chunks of %d rows...", chunk_size)
+    
+    standardizer = StreamingStandardizer(standardize)
+    n_chunks = n_rows = 0
+    for chunk in clean_chunks():
+        standardizer.partial_fit(chunk)
+        n_chunks += 1
+        n_rows += len(chunk)
+    if standardizer.mean_ is None:
+        raise ValueError(f"No rows left after preprocessing {input_path}")
+    logger.info("  Handled missing data (%s): %d rows in %d chunks", handle_missing, n_rows, n_chunks)
+    logger.info("  Standardized using method: %s", standardize)
+    
+    standardized = ChunkStream(lambda: (standardizer.transform(chunk) for chunk in clean_chunks()))
+    return standardized, standardizer.mean_, standardizer.scale_
@@ -0,0 +1,172 @@
+"""
+Lightweight timing and peak-memory instrumentation for pipeline stages.
+
+Library code wraps its stages in `span(...)`; the spans cost next to nothing
+unless a `Profiler` is active (e.g. behind the CLI `--profile` flag), in
+which case each one records its wall time and the peak memory allocated
+above its starting point (via `tracemalloc`). Work done in other processes,
+such as pooled plot rendering, is added afterwards with `record`.
+"""
+
+import contextlib
+import json
+import threading
+import time
+import tracemalloc
+from typing import Dict, Iterator, List, Optional
+
+# Profiler receiving spans, set by Profiler.__enter__
+_active = None
+
+
+class Profiler:
+    """
+    Collect spans while active.
+    
+    Use as a context manager around the code to profile. Spans opened in
+    worker threads are recorded too, but share one `tracemalloc` peak, so
+    their memory figures are approximate while threads overlap.
+    
+    Parameters:
+    -----------
+    memory : bool
+        Trace allocations to report peak memory per span (slower)
+    """
+    
+    def __init__(self, memory: bool = True):
+        self.memory = memory
+        self.spans: List[Dict] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._started = None
+    
+    def __enter__(self) -> 'Profiler':
+        global _active
+        if self.memory:
+            tracemalloc.start()
+        self._started = time.perf_counter()
+        _active = self
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        global _active
+        _active = None
+        if self.memory:
+            tracemalloc.stop()
+    
+    def _stack(self) -> list:
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+    
+    def _fold_peak(self, stack: list) -> None:
+        # tracemalloc keeps one global peak; hand it to every open span before resetting it
+        if not self.memory:
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        for entry in stack:
+            entry['peak'] = max(entry['peak'], peak)
+        tracemalloc.reset_peak()
+    
+    @contextlib.contextmanager
+    def span(self, name: str, **attrs) -> Iterator[Dict]:
+        """Time the enclosed block; see the module-level `span`."""
+        stack = self._stack()
+        self._fold_peak(stack)
+        baseline = tracemalloc.get_traced_memory()[0] if self.memory else 0
+        entry = {'start': time.perf_counter(), 'baseline': baseline, 'peak': baseline}
+        stack.append(entry)
+        try:
+            yield attrs
+        finally:
+            elapsed = time.perf_counter() - entry['start']
+            self._fold_peak(stack)
+            stack.pop()
+            self._add(name, elapsed, len(stack), entry['start'],
+                      (entry['peak'] - entry['baseline']) if self.memory else None, attrs)
+    
+    def record(self, name: str, seconds: float, **attrs) -> None:
+        """Add a span measured elsewhere (e.g. in a worker process)."""
+        self._add(name, seconds, len(self._stack()), time.perf_counter() - seconds, None, attrs)
+    
+    def _add(self, name: str, seconds: float, depth: int, start: float,
+             peak_bytes: Optional[int], attrs: Dict) -> None:
+        with self._lock:
+            self.spans.append({
+                'name': name,
+                'depth': depth,
+                'thread': threading.current_thread().name,
+                'start_s': start - self._started,
+                'seconds': seconds,
+                'peak_mb': None if peak_bytes is None else peak_bytes / 1024 ** 2,
+                **attrs,
+            })
+    
+    def write_jsonl(self, path: str) -> None:
+        """
+        Write one JSON object per span, in start order.
+        
+        Parameters:
+        -----------
+        path : str
+            Output path
+        """
+        with open(path, 'w') as f:
+            for entry in sorted(self.spans, key=lambda e: e['start_s']):
+                f.write(json.dumps(entry, default=str) + '\n')
+    
+    def summary(self) -> str:
+        """
+        Format the spans as an indented table in start order.
+        
+        Returns:
+        --------
+        str
+            Summary table
+        """
+        lines = [f"{'span':<56} {'time':>10} {'peak mem':>10}"]
+        for entry in sorted(self.spans, key=lambda e: e['start_s']):
+            details = [f'{k}={v}' for k, v in entry.items()
+                       if k not in ('name', 'depth', 'thread', 'start_s', 'seconds', 'peak_mb')]
+            label = '  ' * entry['depth'] + entry['name']
+            if details:
+                label += f" [{', '.join(details)}]"
+            memory = '' if entry['peak_mb'] is None else f"{entry['peak_mb']:7.1f} MB"
+            lines.append(f"{label:<56} {entry['seconds'] * 1000:7.1f} ms {memory:>10}")
+        return '\n'.join(lines)
+
+
+def span(name: str, **attrs):
+    """
+    Context manager timing a pipeline stage when a `Profiler` is active.
+    
+    The yielded dictionary holds `attrs`; values added to it inside the block
+    (e.g. row counts) are stored with the span.
+    
+    Parameters:
+    -----------
+    name : str
+        Stage name
+    **attrs
+        Extra fields recorded with the span (e.g. series_id)
+    """
+    if _active is None:
+        return contextlib.nullcontext(attrs)
+    return _active.span(name, **attrs)
+
+
+def record(name: str, seconds: float, **attrs) -> None:
+    """
+    Record an externally measured span when a `Profiler` is active.
+    
+    Parameters:
+    -----------
+    name : str
+        Stage name
+    seconds : float
+        Measured wall time
+    **attrs
+        Extra fields recorded with the span
+    """
+    if _active is not None:
+        _active.record(name, seconds, **attrs)
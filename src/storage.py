@@ -0,0 +1,394 @@
+"""
+Pluggable on-disk storage backends for yield data and PCA outputs.
+
+The backend is selected from the file extension:
+- '.csv': Legacy text format
+- '.parquet' / '.pq': Apache Parquet (columnar, compressed)
+- '.arrow' / '.feather' / '.ipc': Arrow IPC file format (columnar, memory-mappable)
+- '.npy': Raw NumPy matrix opened with `np.memmap`, plus a '.meta.npz' sidecar
+  holding the dates and column labels (zero-copy loads)
+
+Every backend can also be read and written in row chunks (`iter_frame`,
+`write_frame_chunks`) for panels that do not fit in memory. Parquet and Arrow
+backends require the optional `pyarrow` dependency.
+"""
+
+import itertools
+import os
+import shutil
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, Iterable, Iterator, Tuple
+
+
+def _require_pyarrow() -> None:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "Parquet/Arrow storage requires pyarrow. Install it with `pip install pyarrow` "
+            "or use a '.csv' path."
+        ) from e
+
+
+def _write_csv(df: pd.DataFrame, path: str, index: bool, **options) -> None:
+    df.to_csv(path, index=index)
+
+
+def _read_csv(path: str, index: bool, parse_dates: bool = True, **options) -> pd.DataFrame:
+    if index:
+        return pd.read_csv(path, index_col=0, parse_dates=parse_dates)
+    return pd.read_csv(path)
+
+
+def _write_parquet(df: pd.DataFrame, path: str, index: bool, **options) -> None:
+    _require_pyarrow()
+    df.to_parquet(path, engine='pyarrow', index=index)
+
+
+def _read_parquet(path: str, index: bool, **options) -> pd.DataFrame:
+    _require_pyarrow()
+    return pd.read_parquet(path, engine='pyarrow')
+
+
+def _write_arrow(df: pd.DataFrame, path: str, index: bool, **options) -> None:
+    _require_pyarrow()
+    # Feather v2 is the Arrow IPC file format; it only stores a default index
+    if index:
+        df = df.reset_index()
+    else:
+        df = df.reset_index(drop=True)
+    df.to_feather(path)
+
+
+def _read_arrow(path: str, index: bool, **options) -> pd.DataFrame:
+    _require_pyarrow()
+    df = pd.read_feather(path)
+    if index:
+        df = df.set_index(df.columns[0])
+    return df
+
+
+def npy_sidecar_path(path: str) -> str:
+    """Return the path of the index/column sidecar for a '.npy' matrix."""
+    return os.path.splitext(path)[0] + '.meta.npz'
+
+
+def _write_npy_sidecar(path: str, df: pd.DataFrame, index_values=None) -> None:
+    meta = {
+        'columns': np.asarray(df.columns, dtype=str),
+        'index_name': np.asarray(df.index.name or ''),
+    }
+    if index_values is not None:
+        index_values = np.asarray(index_values)
+        # Object arrays would need pickling to load, so other labels are stored as strings
+        if index_values.dtype.kind == 'M':
+            kind = 'datetime'
+        elif index_values.dtype.kind in 'iufb':
+            kind = 'numeric'
+        else:
+            kind = 'str'
+            index_values = index_values.astype(str)
+        meta['index'] = index_values
+        meta['index_kind'] = np.asarray(kind)
+    np.savez(npy_sidecar_path(path), **meta)
+
+
+def _write_npy(df: pd.DataFrame, path: str, index: bool, dtype=None, **options) -> None:
+    values = df.to_numpy(dtype=dtype or np.float64)
+    np.save(path, np.ascontiguousarray(values))
+    _write_npy_sidecar(path, df, df.index.values if index else None)
+
+
+def _read_npy(path: str, index: bool, mmap_mode: str = 'r', **options) -> pd.DataFrame:
+    values = np.load(path, mmap_mode=mmap_mode)
+    with np.load(npy_sidecar_path(path)) as meta:
+        columns = meta['columns'].tolist()
+        row_index = None
+        if index and 'index' in meta:
+            kind = str(meta['index_kind']) if 'index_kind' in meta else None
+            if kind == 'datetime':
+                row_index = pd.DatetimeIndex(meta['index'])
+            elif kind == 'str':
+                row_index = pd.Index(meta['index'].tolist())
+            else:
+                row_index = pd.Index(meta['index'])
+        index_name = str(meta['index_name']) or None
+    # copy=False keeps the frame backed by the memory-mapped buffer
+    df = pd.DataFrame(values, index=row_index, columns=columns, copy=False)
+    df.index.name = index_name
+    return df
+
+
+def _iter_csv(path: str, chunk_size: int, index: bool, parse_dates: bool = True,
+              **options) -> Iterator[pd.DataFrame]:
+    if index:
+        yield from pd.read_csv(path, index_col=0, parse_dates=parse_dates, chunksize=chunk_size)
+    else:
+        yield from pd.read_csv(path, chunksize=chunk_size)
+
+
+def _iter_parquet(path: str, chunk_size: int, index: bool, **options) -> Iterator[pd.DataFrame]:
+    _require_pyarrow()
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+        # Going through a Table applies the stored pandas metadata (index)
+        yield pa.Table.from_batches([batch]).to_pandas()
+
+
+def _iter_arrow(path: str, chunk_size: int, index: bool, **options) -> Iterator[pd.DataFrame]:
+    _require_pyarrow()
+    import pyarrow as pa
+    reader = pa.ipc.open_file(pa.memory_map(path))
+    for i in range(reader.num_record_batches):
+        batch = reader.get_batch(i)
+        for start in range(0, batch.num_rows, chunk_size):
+            df = batch.slice(start, chunk_size).to_pandas()
+            if index:
+                df = df.set_index(df.columns[0])
+            yield df
+
+
+def _iter_npy(path: str, chunk_size: int, index: bool, **options) -> Iterator[pd.DataFrame]:
+    df = _read_npy(path, index, **options)
+    for start in range(0, len(df), chunk_size):
+        yield df.iloc[start:start + chunk_size]
+
+
+def _write_csv_chunks(chunks: Iterator[pd.DataFrame], path: str, index: bool, **options) -> None:
+    with open(path, 'w', newline='') as f:
+        for i, chunk in enumerate(chunks):
+            chunk.to_csv(f, index=index, header=(i == 0))
+
+
+def _write_parquet_chunks(chunks: Iterator[pd.DataFrame], path: str, index: bool, **options) -> None:
+    _require_pyarrow()
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    writer = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=index)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _write_arrow_chunks(chunks: Iterator[pd.DataFrame], path: str, index: bool, **options) -> None:
+    _require_pyarrow()
+    import pyarrow as pa
+    writer = None
+    try:
+        for chunk in chunks:
+            chunk = chunk.reset_index() if index else chunk.reset_index(drop=True)
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pa.ipc.new_file(path, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _write_npy_chunks(chunks: Iterator[pd.DataFrame], path: str, index: bool, dtype=None,
+                      **options) -> None:
+    # The '.npy' header needs the final shape, so rows are spooled to a raw
+    # file first and copied behind the header once the row count is known
+    dtype = np.dtype(dtype or np.float64)
+    raw_path = path + '.raw'
+    n_rows, first, index_parts = 0, None, []
+    try:
+        with open(raw_path, 'wb') as raw:
+            for chunk in chunks:
+                first = chunk if first is None else first
+                raw.write(np.ascontiguousarray(chunk.to_numpy(dtype=dtype)).tobytes())
+                n_rows += len(chunk)
+                if index:
+                    index_parts.append(np.asarray(chunk.index.values))
+        header = {
+            'descr': np.lib.format.dtype_to_descr(dtype),
+            'fortran_order': False,
+            'shape': (n_rows, first.shape[1]),
+        }
+        with open(path, 'wb') as f, open(raw_path, 'rb') as raw:
+            np.lib.format.write_array_header_1_0(f, header)
+            shutil.copyfileobj(raw, f)
+    finally:
+        if os.path.exists(raw_path):
+            os.remove(raw_path)
+    _write_npy_sidecar(path, first, np.concatenate(index_parts) if index else None)
+
+
+BACKENDS: Dict[str, Tuple[Callable, Callable]] = {
+    'csv': (_write_csv, _read_csv),
+    'parquet': (_write_parquet, _read_parquet),
+    'arrow': (_write_arrow, _read_arrow),
+    'npy': (_write_npy, _read_npy),
+}
+
+CHUNK_READERS: Dict[str, Callable] = {
+    'csv': _iter_csv,
+    'parquet': _iter_parquet,
+    'arrow': _iter_arrow,
+    'npy': _iter_npy,
+}
+
+CHUNK_WRITERS: Dict[str, Callable] = {
+    'csv': _write_csv_chunks,
+    'parquet': _write_parquet_chunks,
+    'arrow': _write_arrow_chunks,
+    'npy': _write_npy_chunks,
+}
+
+EXTENSIONS: Dict[str, str] = {
+    '.csv': 'csv',
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.arrow': 'arrow',
+    '.feather': 'arrow',
+    '.ipc': 'arrow',
+    '.npy': 'npy',
+}
+
+
+def backend_for_path(path: str) -> str:
+    """
+    Determine the storage backend name from a file extension.
+    
+    Parameters:
+    -----------
+    path : str
+        File path
+    
+    Returns:
+    --------
+    str
+        Backend name ('csv', 'parquet', 'arrow' or 'npy')
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in EXTENSIONS:
+        raise ValueError(
+            f"Unsupported file extension '{ext}'. Expected one of: {', '.join(sorted(EXTENSIONS))}"
+        )
+    return EXTENSIONS[ext]
+
+
+def write_frame(df: pd.DataFrame, path: str, index: bool = True, **options) -> None:
+    """
+    Write a DataFrame using the backend implied by the file extension.
+    
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Data to write
+    path : str
+        Output path
+    index : bool
+        Whether to store the index (e.g. the Date index of yield data)
+    **options
+        Backend-specific options (e.g. `dtype` for the '.npy' backend)
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    writer, _ = BACKENDS[backend_for_path(path)]
+    writer(df, path, index, **options)
+
+
+def read_frame(path: str, index: bool = True, **options) -> pd.DataFrame:
+    """
+    Read a DataFrame using the backend implied by the file extension.
+    
+    Parameters:
+    -----------
+    path : str
+        Input path
+    index : bool
+        Whether the first stored column is the index
+    **options
+        Backend-specific options (e.g. `mmap_mode` for the '.npy' backend, or
+        `parse_dates=False` for CSV files without a date index)
+    
+    Returns:
+    --------
+    pd.DataFrame
+        Loaded data
+    """
+    _, reader = BACKENDS[backend_for_path(path)]
+    return reader(path, index, **options)
+
+
+def iter_frame(path: str, chunk_size: int, index: bool = True, **options) -> Iterator[pd.DataFrame]:
+    """
+    Read a stored DataFrame in consecutive row chunks.
+    
+    Only one chunk is held in memory at a time. '.npy' chunks are views of
+    the memory-mapped file; Arrow chunks are sliced from the memory-mapped
+    file without reading it, then copied into pandas one chunk at a time.
+    
+    Parameters:
+    -----------
+    path : str
+        Input path
+    chunk_size : int
+        Maximum number of rows per chunk
+    index : bool
+        Whether the first stored column is the index
+    **options
+        Backend-specific options, as for `read_frame`
+    
+    Returns:
+    --------
+    Iterator[pd.DataFrame]
+        Row chunks in stored order
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+    return CHUNK_READERS[backend_for_path(path)](path, chunk_size, index, **options)
+
+
+def write_frame_chunks(chunks: Iterable[pd.DataFrame], path: str, index: bool = True, **options) -> int:
+    """
+    Write DataFrame chunks to one file without holding them all in memory.
+    
+    The result reads back with `read_frame` like a single `write_frame` of
+    the concatenated chunks.
+    
+    Parameters:
+    -----------
+    chunks : Iterable[pd.DataFrame]
+        Row chunks with identical columns
+    path : str
+        Output path
+    index : bool
+        Whether to store the index
+    **options
+        Backend-specific options (e.g. `dtype` for the '.npy' backend)
+    
+    Returns:
+    --------
+    int
+        Number of rows written
+    """
+    chunks = iter(chunks)
+    first = next(chunks, None)
+    if first is None:
+        raise ValueError(f"No chunks to write to {path}")
+    
+    n_rows = 0
+    
+    def counted() -> Iterator[pd.DataFrame]:
+        nonlocal n_rows
+        for chunk in itertools.chain([first], chunks):
+            n_rows += len(chunk)
+            yield chunk
+    
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    CHUNK_WRITERS[backend_for_path(path)](counted(), path, index, **options)
+    return n_rows
@@ -0,0 +1,96 @@
+"""
+Local stand-in for the FRED API, shared by the tests and benchmarks.
+
+`fake_fred_server` serves FRED-style XML observations for the series in
+`FRED_SERIES` from a thread on localhost, so fetching can be exercised and
+timed without network access or an API key.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator, Type
+from urllib.parse import urlparse, parse_qs
+
+import pandas as pd
+
+from .data_fetch import FRED_SERIES
+
+
+class FakeFredHandler(BaseHTTPRequestHandler):
+    """
+    Serve FRED-style XML observations for any known series ID.
+    
+    Every request sleeps `delay` seconds before answering with the
+    observations in `dates` that fall within the requested range; the value
+    of each observation encodes the series position in `FRED_SERIES` and
+    the date position. Unknown series get FRED's 400 XML error and the
+    series ID 'DOWN' a 503 HTML page. Requests (series ID and start date)
+    and client connections are recorded in `requests` and `connections`;
+    subclass to change `delay` or `dates` or to record separately.
+    """
+    
+    # Keep-alive, so clients can reuse connections
+    protocol_version = 'HTTP/1.1'
+    delay = 0.1
+    dates = pd.date_range('2020-01-01', periods=30, freq='D')
+    requests = []
+    connections = set()
+    
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        series_id = query['series_id'][0]
+        start = pd.Timestamp(query.get('observation_start', ['1900-01-01'])[0])
+        end = pd.Timestamp(query.get('observation_end', ['2100-01-01'])[0])
+        self.requests.append((series_id, start))
+        self.connections.add(self.client_address)
+        time.sleep(self.delay)
+        
+        content_type = 'text/xml'
+        if series_id == 'DOWN':
+            content_type = 'text/html'
+            body = b'<html><body>Service Unavailable</body></html>'
+            self.send_response(503)
+        elif series_id not in FRED_SERIES.values():
+            body = b'<error code="400" message="Bad Request. The series does not exist."/>'
+            self.send_response(400)
+        else:
+            offset = list(FRED_SERIES.values()).index(series_id)
+            rows = ''.join(
+                f'<observation date="{d:%Y-%m-%d}" value="{offset + i / 100:.2f}"/>'
+                for i, d in enumerate(self.dates) if start <= d <= end
+            )
+            body = f'<observations>{rows}</observations>'.encode()
+            self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, *args):
+        pass
+
+
+@contextmanager
+def fake_fred_server(handler: Type[FakeFredHandler] = FakeFredHandler) -> Iterator[str]:
+    """
+    Run a stand-in FRED server for the duration of a `with` block.
+    
+    Parameters:
+    -----------
+    handler : Type[FakeFredHandler]
+        Request handler class (e.g. a subclass with another `delay`)
+    
+    Returns:
+    --------
+    Iterator[str]
+        Context manager yielding the base URL to pass as `base_url`
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f'http://127.0.0.1:{server.server_port}/fred'
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -5,13 +5,28 @@ This module creates plots for explained variance, PCA loadings, component scores
 and yield curve heatmaps.
 """
 
+import matplotlib
 import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
 import numpy as np
+import logging
 import os
-from typing import Dict, Optional
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
+from .profiling import record, span
+
+logger = logging.getLogger(__name__)
+
+# File names written by generate_all_plots, in rendering order
+PLOT_FILES = [
+    'explained_variance.png',
+    'pca_loadings.png',
+    'component_scores.png',
+    'yield_curve_heatmap.png',
+]
 
 # Set style
 sns.set_style("whitegrid")
@@ -79,7 +94,7 @@ def plot_explained_variance(
     if output_path:
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        print(f"Saved explained variance plot to {output_path}")
+        logger.debug("Saved explained variance plot to %s", output_path)
     
     plt.close()
 
@@ -133,7 +148,7 @@ def plot_pca_loadings(
     if output_path:
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        print(f"Saved PCA loadings plot to {output_path}")
+        logger.debug("Saved PCA loadings plot to %s", output_path)
     
     plt.close()
 
@@ -181,7 +196,7 @@ def plot_component_scores(
     if output_path:
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        print(f"Saved component scores plot to {output_path}")
+        logger.debug("Saved component scores plot to %s", output_path)
     
     plt.close()
 
@@ -202,7 +217,7 @@ def plot_yield_curve_heatmap(
     """
     # Resample to monthly if daily data
     if len(df) > 500:
-        df_plot = df.resample('M').last()
+        df_plot = df.resample('ME').last()
     else:
         df_plot = df.copy()
     
@@ -221,16 +236,109 @@ def plot_yield_curve_heatmap(
     if output_path:
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        print(f"Saved yield curve heatmap to {output_path}")
+        logger.debug("Saved yield curve heatmap to %s", output_path)
     
     plt.close()
 
 
+# Plotting functions that rendering tasks may name
+_PLOT_FUNCTIONS = {
+    'plot_explained_variance': plot_explained_variance,
+    'plot_pca_loadings': plot_pca_loadings,
+    'plot_component_scores': plot_component_scores,
+    'plot_yield_curve_heatmap': plot_yield_curve_heatmap,
+}
+
+
+def _init_render_worker() -> None:
+    """Select the non-interactive Agg backend in a rendering worker process."""
+    matplotlib.use('Agg', force=True)
+
+
+def _render_plot(task: Tuple[str, tuple]) -> Tuple[str, float]:
+    """
+    Render one figure and time it.
+    
+    Parameters:
+    -----------
+    task : Tuple[str, tuple]
+        Name of a plotting function (a key of `_PLOT_FUNCTIONS`) and its
+        positional arguments; the last argument is the output path
+    
+    Returns:
+    --------
+    Tuple[str, float]
+        Output path and render time in seconds
+    """
+    func_name, args = task
+    started = time.perf_counter()
+    _PLOT_FUNCTIONS[func_name](*args)
+    return args[-1], time.perf_counter() - started
+
+
+def _plot_tasks(pca_results: Dict, df_original: pd.DataFrame, output_dir: str) -> List[Tuple[str, tuple]]:
+    """Build the rendering tasks for one result set, in PLOT_FILES order."""
+    paths = [os.path.join(output_dir, name) for name in PLOT_FILES]
+    return [
+        ('plot_explained_variance', (pca_results['explained_variance'], paths[0])),
+        ('plot_pca_loadings', (pca_results['loadings'], paths[1])),
+        ('plot_component_scores', (pca_results['scores'], paths[2])),
+        ('plot_yield_curve_heatmap', (df_original, paths[3])),
+    ]
+
+
+def render_plots(tasks: List[Tuple[str, tuple]], max_workers: Optional[int] = None) -> Dict[str, float]:
+    """
+    Render figures in a process pool using the Agg backend.
+    
+    With a single worker the figures are drawn in the current process with
+    its own matplotlib backend, which is left unchanged.
+    
+    Every figure is drawn independently from its own inputs, so the saved
+    files do not depend on the number of workers or completion order.
+    
+    Parameters:
+    -----------
+    tasks : List[Tuple[str, tuple]]
+        Plotting function names and arguments (see `_render_plot`)
+    max_workers : int, optional
+        Number of worker processes (default: one per CPU, at most one per
+        figure); 1 renders in the current process
+    
+    Returns:
+    --------
+    Dict[str, float]
+        Render time in seconds for each output path, in task order
+    """
+    unknown = sorted({name for name, _ in tasks} - set(_PLOT_FUNCTIONS))
+    if unknown:
+        raise ValueError(f"Unknown plotting functions: {unknown}")
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(tasks)))
+    
+    with span('render_plots', figures=len(tasks), workers=max_workers):
+        if max_workers == 1:
+            timings = []
+            for task in tasks:
+                with span('render_plot', plot=os.path.basename(task[1][-1])):
+                    timings.append(_render_plot(task))
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_render_worker) as pool:
+                timings = list(pool.map(_render_plot, tasks))
+            # Rendered in worker processes: only their own timings are available
+            for path, elapsed in timings:
+                record('render_plot', elapsed, plot=os.path.basename(path))
+    
+    return dict(timings)
+
+
 def generate_all_plots(
     pca_results: Dict,
     df_original: pd.DataFrame,
-    output_dir: str = 'plots'
-) -> None:
+    output_dir: str = 'plots',
+    max_workers: Optional[int] = None
+) -> List[str]:
     """
     Generate all visualization plots.
     
@@ -242,34 +350,49 @@ def generate_all_plots(
         Original yield data (for heatmap)
     output_dir : str
         Directory to save plots
+    max_workers : int, optional
+        Number of rendering processes (see `render_plots`)
+    
+    Returns:
+    --------
+    List[str]
+        Paths of the saved plots
     """
     os.makedirs(output_dir, exist_ok=True)
     
-    print("\nGenerating visualizations...")
-    
-    # Explained variance
-    plot_explained_variance(
-        pca_results['explained_variance'],
-        output_path=os.path.join(output_dir, 'explained_variance.png')
-    )
-    
-    # PCA loadings
-    plot_pca_loadings(
-        pca_results['loadings'],
-        output_path=os.path.join(output_dir, 'pca_loadings.png')
-    )
-    
-    # Component scores
-    plot_component_scores(
-        pca_results['scores'],
-        output_path=os.path.join(output_dir, 'component_scores.png')
-    )
-    
-    # Yield curve heatmap
-    plot_yield_curve_heatmap(
-        df_original,
-        output_path=os.path.join(output_dir, 'yield_curve_heatmap.png')
-    )
-    
-    print(f"All plots saved to {output_dir}/")
+    logger.info("Generating visualizations...")
+    timings = render_plots(_plot_tasks(pca_results, df_original, output_dir), max_workers=max_workers)
+    for path, elapsed in timings.items():
+        logger.info("  Rendered %s in %.2fs", os.path.basename(path), elapsed)
+    
+    logger.info("All plots saved to %s/", output_dir)
+    return list(timings)
+
 
+def generate_plots_batch(
+    jobs: List[Tuple[Dict, pd.DataFrame, str]],
+    max_workers: Optional[int] = None
+) -> Dict[str, float]:
+    """
+    Generate the full plot set for many result sets in one process pool.
+    
+    Parameters:
+    -----------
+    jobs : List[Tuple[Dict, pd.DataFrame, str]]
+        (pca_results, df_original, output_dir) for each result set, e.g. one
+        per rolling window or curve universe
+    max_workers : int, optional
+        Number of rendering processes (see `render_plots`)
+    
+    Returns:
+    --------
+    Dict[str, float]
+        Render time in seconds for each saved plot
+    """
+    tasks = []
+    for pca_results, df_original, output_dir in jobs:
+        os.makedirs(output_dir, exist_ok=True)
+        tasks.extend(_plot_tasks(pca_results, df_original, output_dir))
+    
+    logger.info("Rendering %d figures for %d result sets...", len(tasks), len(jobs))
+    return render_plots(tasks, max_workers=max_workers)
@@ -0,0 +1,64 @@
+"""
+Unit tests for the pipeline result cache.
+"""
+
+import os
+import time
+
+import pytest
+from src.cache import ResultCache, cache_key
+
+
+def _write(path, size):
+    with open(path, 'wb') as f:
+        f.write(b'x' * size)
+    return str(path)
+
+
+def test_cache_key_is_deterministic():
+    """Test that keys depend only on the stage inputs."""
+    assert cache_key('pca', 'abc', 3) == cache_key('pca', 'abc', 3)
+    assert cache_key('pca', 'abc', 3) != cache_key('pca', 'abc', 4)
+    assert cache_key('pca', {'a': 1, 'b': 2}) == cache_key('pca', {'b': 2, 'a': 1})
+
+
+def test_store_and_restore(tmp_path):
+    """Test that stored stage outputs are restored into another directory."""
+    cache = ResultCache(str(tmp_path / 'cache'))
+    source = tmp_path / 'out'
+    source.mkdir()
+    paths = [_write(source / 'pca_scores.csv', 10), _write(source / 'pca_loadings.csv', 5)]
+    
+    assert cache.restore('missing', str(tmp_path / 'dest')) is None
+    
+    cache.store('key', paths)
+    restored = cache.restore('key', str(tmp_path / 'dest'))
+    
+    assert sorted(os.path.basename(p) for p in restored) == ['pca_loadings.csv', 'pca_scores.csv']
+    assert os.path.getsize(tmp_path / 'dest' / 'pca_scores.csv') == 10
+
+
+def test_evict_by_size_keeps_recently_used(tmp_path):
+    """Test that least recently used entries are evicted beyond the size limit."""
+    cache = ResultCache(str(tmp_path / 'cache'), max_bytes=250)
+    for i, key in enumerate(['a', 'b', 'c']):
+        cache.store(key, [_write(tmp_path / f'{key}.bin', 100)])
+        os.utime(os.path.join(cache.cache_dir, key), (1000 + i, 1000 + i))
+    
+    # Only two 100-byte entries fit; 'a' is the least recently used
+    assert cache.get('a') is None
+    assert cache.get('b') is not None
+    assert cache.get('c') is not None
+
+
+def test_evict_by_age(tmp_path):
+    """Test that entries unused for longer than max_age are evicted."""
+    cache = ResultCache(str(tmp_path / 'cache'), max_age=60)
+    cache.store('old', [_write(tmp_path / 'old.bin', 1)])
+    stale = time.time() - 3600
+    os.utime(os.path.join(cache.cache_dir, 'old'), (stale, stale))
+    
+    cache.store('new', [_write(tmp_path / 'new.bin', 1)])
+    
+    assert cache.get('old') is None
+    assert cache.get('new') is not None
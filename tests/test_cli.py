@@ -0,0 +1,83 @@
+"""
+Unit tests for the command-line interface.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ['matplotlib', 'seaborn', 'sklearn', 'fredapi', 'pandas']
+
+
+def _run_python(code):
+    return subprocess.run([sys.executable, '-c', code], cwd=ROOT,
+                          capture_output=True, text=True, check=True)
+
+
+def test_cli_import_is_lightweight():
+    """Test that importing the CLI does not pull in heavy dependencies."""
+    result = _run_python(
+        "import sys, src.cli; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    assert result.stdout.strip() == ''
+
+
+def test_cli_help():
+    """Test that --help runs without importing pipeline dependencies."""
+    result = _run_python(
+        "import sys, runpy; sys.argv = ['src.cli', '--help']\n"
+        "try:\n"
+        "    runpy.run_module('src.cli', run_name='__main__')\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"print('loaded=' + ','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    assert '--n-components' in result.stdout
+    assert result.stdout.strip().splitlines()[-1] == 'loaded='
+
+
+def test_library_is_silent_by_default():
+    """Test that pipeline functions write nothing unless logging is configured."""
+    result = _run_python(
+        "import numpy as np, pandas as pd\n"
+        "from src.preprocessing import preprocess_yield_data\n"
+        "from src.pca_analysis import compute_pca_results\n"
+        "rng = np.random.default_rng(0)\n"
+        "df = pd.DataFrame(rng.normal(size=(50, 4)).cumsum(axis=0), "
+        "columns=['1Y', '2Y', '5Y', '10Y'], index=pd.date_range('2020-01-01', periods=50))\n"
+        "compute_pca_results(preprocess_yield_data(df)[0], n_components=2)"
+    )
+    assert result.stdout == ''
+    assert result.stderr == ''
+
+
+def test_cli_quiet_summary_json(tmp_path):
+    """Test that --quiet with --summary-json - leaves only the JSON summary on stdout."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(120, 4)).cumsum(axis=0) + 3.0,
+                      columns=['1Y', '2Y', '5Y', '10Y'],
+                      index=pd.date_range('2020-01-01', periods=120, name='Date'))
+    data_path = tmp_path / 'yields.csv'
+    df.to_csv(data_path)
+    
+    result = subprocess.run(
+        [sys.executable, '-m', 'src.cli', '--data-file', str(data_path),
+         '--output-dir', str(tmp_path / 'out'), '--chunk-size', '50',
+         '--n-components', '2', '--quiet', '--summary-json', '-'],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    
+    summary = json.loads(result.stdout)
+    assert result.stderr == ''
+    assert summary['mode'] == 'chunked'
+    assert summary['n_obs'] == 120
+    assert [c['component'] for c in summary['components']] == ['PC1', 'PC2']
+    assert summary['options']['chunk_size'] == 50
+    assert 'api_key' not in summary['options']
+    assert all(os.path.exists(path) for path in summary['outputs']['results'])
@@ -0,0 +1,80 @@
+"""
+Unit tests for the ndarray core kernels.
+"""
+
+import pytest
+import numpy as np
+from src import core
+from src.core import center, covariance, eigh_components, flip_signs, project
+
+
+@pytest.fixture
+def sample_values():
+    """Create a correlated panel (dates x maturities) as a plain array."""
+    rng = np.random.default_rng(3)
+    level = rng.normal(size=(300, 1)).cumsum(axis=0)
+    return level + rng.normal(scale=0.3, size=(300, 6)) + np.linspace(1, 4, 6)
+
+
+def test_center_in_place(sample_values):
+    """Test that centring into the input buffer matches the pandas-style result."""
+    mean, scale = sample_values.mean(axis=0), sample_values.std(axis=0, ddof=1)
+    expected = (sample_values - mean) / scale
+    
+    values = sample_values.copy()
+    result = center(values, mean, scale, out=values)
+    
+    assert result is values
+    np.testing.assert_allclose(values, expected)
+
+
+def test_covariance_matches_numpy(sample_values):
+    """Test the mean-corrected Gram covariance against np.cov, written into a buffer."""
+    out = np.empty((6, 6))
+    result = covariance(sample_values, sample_values.mean(axis=0), out=out)
+    
+    assert result is out
+    np.testing.assert_allclose(out, np.cov(sample_values, rowvar=False), atol=1e-10)
+
+
+def test_eigh_components_stacked(sample_values):
+    """Test that a stack of covariances decomposes like each matrix on its own."""
+    covariances = np.stack([np.cov(sample_values[start:start + 100], rowvar=False)
+                            for start in (0, 100, 200)])
+    loadings, eigenvalues = eigh_components(covariances, 2)
+    
+    assert loadings.shape == (3, 6, 2)
+    assert eigenvalues.shape == (3, 6)
+    assert np.all(np.diff(eigenvalues, axis=1) <= 0)
+    for i, cov in enumerate(covariances):
+        single_loadings, single_eigenvalues = eigh_components(cov, 2)
+        np.testing.assert_allclose(loadings[i], single_loadings, atol=1e-10)
+        np.testing.assert_allclose(eigenvalues[i], single_eigenvalues, atol=1e-10)
+    np.testing.assert_array_equal(flip_signs(loadings), loadings)
+
+
+def test_project_reuses_buffer(sample_values):
+    """Test that projecting into a preallocated buffer equals centring first."""
+    mean = sample_values.mean(axis=0)
+    loadings, _ = eigh_components(covariance(sample_values, mean), 3)
+    out = np.empty((len(sample_values), 3))
+    
+    for start in (0, 150):
+        block = sample_values[start:start + 150]
+        result = project(block, loadings, mean, out=out[:150])
+        assert np.shares_memory(result, out)
+        np.testing.assert_allclose(result, (block - mean) @ loadings, atol=1e-10)
+
+
+def test_covariance_float32_accumulates_in_float64(sample_values, monkeypatch):
+    """Test that a float32 panel gives the float64 covariance of its values, block by block."""
+    monkeypatch.setattr(core, '_GRAM_BLOCK_ROWS', 64)
+    values = sample_values.astype(np.float32)
+    mean = values.mean(axis=0, dtype=np.float64)
+    
+    result = covariance(values, mean)
+    
+    assert result.dtype == np.float64
+    np.testing.assert_allclose(result, np.cov(values.astype(np.float64), rowvar=False),
+                               rtol=1e-10, atol=1e-12)
+    assert project(values, eigh_components(result, 2)[0], mean).dtype == np.float32
@@ -0,0 +1,134 @@
+"""
+Unit tests for data fetching module.
+"""
+
+import time
+
+import pytest
+import pandas as pd
+import numpy as np
+from src.data_fetch import (
+    FRED_SERIES,
+    FredSession,
+    YieldStore,
+    fetch_yield_data,
+    fetch_yield_data_incremental
+)
+from src.testing import FakeFredHandler, fake_fred_server
+
+
+@pytest.fixture
+def fred_server():
+    """Start a local stand-in FRED server and yield its base URL."""
+    FakeFredHandler.requests = []
+    FakeFredHandler.connections = set()
+    with fake_fred_server() as base_url:
+        yield base_url
+
+
+def test_fetch_yield_data_concurrent(fred_server):
+    """Test that all series are fetched in parallel and merged in order."""
+    started = time.perf_counter()
+    df = fetch_yield_data('test-key', '2020-01-01', '2020-01-30', base_url=fred_server)
+    elapsed = time.perf_counter() - started
+
+    assert list(df.columns) == list(FRED_SERIES.keys())
+    assert df.index.name == 'Date'
+    assert len(df) == 30
+    assert np.isclose(df['10Y'].iloc[0], list(FRED_SERIES).index('10Y'))
+
+    # Serial fetching would take at least 11 * delay
+    assert elapsed < len(FRED_SERIES) * FakeFredHandler.delay
+    assert set(df.attrs['fetch_latency']) == set(FRED_SERIES)
+
+
+def test_fetch_yield_data_respects_worker_limit(fred_server):
+    """Test that a single worker still returns the full frame."""
+    df = fetch_yield_data('test-key', '2020-01-01', '2020-01-30',
+                          max_workers=1, base_url=fred_server)
+    assert df.shape == (30, len(FRED_SERIES))
+
+
+def test_fetch_yield_data_reuses_connections(fred_server):
+    """Test that worker threads reuse pooled keep-alive connections."""
+    fetch_yield_data('test-key', '2020-01-01', '2020-01-30', max_workers=2, base_url=fred_server)
+
+    assert len(FakeFredHandler.requests) == len(FRED_SERIES)
+    assert len(FakeFredHandler.connections) <= 2
+
+
+def test_fred_session_errors(fred_server):
+    """Test that FRED errors, server failures and stalls are raised, not parsed."""
+    import requests
+    fred = FredSession('test-key', fred_server, timeout=5)
+    try:
+        data = fred.get_series('DGS10', '2020-01-02', '2020-01-04')
+        assert list(data.index) == list(pd.date_range('2020-01-02', '2020-01-04'))
+        with pytest.raises(ValueError, match='series does not exist'):
+            fred.get_series('NOPE')
+        with pytest.raises(requests.HTTPError):
+            fred.get_series('DOWN')
+        fred.timeout = FakeFredHandler.delay / 10
+        with pytest.raises(requests.Timeout):
+            fred.get_series('DGS10')
+    finally:
+        fred.close()
+
+
+def test_fetch_yield_data_requires_key():
+    """Test that a missing API key is rejected."""
+    with pytest.raises(ValueError):
+        fetch_yield_data(None)
+
+
+def test_incremental_fetch_requests_only_tail(fred_server, tmp_path):
+    """Test that a second refresh only requests observations after the stored tail."""
+    store_dir = str(tmp_path / 'store')
+    df_first = fetch_yield_data_incremental('test-key', store_dir, '2020-01-01', '2020-01-20',
+                                            base_url=fred_server)
+    assert len(df_first) == 20
+
+    FakeFredHandler.requests = []
+    df = fetch_yield_data_incremental('test-key', store_dir, '2020-01-01', '2020-01-30',
+                                      base_url=fred_server)
+
+    assert len(df) == 30
+    assert list(df.columns) == list(FRED_SERIES.keys())
+    assert len(FakeFredHandler.requests) == len(FRED_SERIES)
+    assert all(start == pd.Timestamp('2020-01-21') for _, start in FakeFredHandler.requests)
+    pd.testing.assert_frame_equal(
+        df, fetch_yield_data('test-key', '2020-01-01', '2020-01-30', base_url=fred_server),
+        check_freq=False
+    )
+
+
+def test_incremental_fetch_skips_up_to_date_store(fred_server, tmp_path):
+    """Test that an up-to-date store makes no requests."""
+    store_dir = str(tmp_path / 'store')
+    fetch_yield_data_incremental('test-key', store_dir, '2020-01-01', '2020-01-30',
+                                 base_url=fred_server)
+
+    FakeFredHandler.requests = []
+    df = fetch_yield_data_incremental('test-key', store_dir, '2020-01-10', '2020-01-30',
+                                      base_url=fred_server)
+
+    assert FakeFredHandler.requests == []
+    assert df.index.min() == pd.Timestamp('2020-01-10')
+
+
+def test_yield_store_append_deduplicates(tmp_path):
+    """Test that appending overlapping observations keeps the newest values."""
+    store = YieldStore(str(tmp_path))
+    dates = pd.date_range('2020-01-01', periods=5, freq='D')
+    store.append('DGS10', pd.Series(np.arange(5.0), index=dates), replace=True,
+                 start_date='2020-01-01')
+    store.append('DGS10', pd.Series([10.0, 11.0], index=dates[-1:].append(
+        pd.DatetimeIndex(['2020-01-06']))))
+
+    reopened = YieldStore(str(tmp_path))
+    series = reopened.read('DGS10')
+    assert len(series) == 6
+    assert series.iloc[-2] == 10.0
+    assert reopened.last_observation('DGS10') == pd.Timestamp('2020-01-06')
+    assert reopened.covers('DGS10', '2020-01-01')
+    assert not reopened.covers('DGS10', '2019-12-01')
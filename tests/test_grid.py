@@ -0,0 +1,85 @@
+"""
+Unit tests for the configuration grid runner.
+"""
+
+import json
+
+import pytest
+import pandas as pd
+import numpy as np
+from src.grid import GRID_DEFAULTS, expand_grid, load_grid_spec, run_grid
+from src.preprocessing import preprocess_yield_data
+from src.pca_analysis import compute_pca_results
+
+
+@pytest.fixture
+def sample_data():
+    """Create sample yield data with a few gaps."""
+    dates = pd.date_range('2020-01-01', periods=200, freq='D')
+    np.random.seed(11)
+    level = np.cumsum(np.random.randn(200) * 0.05) + 2.0
+    df = pd.DataFrame({
+        maturity: level + 0.2 * i + np.random.randn(200) * 0.02
+        for i, maturity in enumerate(['1M', '1Y', '5Y', '10Y', '30Y'])
+    }, index=dates)
+    df.iloc[5:8, 1] = np.nan
+    return df
+
+
+def test_expand_grid():
+    """Test that the grid is the cartesian product with defaults filled in."""
+    configs = expand_grid({
+        'n_components': [2, 3],
+        'standardize': ['demean', 'zscore'],
+        'date_range': ['2020-01-01', '2020-03-31'],
+    })
+    
+    assert len(configs) == 4
+    assert {c['n_components'] for c in configs} == {2, 3}
+    assert all(c['date_range'] == ['2020-01-01', '2020-03-31'] for c in configs)
+    assert all(c['handle_missing'] == GRID_DEFAULTS['handle_missing'] for c in configs)
+    assert all(c['solver'] == 'sklearn' and c['max_gap'] is None for c in configs)
+    
+    # Options given on the command line replace the defaults, not the spec
+    configs = expand_grid({'n_components': [2]}, defaults={'n_components': 4, 'dtype': 'float32'})
+    assert [(c['n_components'], c['dtype']) for c in configs] == [(2, 'float32')]
+
+
+def test_load_grid_spec_rejects_unknown_options(tmp_path):
+    """Test that misspelt options are reported instead of ignored."""
+    path = tmp_path / 'grid.json'
+    path.write_text(json.dumps({'n_component': [2]}))
+    
+    with pytest.raises(ValueError, match='n_component'):
+        load_grid_spec(str(path))
+
+
+def test_run_grid_matches_direct_fit(sample_data):
+    """Test that pooled grid rows match fitting each configuration directly."""
+    configs = expand_grid({
+        'n_components': [2, 3],
+        'handle_missing': ['forward_fill', 'interpolate'],
+        'max_gap': [None, 2],
+        'date_range': [[None, '2020-04-30'], ['2020-05-01', None]],
+    })
+    table = run_grid(sample_data, configs, max_workers=2)
+    
+    assert len(table) == len(configs)
+    assert list(table.columns) == [
+        'n_components', 'handle_missing', 'max_gap', 'standardize', 'solver', 'dtype',
+        'start', 'end', 'n_obs',
+        *[f'PC{i}_{m}' for i in (1, 2, 3) for m in ('variance', 'cumulative', 'interpretation')],
+        'elapsed_s'
+    ]
+    for config, (_, row) in zip(configs, table.iterrows()):
+        start, end = config['date_range']
+        df_processed, _, _ = preprocess_yield_data(
+            sample_data.loc[start:end], handle_missing=config['handle_missing'],
+            max_gap=config['max_gap']
+        )
+        expected = compute_pca_results(
+            df_processed, n_components=config['n_components'], solver=config['solver']
+        )
+        assert row['n_obs'] == len(df_processed)
+        for i, var in enumerate(expected['explained_variance']):
+            assert row[f'PC{i+1}_variance'] == pytest.approx(var)
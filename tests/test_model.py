@@ -0,0 +1,97 @@
+"""
+Unit tests for the persisted PCA model artefact.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from src.preprocessing import preprocess_yield_data
+from src.pca_analysis import compute_pca_results
+from src.model import YieldCurveModel, data_fingerprint, load_model
+
+
+@pytest.fixture
+def sample_yield_data():
+    """Create sample yield data driven by a common level factor."""
+    dates = pd.date_range('2020-01-01', periods=150, freq='D')
+    np.random.seed(7)
+    level = np.cumsum(np.random.randn(150) * 0.05) + 2.0
+    data = {
+        maturity: level + 0.1 * i + np.random.randn(150) * 0.02
+        for i, maturity in enumerate(['1M', '1Y', '2Y', '5Y', '10Y', '30Y'])
+    }
+    return pd.DataFrame(data, index=dates)
+
+
+@pytest.mark.parametrize('standardize', ['demean', 'zscore'])
+def test_project_reproduces_fitted_scores(sample_yield_data, standardize):
+    """Test that projecting the training data reproduces the fitted scores."""
+    df_processed, means, stds = preprocess_yield_data(sample_yield_data, standardize=standardize)
+    results = compute_pca_results(df_processed, n_components=3)
+    model = YieldCurveModel.from_results(results, means, stds, sample_yield_data,
+                                         standardize=standardize)
+    
+    scores = model.project(sample_yield_data)
+    
+    assert list(scores.columns) == ['PC1', 'PC2', 'PC3']
+    assert np.allclose(scores.values, results['scores'].values)
+
+
+def test_model_save_load_round_trip(sample_yield_data, tmp_path):
+    """Test that a saved model loads with identical parameters and projections."""
+    df_processed, means, stds = preprocess_yield_data(sample_yield_data)
+    results = compute_pca_results(df_processed, n_components=2)
+    model = YieldCurveModel.from_results(results, means, stds, sample_yield_data)
+    path = str(tmp_path / 'pca_model.npz')
+    
+    model.save(path)
+    loaded = load_model(path)
+    
+    assert loaded.maturities == model.maturities
+    assert loaded.fingerprint == data_fingerprint(sample_yield_data)
+    assert loaded.interpretations == results['interpretations']
+    assert np.allclose(loaded.loadings, model.loadings)
+    
+    new_curves = sample_yield_data.iloc[-5:][loaded.maturities[::-1]] + 0.25
+    assert np.allclose(loaded.project(new_curves), model.project(new_curves))
+    
+    loaded_results = loaded.results(sample_yield_data)
+    assert np.allclose(loaded_results['scores'].values, results['scores'].values)
+
+
+def test_model_records_fit_options(sample_yield_data, tmp_path):
+    """Test that every fit option survives a save/load round trip."""
+    df_processed, means, stds = preprocess_yield_data(sample_yield_data, max_gap=3)
+    reference = compute_pca_results(df_processed, n_components=2)['loadings']
+    results = compute_pca_results(df_processed, n_components=2, solver='eigh',
+                                  reference_loadings=reference)
+    model = YieldCurveModel.from_results(results, means, stds, sample_yield_data, max_gap=3,
+                                         solver='eigh', reference_loadings=reference)
+    path = str(tmp_path / 'pca_model.npz')
+    model.save(path)
+    
+    assert load_model(path).fit_options == {
+        'handle_missing': 'forward_fill',
+        'standardize': 'demean',
+        'max_gap': 3,
+        'solver': 'eigh',
+        'reference': data_fingerprint(reference),
+    }
+
+
+def test_project_missing_maturity(sample_yield_data):
+    """Test that data without a model maturity is rejected."""
+    df_processed, means, stds = preprocess_yield_data(sample_yield_data)
+    model = YieldCurveModel.from_results(compute_pca_results(df_processed), means, stds,
+                                         sample_yield_data)
+    with pytest.raises(ValueError):
+        model.project(sample_yield_data.drop(columns=['10Y']))
+
+
+def test_data_fingerprint_changes_with_data(sample_yield_data):
+    """Test that the fingerprint is stable and content-sensitive."""
+    modified = sample_yield_data.copy()
+    modified.iloc[3, 2] += 0.01
+    
+    assert data_fingerprint(sample_yield_data) == data_fingerprint(sample_yield_data.copy())
+    assert data_fingerprint(modified) != data_fingerprint(sample_yield_data)
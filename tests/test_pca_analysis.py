@@ -9,7 +9,14 @@ from sklearn.decomposition import PCA
 from src.pca_analysis import (
     apply_pca,
     interpret_components,
-    compute_pca_results
+    compute_pca_results,
+    rolling_pca,
+    OnlinePCA,
+    CovariancePCA,
+    align_components,
+    classify_components,
+    maturity_months,
+    bootstrap_pca
 )
 
 
@@ -126,3 +133,240 @@ def test_pca_dimensional_integrity(sample_processed_data):
     reconstruction_error = np.mean((sample_processed_data.values - reconstructed.values) ** 2)
     assert reconstruction_error < 1.0  # Should be small for standardized data
 
+
+
+def test_rolling_pca_shapes(sample_processed_data):
+    """Test the shape of the rolling loadings cube."""
+    results = rolling_pca(sample_processed_data, window=50, step=10, n_components=3)
+    
+    n_windows = len(range(50, len(sample_processed_data) + 1, 10))
+    assert results['loadings'].shape == (n_windows, len(sample_processed_data.columns), 3)
+    assert results['explained_variance'].shape == (n_windows, 3)
+    assert results['window_end'][0] == sample_processed_data.index[49]
+    assert results['window_end'][-1] == sample_processed_data.index[-1]
+    assert results['components'] == ['PC1', 'PC2', 'PC3']
+
+
+def test_rolling_pca_matches_apply_pca(sample_processed_data):
+    """Test that each window matches a separate sklearn fit up to sign."""
+    results = rolling_pca(sample_processed_data, window=60, step=20, n_components=3)
+    
+    for w, end in enumerate(range(60, len(sample_processed_data) + 1, 20)):
+        pca, loadings, scores = apply_pca(sample_processed_data.iloc[end - 60:end], n_components=3)
+        signs = np.sign(np.sum(loadings.values * results['loadings'][w], axis=0))
+        assert np.allclose(loadings.values * signs, results['loadings'][w], atol=1e-8)
+        assert np.allclose(pca.explained_variance_ratio_, results['explained_variance'][w])
+
+
+def test_rolling_pca_invalid_window(sample_processed_data):
+    """Test that invalid window sizes are rejected."""
+    with pytest.raises(ValueError):
+        rolling_pca(sample_processed_data, window=len(sample_processed_data) + 1)
+    with pytest.raises(ValueError):
+        rolling_pca(sample_processed_data, window=50, step=0)
+
+
+def test_online_pca_matches_batch(sample_processed_data):
+    """Test that tick-by-tick updates match a batch refit on the same history."""
+    online = OnlinePCA(n_components=3).partial_fit(sample_processed_data.iloc[:20])
+    for _, row in sample_processed_data.iloc[20:].iterrows():
+        last_scores = online.update(row)
+    
+    pca, loadings, scores = apply_pca(sample_processed_data, n_components=3)
+    signs = np.sign(np.sum(loadings.values * online.components_.T, axis=0))
+    
+    assert online.n_samples_ == len(sample_processed_data)
+    assert list(online.loadings.index) == list(sample_processed_data.columns)
+    assert np.allclose(online.loadings.values, loadings.values * signs, atol=1e-8)
+    assert np.allclose(online.explained_variance_ratio_, pca.explained_variance_ratio_)
+    assert np.allclose(last_scores, scores.values[-1] * signs, atol=1e-8)
+
+
+def test_online_pca_rejects_missing_values(sample_processed_data):
+    """Test that observations with NaN are rejected."""
+    online = OnlinePCA(n_components=3)
+    row = sample_processed_data.iloc[0].copy()
+    row.iloc[0] = np.nan
+    with pytest.raises(ValueError):
+        online.update(row)
+
+
+def test_apply_pca_eigh_matches_sklearn(sample_processed_data):
+    """Test that the covariance-eigh solver reproduces the sklearn results."""
+    pca, loadings, scores = apply_pca(sample_processed_data, n_components=3)
+    pca_eigh, loadings_eigh, scores_eigh = apply_pca(sample_processed_data, n_components=3,
+                                                     solver='eigh')
+    
+    assert isinstance(pca_eigh, CovariancePCA)
+    assert loadings_eigh.shape == loadings.shape
+    assert list(scores_eigh.columns) == list(scores.columns)
+    assert np.allclose(pca_eigh.explained_variance_ratio_, pca.explained_variance_ratio_)
+    
+    signs = np.sign(np.sum(loadings.values * loadings_eigh.values, axis=0))
+    assert np.allclose(loadings_eigh.values, loadings.values * signs, atol=1e-8)
+    assert np.allclose(scores_eigh.values, scores.values * signs, atol=1e-8)
+    
+    # Largest-magnitude loading of each component is positive
+    idx = np.argmax(np.abs(loadings_eigh.values), axis=0)
+    assert np.all(loadings_eigh.values[idx, np.arange(3)] > 0)
+
+
+def test_apply_pca_float32_error_bound(sample_processed_data):
+    """Test that float32 data with the eigh solver stays close to the float64 fit."""
+    pca, loadings, scores = apply_pca(sample_processed_data, n_components=3, solver='eigh')
+    pca_32, loadings_32, scores_32 = apply_pca(sample_processed_data.astype(np.float32),
+                                               n_components=3, solver='eigh')
+    
+    assert set(scores_32.dtypes) == {np.dtype(np.float32)}
+    assert np.abs(loadings_32.values - loadings.values).max() < 1e-5
+    assert np.abs(pca_32.explained_variance_ratio_ - pca.explained_variance_ratio_).max() < 1e-6
+    scale = np.abs(scores.values).max()
+    assert np.abs(scores_32.values - scores.values).max() < 1e-5 * scale
+
+
+def test_apply_pca_unknown_solver(sample_processed_data):
+    """Test that an unknown solver is rejected."""
+    with pytest.raises(ValueError):
+        apply_pca(sample_processed_data, solver='qr')
+
+
+def test_align_components_recovers_order_and_sign(sample_processed_data):
+    """Test that permuted and sign-flipped loadings are mapped back to the reference."""
+    pca, loadings, scores = apply_pca(sample_processed_data, n_components=3)
+    reference = loadings.values
+    shuffled = np.stack([
+        reference[:, [2, 0, 1]] * [1, -1, 1],
+        reference * [-1, -1, -1],
+        reference,
+    ])
+    
+    aligned, order, signs = align_components(shuffled, reference)
+    
+    assert aligned.shape == shuffled.shape
+    assert np.allclose(aligned, reference)
+    assert order[0].tolist() == [1, 2, 0]
+    assert signs[1].tolist() == [-1, -1, -1]
+
+
+def test_compute_pca_results_reference_alignment(sample_processed_data):
+    """Test that results are aligned to reference loadings from a previous fit."""
+    baseline = compute_pca_results(sample_processed_data, n_components=3)
+    reference = baseline['loadings'][['PC2', 'PC1', 'PC3']] * [-1, 1, -1]
+    reference.columns = ['PC1', 'PC2', 'PC3']
+    
+    results = compute_pca_results(sample_processed_data, n_components=3,
+                                  reference_loadings=reference)
+    
+    assert np.allclose(results['loadings'].values, reference.values)
+    assert np.allclose(results['scores']['PC1'], -baseline['scores']['PC2'])
+    assert np.allclose(results['explained_variance'],
+                       baseline['explained_variance'][[1, 0, 2]])
+
+
+def test_rolling_pca_reference_alignment(sample_processed_data):
+    """Test that every rolling window is sign-aligned to the reference."""
+    pca, loadings, scores = apply_pca(sample_processed_data, n_components=3)
+    reference = -loadings
+    results = rolling_pca(sample_processed_data, window=100, step=25, n_components=3,
+                          reference=reference)
+    
+    similarity = np.einsum('mi,wmi->wi', reference.values, results['loadings'])
+    assert np.all(similarity > 0)
+
+
+def test_compute_pca_results_minibatch_matches_in_memory(sample_processed_data):
+    """Test that mini-batch fitting over chunks matches the in-memory fit."""
+    chunks = [sample_processed_data.iloc[start:start + 32] for start in range(0, 200, 32)]
+    expected = compute_pca_results(sample_processed_data, n_components=3)
+    
+    results = compute_pca_results(chunks, n_components=3)
+    scores = pd.concat(results['scores'])
+    
+    assert np.allclose(results['loadings'].values, expected['loadings'].values, atol=1e-8)
+    assert np.allclose(results['explained_variance'], expected['explained_variance'])
+    assert results['interpretations'] == expected['interpretations']
+    pd.testing.assert_frame_equal(scores, expected['scores'], check_freq=False, atol=1e-8)
+
+
+def test_compute_pca_results_minibatch_scores_to_disk(sample_processed_data, tmp_path):
+    """Test that mini-batch scores are streamed to a file instead of returned."""
+    from src.storage import read_frame
+    chunks = [sample_processed_data.iloc[start:start + 50] for start in range(0, 200, 50)]
+    path = str(tmp_path / 'pca_scores.npy')
+    
+    results = compute_pca_results(chunks, n_components=3, scores_path=path)
+    
+    assert results['scores'] is None
+    expected = compute_pca_results(sample_processed_data, n_components=3)['scores']
+    assert np.allclose(read_frame(path).values, expected.values, atol=1e-8)
+    
+    with pytest.raises(ValueError, match='re-iterable'):
+        compute_pca_results(iter(chunks), n_components=3)
+
+
+def test_maturity_months():
+    """Test that maturity labels are converted to months."""
+    assert np.allclose(maturity_months(['1M', '6M', '1Y', '10Y', '30Y']), [1, 6, 12, 120, 360])
+    assert np.allclose(maturity_months(['DGS1MO', 'DGS2', 'DGS30']), [1, 24, 360])
+    # Unparseable labels fall back to the standard tenors in column order
+    assert np.allclose(maturity_months(['short', 'DGS2', 'long']), [1, 3, 6])
+
+
+def test_interpret_components_non_tenor_labels(sample_processed_data):
+    """Test that arbitrary column names are interpreted by column order, as before."""
+    renamed = sample_processed_data.set_axis([f'series_{i}' for i in range(7)], axis=1)
+    pca, loadings, scores = apply_pca(sample_processed_data, n_components=3)
+    
+    results = compute_pca_results(renamed, n_components=3)
+    expected = classify_components(loadings.values, [1, 3, 6, 12, 24, 36, 60])
+    
+    assert list(results['interpretations'].values()) == expected.tolist()
+    assert rolling_pca(renamed, window=60, step=20)['interpretations'].shape[1] == 3
+
+
+def test_classify_components_matches_per_window(sample_processed_data):
+    """Test that stacked classification matches interpreting each window."""
+    results = rolling_pca(sample_processed_data, window=60, step=20, n_components=3)
+    
+    assert results['interpretations'].shape == results['explained_variance'].shape
+    for loadings, labels in zip(results['loadings'], results['interpretations']):
+        frame = pd.DataFrame(loadings, index=results['maturities'], columns=results['components'])
+        assert list(labels) == list(interpret_components(frame).values())
+
+
+def test_classify_components_uses_true_maturities():
+    """Test that slopes are judged against actual maturities, not positions."""
+    maturities = maturity_months(['1M', '2M', '3M', '30Y'])
+    loadings = np.column_stack([
+        0.2 + maturities / 400,     # linear in maturity
+        [0.2, 0.4, 0.6, 0.65],      # rises with position, flat at the long end
+    ])
+    
+    assert classify_components(loadings, maturities).tolist() == ['Slope', 'Level (with variation)']
+
+
+def test_bootstrap_pca_bands(sample_processed_data):
+    """Test that bootstrap bands bracket the full-sample estimates."""
+    results = bootstrap_pca(sample_processed_data, n_boot=200, block_size=10, max_workers=1)
+    
+    assert results['replicate_loadings'].shape == (200, 7, 3)
+    assert np.all(results['explained_variance_lower'] <= results['explained_variance'])
+    assert np.all(results['explained_variance'] <= results['explained_variance_upper'])
+    assert np.all(results['loadings_lower']['PC1'] <= results['loadings']['PC1'] + 1e-12)
+    assert np.all(results['loadings']['PC1'] <= results['loadings_upper']['PC1'] + 1e-12)
+    
+    # Replicates are sign-aligned with the full-sample loadings
+    similarity = np.einsum('mk,bmk->bk', results['loadings'].values, results['replicate_loadings'])
+    assert np.all(similarity[:, 0] > 0)
+
+
+def test_bootstrap_pca_reproducible_across_workers(sample_processed_data):
+    """Test that seeded replicates do not depend on the number of workers."""
+    serial = bootstrap_pca(sample_processed_data, n_boot=60, batch_size=20, max_workers=1)
+    pooled = bootstrap_pca(sample_processed_data, n_boot=60, batch_size=20, max_workers=2)
+    
+    assert np.allclose(serial['replicate_loadings'], pooled['replicate_loadings'])
+    assert np.allclose(serial['explained_variance_lower'], pooled['explained_variance_lower'])
+    
+    with pytest.raises(ValueError):
+        bootstrap_pca(sample_processed_data, block_size=150)
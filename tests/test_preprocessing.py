@@ -2,15 +2,24 @@
 Unit tests for preprocessing module.
 """
 
+import tracemalloc
+
 import pytest
 import pandas as pd
 import numpy as np
+from src import preprocessing
 from src.preprocessing import (
     align_maturities,
     handle_missing_data,
     standardize_yields,
-    preprocess_yield_data
+    preprocess_yield_data,
+    preprocess_yield_data_chunked,
+    ChunkedMissingHandler,
+    StreamingStandardizer
 )
+from src.data_fetch import save_yield_data
+from src.fill import _fill_numpy, _fill_rows
+from src.pca_analysis import OnlinePCA, compute_pca_results
 
 
 @pytest.fixture
@@ -116,3 +125,191 @@ def test_preprocess_yield_data(sample_yield_data):
     # Check standardized (mean should be close to zero)
     assert np.allclose(df_processed.mean().values, 0, atol=1e-10)
 
+
+def test_streaming_standardizer_chunked_fit(sample_yield_data):
+    """Test that chunked fitting with gaps matches pandas statistics."""
+    df = sample_yield_data.copy()
+    df.iloc[10:15, 0] = np.nan
+    df.iloc[40, 3] = np.nan
+    
+    scaler = StreamingStandardizer('zscore').fit(df, chunk_size=7)
+    
+    assert np.allclose(scaler.mean_, df.mean().values)
+    assert np.allclose(scaler.scale_, df.std().values)
+    
+    # Appending rows updates the statistics like a refit on the full history
+    refit = StreamingStandardizer('zscore').fit(df)
+    scaler = StreamingStandardizer('zscore').fit(df.iloc[:60]).partial_fit(df.iloc[60:])
+    assert np.allclose(scaler.mean_, refit.mean_)
+    assert np.allclose(scaler.var_, refit.var_)
+
+
+def test_streaming_standardizer_transform_in_place(sample_yield_data):
+    """Test that copy=False standardizes a writable array without allocating."""
+    values = sample_yield_data.to_numpy(copy=True)
+    expected = (sample_yield_data - sample_yield_data.mean()) / sample_yield_data.std()
+    
+    scaler = StreamingStandardizer('zscore').fit(values)
+    result = scaler.transform(values, copy=False)
+    
+    assert result is values
+    assert np.allclose(result, expected.values)
+
+
+def test_standardization_peak_memory(monkeypatch):
+    """Test that fitting works in bounded blocks and the filled panel is standardized in place."""
+    monkeypatch.setattr(preprocessing, '_FIT_BLOCK_ROWS', 1024)
+    rng = np.random.default_rng(5)
+    values = rng.normal(size=(100_000, 11)).astype(np.float32)
+    
+    def peak(func):
+        tracemalloc.start()
+        try:
+            func()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    
+    assert peak(lambda: StreamingStandardizer('zscore').fit(values)) < 0.1 * values.nbytes
+    
+    df = pd.DataFrame(values.astype(np.float64), columns=['1M', '3M', '6M', '1Y', '2Y', '3Y',
+                                                          '5Y', '7Y', '10Y', '20Y', '30Y'])
+    df.iloc[5:9, 2] = np.nan
+    panel_bytes = df.to_numpy().nbytes
+    # The filled copy of the panel is standardized in place: no second copy
+    assert peak(lambda: preprocess_yield_data(df, standardize='zscore')) < 1.5 * panel_bytes
+    
+    df_processed, _, _ = preprocess_yield_data(df, standardize='zscore')
+    filled = handle_missing_data(df)
+    expected = (filled - filled.mean()) / filled.std()
+    np.testing.assert_allclose(df_processed.values, expected.values, atol=1e-10)
+
+
+def test_preprocess_yield_data_float32(sample_yield_data):
+    """Test that the float32 policy keeps the data in float32 and the statistics in float64."""
+    df_32, means_32, stds_32 = preprocess_yield_data(sample_yield_data, standardize='zscore',
+                                                     dtype='float32')
+    df_64, means_64, stds_64 = preprocess_yield_data(sample_yield_data, standardize='zscore')
+    
+    assert set(df_32.dtypes) == {np.dtype(np.float32)}
+    assert means_32.dtype == np.float64 and stds_32.dtype == np.float64
+    np.testing.assert_allclose(df_32.to_numpy(), df_64.to_numpy(), atol=1e-5)
+    np.testing.assert_allclose(means_32, means_64, rtol=1e-6)
+    
+    with pytest.raises(ValueError, match="Unsupported dtype"):
+        preprocess_yield_data(sample_yield_data, dtype='int32')
+
+
+@pytest.fixture
+def gappy_yield_data(sample_yield_data):
+    """Sample yield data with leading, interior and trailing gaps."""
+    df = sample_yield_data.copy()
+    df.iloc[:4, 0] = np.nan
+    df.iloc[20:33, 2] = np.nan
+    df.iloc[50, :] = np.nan
+    df.iloc[95:, 5] = np.nan
+    return df
+
+
+@pytest.mark.parametrize('method', ['forward_fill', 'interpolate'])
+def test_handle_missing_data_matches_pandas(gappy_yield_data, method):
+    """Test that the fill kernels reproduce the pandas fill chains and count the fills."""
+    if method == 'forward_fill':
+        expected = gappy_yield_data.ffill().bfill()
+    else:
+        expected = gappy_yield_data.interpolate(method='linear', limit_direction='both').ffill().bfill()
+    
+    df_filled, counts = handle_missing_data(gappy_yield_data, method=method, return_counts=True)
+    
+    pd.testing.assert_frame_equal(df_filled, expected)
+    pd.testing.assert_series_equal(counts, gappy_yield_data.isna().sum(), check_names=False)
+
+
+@pytest.mark.parametrize('interpolate', [False, True])
+@pytest.mark.parametrize('max_gap', [-1, 0, 1, 4, 13])
+def test_fill_kernel_matches_numpy_fallback(gappy_yield_data, interpolate, max_gap):
+    """Test that the row-major kernel (compiled with numba when present) matches the NumPy fallback."""
+    values = np.ascontiguousarray(gappy_yield_data.to_numpy(copy=True))
+    fallback = values.copy()
+    counts = np.zeros(values.shape[1], dtype=np.int64)
+    fallback_counts = counts.copy()
+    
+    _fill_rows(values, interpolate, max_gap, counts)
+    _fill_numpy(fallback, interpolate, max_gap, fallback_counts)
+    
+    np.testing.assert_array_equal(values, fallback)
+    np.testing.assert_array_equal(counts, fallback_counts)
+
+
+def test_handle_missing_data_max_gap(gappy_yield_data):
+    """Test that gaps longer than max_gap stay unfilled and their rows are dropped."""
+    df_filled, counts = handle_missing_data(gappy_yield_data, max_gap=5, return_counts=True)
+    
+    # The 13-row gap in the third maturity is too long; the others are filled
+    assert len(df_filled) == len(gappy_yield_data) - 13
+    assert not df_filled.index.isin(gappy_yield_data.index[20:33]).any()
+    assert not df_filled.isna().to_numpy().any()
+    assert counts.tolist() == [5, 1, 1, 1, 1, 6, 1]
+
+
+@pytest.mark.parametrize('method', ['forward_fill', 'interpolate', 'drop'])
+@pytest.mark.parametrize('chunk_size', [1, 7, 40])
+def test_chunked_missing_handler_matches_full(gappy_yield_data, method, chunk_size):
+    """Test that chunk-by-chunk filling equals filling the whole panel."""
+    handler = ChunkedMissingHandler(method)
+    parts = [
+        handler.process(gappy_yield_data.iloc[start:start + chunk_size])
+        for start in range(0, len(gappy_yield_data), chunk_size)
+    ]
+    parts.append(handler.flush())
+    result = pd.concat([part for part in parts if len(part)])
+    
+    pd.testing.assert_frame_equal(result, handle_missing_data(gappy_yield_data, method=method))
+
+
+@pytest.mark.parametrize('method', ['forward_fill', 'interpolate'])
+def test_chunked_missing_handler_long_gap(method):
+    """Test a gap far longer than the chunk size, and the cap on held-back rows."""
+    rng = np.random.default_rng(8)
+    df = pd.DataFrame(rng.normal(size=(3000, 3)).cumsum(axis=0), columns=['1Y', '10Y', '30Y'],
+                      index=pd.date_range('2000-01-01', periods=3000, freq='D'))
+    # A maturity that is not published for years, as DGS30 in 2002-2006
+    df.iloc[:200, 0] = np.nan
+    df.iloc[500:2600, 2] = np.nan
+    chunks = [df.iloc[start:start + 25] for start in range(0, len(df), 25)]
+    
+    handler = ChunkedMissingHandler(method)
+    parts = [handler.process(chunk) for chunk in chunks] + [handler.flush()]
+    result = pd.concat([part for part in parts if len(part)])
+    pd.testing.assert_frame_equal(result, handle_missing_data(df, method=method))
+    
+    # Forward fills only hold back the leading gap; interpolation also the interior one
+    maturity, limit = ('1Y', 100) if method == 'forward_fill' else ('30Y', 1000)
+    handler = ChunkedMissingHandler(method, max_pending=limit)
+    with pytest.raises(ValueError, match=f'{maturity}.*max_pending={limit}'):
+        for chunk in chunks:
+            handler.process(chunk)
+
+
+def test_preprocess_yield_data_chunked_feeds_online_pca(gappy_yield_data, tmp_path):
+    """Test that the chunked pipeline reproduces the in-memory pipeline and PCA."""
+    path = str(tmp_path / 'yield_data.npy')
+    save_yield_data(gappy_yield_data, path)
+    
+    chunks, means, stds = preprocess_yield_data_chunked(
+        path, chunk_size=16, handle_missing='interpolate', standardize='zscore'
+    )
+    pca = OnlinePCA(n_components=3)
+    for chunk in chunks:
+        pca.partial_fit(chunk)
+    
+    df_processed, expected_means, expected_stds = preprocess_yield_data(
+        gappy_yield_data, handle_missing='interpolate', standardize='zscore'
+    )
+    expected = compute_pca_results(df_processed, n_components=3, solver='eigh')
+    
+    assert np.allclose(means, expected_means)
+    assert np.allclose(stds, expected_stds)
+    assert pca.n_samples_ == len(df_processed)
+    assert np.allclose(pca.explained_variance_ratio_, expected['explained_variance'])
+    assert np.allclose(pca.loadings.values, expected['loadings'].values, atol=1e-8)
@@ -0,0 +1,44 @@
+"""
+Unit tests for the profiling spans.
+"""
+
+import json
+
+import numpy as np
+from src.profiling import Profiler, record, span
+
+
+def test_span_is_noop_without_profiler():
+    """Test that spans run their block and record nothing when inactive."""
+    with span('stage', rows=3) as info:
+        info['extra'] = True
+    
+    assert info == {'rows': 3, 'extra': True}
+
+
+def test_profiler_records_nested_spans(tmp_path):
+    """Test timing, nesting, peak memory and JSON lines output."""
+    with Profiler() as profiler:
+        with span('outer', size=2):
+            with span('inner') as info:
+                buffer = np.ones(2_000_000)
+                info['bytes'] = buffer.nbytes
+                del buffer
+        record('worker', 0.25, plot='a.png')
+    
+    spans = {entry['name']: entry for entry in profiler.spans}
+    assert spans['inner']['depth'] == 1 and spans['outer']['depth'] == 0
+    assert spans['outer']['size'] == 2
+    assert spans['inner']['bytes'] == 16_000_000
+    # The inner allocation counts towards both peaks
+    assert spans['inner']['peak_mb'] >= 15
+    assert spans['outer']['peak_mb'] >= spans['inner']['peak_mb']
+    assert spans['outer']['seconds'] >= spans['inner']['seconds']
+    assert spans['worker']['seconds'] == 0.25 and spans['worker']['peak_mb'] is None
+    assert 'inner [bytes=16000000]' in profiler.summary()
+    
+    path = tmp_path / 'profile.jsonl'
+    profiler.write_jsonl(str(path))
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert sorted(line['name'] for line in lines) == ['inner', 'outer', 'worker']
+    assert lines == sorted(lines, key=lambda line: line['start_s'])
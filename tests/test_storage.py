@@ -0,0 +1,136 @@
+"""
+Unit tests for storage backends.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from src.data_fetch import iter_yield_data, save_yield_data, load_yield_data
+from src.preprocessing import align_maturities, handle_missing_data, preprocess_yield_data
+from src.storage import (
+    backend_for_path, npy_sidecar_path, read_frame, write_frame, write_frame_chunks
+)
+
+
+@pytest.fixture
+def sample_yield_data():
+    """Create sample yield data for testing."""
+    dates = pd.date_range('2020-01-01', periods=50, freq='D', name='Date')
+    np.random.seed(0)
+    data = np.random.uniform(0.5, 3.5, size=(50, 4))
+    data[5, 2] = np.nan
+    return pd.DataFrame(data, index=dates, columns=['1M', '1Y', '10Y', '30Y'])
+
+
+def test_backend_for_path():
+    """Test that backends are selected from the file extension."""
+    assert backend_for_path('data/yield_data.csv') == 'csv'
+    assert backend_for_path('data/yield_data.parquet') == 'parquet'
+    assert backend_for_path('data/yield_data.ARROW') == 'arrow'
+    assert backend_for_path('data/yield_data.feather') == 'arrow'
+
+    with pytest.raises(ValueError):
+        backend_for_path('data/yield_data.xlsx')
+
+
+@pytest.mark.parametrize('ext', ['csv', 'parquet', 'arrow', 'npy'])
+def test_yield_data_round_trip(sample_yield_data, tmp_path, ext):
+    """Test that yield data survives a save/load round trip in every format."""
+    if ext != 'csv':
+        pytest.importorskip('pyarrow')
+    path = str(tmp_path / f'yield_data.{ext}')
+
+    save_yield_data(sample_yield_data, path)
+    df = load_yield_data(path)
+
+    assert isinstance(df.index, pd.DatetimeIndex)
+    assert df.index.name == 'Date'
+    pd.testing.assert_frame_equal(df, sample_yield_data, check_freq=False)
+
+
+@pytest.mark.parametrize('ext', ['csv', 'parquet', 'arrow', 'npy'])
+def test_iter_yield_data_chunks(sample_yield_data, tmp_path, ext):
+    """Test that chunked reads cover the stored panel in order."""
+    if ext != 'csv':
+        pytest.importorskip('pyarrow')
+    path = str(tmp_path / f'yield_data.{ext}')
+    save_yield_data(sample_yield_data, path)
+
+    chunks = list(iter_yield_data(path, chunk_size=12))
+
+    assert [len(chunk) for chunk in chunks] == [12, 12, 12, 12, 2]
+    pd.testing.assert_frame_equal(pd.concat(chunks), sample_yield_data, check_freq=False)
+
+
+@pytest.mark.parametrize('ext', ['csv', 'parquet', 'arrow', 'npy'])
+def test_write_frame_chunks_round_trip(sample_yield_data, tmp_path, ext):
+    """Test that chunked writes read back as one frame."""
+    if ext != 'csv':
+        pytest.importorskip('pyarrow')
+    path = str(tmp_path / f'yield_data.{ext}')
+    chunks = (sample_yield_data.iloc[start:start + 20] for start in range(0, 50, 20))
+
+    assert write_frame_chunks(chunks, path) == 50
+    pd.testing.assert_frame_equal(read_frame(path), sample_yield_data, check_freq=False)
+
+
+@pytest.mark.parametrize('ext', ['csv', 'parquet', 'arrow'])
+def test_write_frame_without_index(tmp_path, ext):
+    """Test that index-free tables round trip unchanged."""
+    if ext != 'csv':
+        pytest.importorskip('pyarrow')
+    df = pd.DataFrame({'Component': ['PC1', 'PC2'], 'Explained_Variance': [0.9, 0.08]})
+    path = str(tmp_path / f'summary.{ext}')
+
+    write_frame(df, path, index=False)
+
+    pd.testing.assert_frame_equal(read_frame(path, index=False), df)
+
+
+def test_npy_string_index_round_trip(tmp_path):
+    """Test that a string index (e.g. maturity labels of loadings) loads without pickling."""
+    loadings = pd.DataFrame(np.random.default_rng(0).normal(size=(4, 2)),
+                            index=pd.Index(['1M', '1Y', '10Y', '30Y'], name='Maturity'),
+                            columns=['PC1', 'PC2'])
+    path = str(tmp_path / 'pca_loadings.npy')
+
+    write_frame(loadings, path)
+    pd.testing.assert_frame_equal(read_frame(path), loadings, check_index_type=False)
+
+    write_frame_chunks(iter([loadings.iloc[:2], loadings.iloc[2:]]), path)
+    pd.testing.assert_frame_equal(read_frame(path), loadings, check_index_type=False)
+
+
+def test_npy_backend_is_memory_mapped(sample_yield_data, tmp_path):
+    """Test that '.npy' loads are backed by the mapped file without a copy."""
+    path = str(tmp_path / 'yield_data.npy')
+    save_yield_data(sample_yield_data, path, dtype=np.float32)
+
+    # Requesting the stored dtype must not cast (and so copy) the panel
+    for dtype in (None, 'float32'):
+        df = load_yield_data(path, dtype=dtype)
+
+        values = df.to_numpy()
+        assert values.dtype == np.float32
+        while not isinstance(values, np.memmap) and values.base is not None:
+            values = values.base
+        assert isinstance(values, np.memmap)
+    assert list(df.columns) == list(sample_yield_data.columns)
+    assert (tmp_path / 'yield_data.meta.npz').exists()
+    assert npy_sidecar_path(path) == str(tmp_path / 'yield_data.meta.npz')
+
+
+def test_preprocess_memory_mapped_panel(sample_yield_data, tmp_path):
+    """Test that preprocessing reads the mapped buffer without copying it first."""
+    path = str(tmp_path / 'yield_data.npy')
+    save_yield_data(sample_yield_data.fillna(1.0), path)
+    df = load_yield_data(path)
+    buffer = df.to_numpy()
+
+    df_aligned = handle_missing_data(align_maturities(df))
+    assert np.shares_memory(df_aligned.to_numpy(), buffer)
+
+    df_processed, means, stds = preprocess_yield_data(df)
+    assert not np.shares_memory(df_processed.to_numpy(), buffer)
+    assert np.allclose(df_processed.mean().values, 0, atol=1e-10)
+    assert not buffer.flags.writeable
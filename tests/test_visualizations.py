@@ -0,0 +1,61 @@
+"""
+Unit tests for visualization module.
+"""
+
+import os
+
+import pytest
+import pandas as pd
+import numpy as np
+from src.pca_analysis import compute_pca_results
+from src.visualizations import PLOT_FILES, generate_all_plots, generate_plots_batch, render_plots
+
+
+@pytest.fixture
+def sample_results():
+    """Create sample yield data and PCA results for plotting."""
+    dates = pd.date_range('2020-01-01', periods=120, freq='D')
+    np.random.seed(3)
+    level = np.cumsum(np.random.randn(120) * 0.05) + 2.0
+    df = pd.DataFrame({
+        maturity: level + 0.2 * i + np.random.randn(120) * 0.02
+        for i, maturity in enumerate(['1M', '1Y', '5Y', '10Y', '30Y'])
+    }, index=dates)
+    return compute_pca_results(df - df.mean(), n_components=3), df
+
+
+def test_parallel_rendering_matches_serial(sample_results, tmp_path):
+    """Test that pooled batch rendering matches serial rendering byte for byte."""
+    pca_results, df = sample_results
+    serial_dir = str(tmp_path / 'serial')
+    paths = generate_all_plots(pca_results, df, output_dir=serial_dir, max_workers=1)
+    
+    assert [os.path.basename(p) for p in paths] == PLOT_FILES
+    
+    parallel_dir = str(tmp_path / 'parallel')
+    timings = generate_plots_batch([(pca_results, df, parallel_dir)], max_workers=2)
+    
+    assert list(timings) == [os.path.join(parallel_dir, name) for name in PLOT_FILES]
+    assert all(t >= 0 for t in timings.values())
+    for name in PLOT_FILES:
+        with open(os.path.join(serial_dir, name), 'rb') as f:
+            expected = f.read()
+        with open(os.path.join(parallel_dir, name), 'rb') as f:
+            assert f.read() == expected
+
+
+def test_serial_rendering_keeps_caller_backend(sample_results, tmp_path):
+    """Test that in-process rendering leaves the caller's backend alone."""
+    import matplotlib
+    pca_results, df = sample_results
+    previous = matplotlib.get_backend()
+    matplotlib.use('svg', force=True)
+    try:
+        render_plots([('plot_pca_loadings', (pca_results['loadings'], str(tmp_path / 'a.png')))],
+                     max_workers=1)
+        assert matplotlib.get_backend() == 'svg'
+    finally:
+        matplotlib.use(previous, force=True)
+    
+    with pytest.raises(ValueError, match="Unknown plotting functions"):
+        render_plots([('savefig', (str(tmp_path / 'b.png'),))], max_workers=1)